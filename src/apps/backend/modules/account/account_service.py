@@ -1,7 +1,10 @@
+from typing import Optional, Tuple
+
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
     Account,
+    AccountProfile,
     AccountSearchByIdParams,
     AccountSearchParams,
     CreateAccountByPhoneNumberParams,
@@ -11,8 +14,13 @@ from modules.account.types import (
     ResetPasswordParams,
     UpdateAccountProfileParams,
 )
+from modules.account.workers.account_deletion_cascade_worker import AccountDeletionCascadeWorker
+from modules.account.workers.account_identity_backfill_worker import AccountIdentityBackfillWorker
+from modules.application.application_service import ApplicationService
+from modules.application.errors import AppError
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreateOTPParams
+from modules.logger.logger import Logger
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import (
     CreateOrUpdateAccountNotificationPreferencesParams,
@@ -74,6 +82,14 @@ class AccountService:
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
         return AccountReader.get_account_by_id(params=params)
 
+    @staticmethod
+    def get_account_profile_by_id(
+        *, params: AccountSearchByIdParams, include_notification_preferences: bool = False
+    ) -> Tuple[AccountProfile, Optional[AccountNotificationPreferences]]:
+        return AccountReader.get_account_profile_by_id(
+            params=params, include_notification_preferences=include_notification_preferences
+        )
+
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
         return AccountReader.get_account_by_username(username=username)
@@ -100,4 +116,29 @@ class AccountService:
 
     @staticmethod
     def delete_account(*, account_id: str) -> AccountDeletionResult:
-        return AccountWriter.delete_account(account_id=account_id)
+        deletion_result = AccountWriter.delete_account(account_id=account_id)
+
+        # Dependent documents are deactivated in the background, so the request does not wait on them. The worker id
+        # is derived from the account id, so the request starts a cascade only once per account. The account stays
+        # marked cascade_pending until the cascade is done, so AccountDeletionCascadeSweepWorker restarts a cascade
+        # that could not be started here.
+        try:
+            ApplicationService.run_worker_immediately(
+                cls=AccountDeletionCascadeWorker, arguments=(account_id,), deduplicate=True
+            )
+        except AppError as e:
+            Logger.error(
+                message=f"Could not start the deletion cascade for account {account_id}, it is left to the sweep: "
+                f"{e.message}"
+            )
+
+        return deletion_result
+
+    @staticmethod
+    def start_identity_backfill() -> None:
+        # Started again by every deployment until the worker records that it backfilled every account, e.g. after
+        # it failed on conflicting accounts that have since been merged
+        if AccountReader.is_identity_backfill_done():
+            return
+
+        ApplicationService.run_worker_immediately(cls=AccountIdentityBackfillWorker)
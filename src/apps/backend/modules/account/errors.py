@@ -1,3 +1,5 @@
+from typing import List
+
 from modules.account.types import AccountErrorCode, PhoneNumber
 from modules.application.errors import AppError
 
@@ -56,3 +58,14 @@ class AccountWithPhoneNumberExistsError(AppError):
             http_status_code=409,
             message=f"An account with the phone number {phone_number} already exists. Try logging in or use a different phone number.",
         )
+
+
+class AccountIdentityBackfillConflictError(AppError):
+    def __init__(self, account_ids: List[str]) -> None:
+        super().__init__(
+            code=AccountErrorCode.IDENTITY_BACKFILL_CONFLICT,
+            http_status_code=409,
+            message=f"Could not backfill the normalized username or phone number of accounts {account_ids}, "
+            f"another active account already has the same value. Merge or deactivate the duplicates and run the "
+            f"backfill again.",
+        )
@@ -1,5 +1,5 @@
 from dataclasses import asdict
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 from bson.objectid import ObjectId
 
@@ -12,25 +12,51 @@ from modules.account.errors import (
     AccountWithUsernameNotFoundError,
 )
 from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.store.account_backfill_repository import IDENTITY_BACKFILL_ID, AccountBackfillRepository
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
     Account,
+    AccountProfile,
     AccountSearchByIdParams,
     AccountSearchParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import AccountNotificationPreferences
 
 
 class AccountReader:
+    IDENTITY_BACKFILL_DONE = False
+
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
-        account_bson = AccountRepository.collection().find_one({"username": username, "active": True})
+        # Accounts that predate the username_lc backfill only match on the raw username
+        account_bson = AccountRepository.collection().find_one(
+            {"active": True, "$or": [{"username_lc": AccountUtil.normalize_username(username)}, {"username": username}]}
+        )
         if account_bson is None:
             raise AccountWithUsernameNotFoundError(username=username)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
+    @staticmethod
+    def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
+        # The unique index on username_lc only covers backfilled accounts, the raw username covers the others
+        account_bson = AccountRepository.collection().find_one(
+            {
+                "active": True,
+                "$or": [
+                    {"username_lc": AccountUtil.normalize_username(params.username)},
+                    {"username": params.username},
+                ],
+            },
+            {"_id": 1},
+        )
+
+        if account_bson:
+            raise AccountWithUserNameExistsError(username=params.username)
+
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
         account = AccountReader.get_account_by_username(username=params.username)
@@ -48,16 +74,43 @@ class AccountReader:
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
     @staticmethod
-    def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
-        account_bson = AccountRepository.collection().find_one({"active": True, "username": params.username})
+    def get_account_profile_by_id(
+        *, params: AccountSearchByIdParams, include_notification_preferences: bool = False
+    ) -> Tuple[AccountProfile, Optional[AccountNotificationPreferences]]:
+        pipeline: List[dict[str, Any]] = [
+            {"$match": {"_id": ObjectId(params.id), "active": True}},
+            {"$project": {"hashed_password": 0}},
+        ]
+        if include_notification_preferences:
+            # Preferences store the account id as a string, so it is derived from _id before the join
+            pipeline += [
+                {"$addFields": {"account_id": {"$toString": "$_id"}}},
+                NotificationService.get_account_notification_preferences_lookup_stage(
+                    local_field="account_id", as_field="notification_preferences"
+                ),
+            ]
+
+        account_bson = next(AccountRepository.collection().aggregate(pipeline), None)
+        if account_bson is None:
+            raise AccountWithIdNotFoundError(id=params.id)
 
-        if account_bson:
-            raise AccountWithUserNameExistsError(username=params.username)
+        notification_preferences = None
+        if include_notification_preferences:
+            notification_preferences = NotificationService.get_active_account_notification_preferences(
+                notification_preferences_bsons=account_bson["notification_preferences"]
+            )
+
+        return AccountUtil.convert_account_bson_to_account_profile(account_bson), notification_preferences
 
     @staticmethod
     def get_account_by_phone_number_optional(*, phone_number: PhoneNumber) -> Optional[Account]:
-        phone_number_dict = asdict(phone_number)
-        account_bson = AccountRepository.collection().find_one({"phone_number": phone_number_dict, "active": True})
+        # Accounts that predate the phone_e164 backfill only match on the embedded phone number
+        phone_number_filters: List[dict[str, Any]] = [{"phone_number": asdict(phone_number)}]
+        phone_e164 = AccountUtil.get_phone_e164(phone_number)
+        if phone_e164 is not None:
+            phone_number_filters.append({"phone_e164": phone_e164})
+
+        account_bson = AccountRepository.collection().find_one({"active": True, "$or": phone_number_filters})
         if account_bson is None:
             return None
 
@@ -73,8 +126,14 @@ class AccountReader:
 
     @staticmethod
     def check_phone_number_not_exist(*, phone_number: PhoneNumber) -> None:
-        phone_number_dict = asdict(phone_number)
-        account_bson = AccountRepository.collection().find_one({"active": True, "phone_number": phone_number_dict})
-
-        if account_bson:
+        if AccountReader.get_account_by_phone_number_optional(phone_number=phone_number):
             raise AccountWithPhoneNumberExistsError(phone_number=phone_number)
+
+    @staticmethod
+    def is_identity_backfill_done() -> bool:
+        # A completed backfill stays completed, so only that answer is kept for the life of the process
+        if not AccountReader.IDENTITY_BACKFILL_DONE:
+            AccountReader.IDENTITY_BACKFILL_DONE = (
+                AccountBackfillRepository.collection().find_one({"_id": IDENTITY_BACKFILL_ID}, {"_id": 1}) is not None
+            )
+        return AccountReader.IDENTITY_BACKFILL_DONE
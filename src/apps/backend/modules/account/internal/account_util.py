@@ -1,19 +1,31 @@
-from typing import Any
+from typing import Any, Optional
 
-import bcrypt
+from phonenumbers import NumberParseException, PhoneNumberFormat, format_number, parse
 
 from modules.account.internal.store.account_model import AccountModel
-from modules.account.types import Account
+from modules.account.types import Account, AccountProfile, PhoneNumber
+from modules.application.common.password_hasher import PasswordHasher
 
 
 class AccountUtil:
     @staticmethod
     def hash_password(*, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return PasswordHasher.hash(password)
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return PasswordHasher.compare(value=password, hashed_value=hashed_password)
+
+    @staticmethod
+    def normalize_username(username: str) -> str:
+        return username.strip().lower()
+
+    @staticmethod
+    def get_phone_e164(phone_number: PhoneNumber) -> Optional[str]:
+        try:
+            return format_number(parse(str(phone_number)), PhoneNumberFormat.E164)
+        except NumberParseException:
+            return None
 
     @staticmethod
     def convert_account_bson_to_account(account_bson: dict[str, Any]) -> Account:
@@ -26,3 +38,14 @@ class AccountUtil:
             phone_number=validated_account_data.phone_number,
             username=validated_account_data.username,
         )
+
+    @staticmethod
+    def convert_account_bson_to_account_profile(account_bson: dict[str, Any]) -> AccountProfile:
+        validated_account_data = AccountModel.from_bson(account_bson)
+        return AccountProfile(
+            first_name=validated_account_data.first_name,
+            id=str(validated_account_data.id),
+            last_name=validated_account_data.last_name,
+            phone_number=validated_account_data.phone_number,
+            username=validated_account_data.username,
+        )
@@ -1,13 +1,20 @@
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List
 
 from bson.objectid import ObjectId
 from phonenumbers import is_valid_number, parse
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.errors import (
+    AccountWithIdNotFoundError,
+    AccountWithPhoneNumberExistsError,
+    AccountWithUserNameExistsError,
+)
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.store.account_backfill_repository import IDENTITY_BACKFILL_ID, AccountBackfillRepository
 from modules.account.internal.store.account_model import AccountModel
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
@@ -24,10 +31,14 @@ from modules.authentication.errors import OTPRequestFailedError
 class AccountWriter:
     @staticmethod
     def create_account_by_username_and_password(*, params: CreateAccountByUsernameAndPasswordParams) -> Account:
+        # Until every account has username_lc, the unique index cannot see the accounts that predate it. Checked
+        # before hashing, so a taken username does not cost a bcrypt round
+        if not AccountReader.is_identity_backfill_done():
+            AccountReader.check_username_not_exist(params=params)
+
         params_dict = asdict(params)
         params_dict["hashed_password"] = AccountUtil.hash_password(password=params.password)
         del params_dict["password"]
-        AccountReader.check_username_not_exist(params=params)
         account_bson = AccountModel(
             first_name=params.first_name,
             hashed_password=params_dict["hashed_password"],
@@ -35,11 +46,16 @@ class AccountWriter:
             last_name=params.last_name,
             phone_number=None,
             username=params.username,
+            username_lc=AccountUtil.normalize_username(params.username),
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        # The unique index on username_lc rejects a username taken by a concurrent signup or, once the backfill is
+        # done, by any other active account
+        try:
+            query = AccountRepository.collection().insert_one(account_bson)
+        except DuplicateKeyError:
+            raise AccountWithUserNameExistsError(username=params.username)
+        return AccountUtil.convert_account_bson_to_account({**account_bson, "_id": query.inserted_id})
 
     @staticmethod
     def create_account_by_phone_number(*, params: CreateAccountByPhoneNumberParams) -> Account:
@@ -50,14 +66,24 @@ class AccountWriter:
         if not is_valid_phone_number:
             raise OTPRequestFailedError()
 
-        AccountReader.check_phone_number_not_exist(phone_number=params.phone_number)
+        if not AccountReader.is_identity_backfill_done():
+            AccountReader.check_phone_number_not_exist(phone_number=params.phone_number)
+
         account_bson = AccountModel(
-            first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
+            first_name="",
+            hashed_password="",
+            id=None,
+            last_name="",
+            phone_number=phone_number,
+            username="",
+            phone_e164=AccountUtil.get_phone_e164(phone_number),
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        try:
+            query = AccountRepository.collection().insert_one(account_bson)
+        except DuplicateKeyError:
+            raise AccountWithPhoneNumberExistsError(phone_number=params.phone_number)
+        return AccountUtil.convert_account_bson_to_account({**account_bson, "_id": query.inserted_id})
 
     @staticmethod
     def update_password_by_account_id(account_id: str, password: str) -> Account:
@@ -95,7 +121,15 @@ class AccountWriter:
         deletion_time = datetime.now()
         updated_account = AccountRepository.collection().find_one_and_update(
             {"_id": ObjectId(account_id), "active": True},
-            {"$set": {"active": False, "updated_at": deletion_time}},
+            # The dependent documents are deactivated by a cascade that clears cascade_pending once it is done
+            {
+                "$set": {
+                    "active": False,
+                    "cascade_pending": True,
+                    "cascade_requested_at": deletion_time,
+                    "updated_at": deletion_time,
+                }
+            },
             return_document=ReturnDocument.AFTER,
         )
 
@@ -103,3 +137,37 @@ class AccountWriter:
             raise AccountWithIdNotFoundError(id=account_id)
 
         return AccountDeletionResult(account_id=account_id, deleted_at=deletion_time, success=True)
+
+    @staticmethod
+    def claim_accounts_pending_deletion_cascade(*, batch_size: int, cascade_timeout_in_seconds: int) -> List[str]:
+        # Claiming moves cascade_requested_at forward, so an account is only handed out again once the cascade
+        # requested for it has had cascade_timeout_in_seconds to finish
+        now = datetime.now()
+        stale_filter = {
+            "active": False,
+            "cascade_pending": True,
+            "cascade_requested_at": {"$lte": now - timedelta(seconds=cascade_timeout_in_seconds)},
+        }
+        account_ids = [
+            account["_id"]
+            for account in AccountRepository.collection().find(stale_filter, {"_id": 1}).limit(batch_size)
+        ]
+        if not account_ids:
+            return []
+
+        AccountRepository.collection().update_many(
+            {**stale_filter, "_id": {"$in": account_ids}}, {"$set": {"cascade_requested_at": now}}
+        )
+        return [str(account_id) for account_id in account_ids]
+
+    @staticmethod
+    def mark_deletion_cascade_as_done(*, account_id: str) -> None:
+        AccountRepository.collection().update_one(
+            {"_id": ObjectId(account_id)}, {"$set": {"cascade_pending": False, "updated_at": datetime.now()}}
+        )
+
+    @staticmethod
+    def mark_identity_backfill_as_done() -> None:
+        AccountBackfillRepository.collection().update_one(
+            {"_id": IDENTITY_BACKFILL_ID}, {"$set": {"completed_at": datetime.utcnow()}}, upsert=True
+        )
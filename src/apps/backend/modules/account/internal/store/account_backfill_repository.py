@@ -0,0 +1,17 @@
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+
+IDENTITY_BACKFILL_ID = "identity_fields"
+
+
+class AccountBackfillRepository(ApplicationRepository):
+    """
+    One document per account backfill that has completed, keyed by the backfill name.
+    """
+
+    collection_name = "account_backfills"
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        return True
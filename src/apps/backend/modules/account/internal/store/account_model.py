@@ -19,6 +19,10 @@ class AccountModel(BaseModel):
     username: str
 
     active: bool = True
+    username_lc: Optional[str] = None
+    phone_e164: Optional[str] = None
+    cascade_pending: bool = False
+    cascade_requested_at: Optional[datetime] = None
     created_at: Optional[datetime] = datetime.now()
     updated_at: Optional[datetime] = datetime.now()
 
@@ -34,6 +38,10 @@ class AccountModel(BaseModel):
             last_name=bson_data.get("last_name", ""),
             phone_number=phone_number,
             username=bson_data.get("username", ""),
+            username_lc=bson_data.get("username_lc"),
+            phone_e164=bson_data.get("phone_e164"),
+            cascade_pending=bson_data.get("cascade_pending", False),
+            cascade_requested_at=bson_data.get("cascade_requested_at"),
             created_at=bson_data.get("created_at"),
             updated_at=bson_data.get("updated_at"),
         )
@@ -20,6 +20,10 @@ ACCOUNT_VALIDATION_SCHEMA = {
                 "description": "must be an object with country_code and phone_number",
             },
             "username": {"bsonType": "string", "description": "must be a string"},
+            "username_lc": {"bsonType": ["string", "null"], "description": "must be the lowercased username"},
+            "phone_e164": {"bsonType": ["string", "null"], "description": "must be the E.164 phone number"},
+            "cascade_pending": {"bsonType": "bool"},
+            "cascade_requested_at": {"bsonType": ["date", "null"]},
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
         },
@@ -36,6 +40,26 @@ class AccountRepository(ApplicationRepository):
         collection.create_index("username")
         collection.create_index([("active", 1), ("username", 1)], name="active_username_index")
         collection.create_index([("active", 1), ("phone_number", 1)], name="active_phone_number_index")
+        # Only active accounts with the field set take part, so deleted accounts and accounts without a username or
+        # phone number never conflict
+        collection.create_index(
+            "username_lc",
+            name="active_username_lc_unique_index",
+            unique=True,
+            partialFilterExpression={"active": True, "username_lc": {"$type": "string"}},
+        )
+        collection.create_index(
+            "phone_e164",
+            name="active_phone_e164_unique_index",
+            unique=True,
+            partialFilterExpression={"active": True, "phone_e164": {"$type": "string"}},
+        )
+        # Only deleted accounts whose deletion cascade has not finished yet are indexed
+        collection.create_index(
+            "cascade_requested_at",
+            name="cascade_pending_requested_at_index",
+            partialFilterExpression={"cascade_pending": True},
+        )
 
         add_validation_command = {
             "collMod": cls.collection_name,
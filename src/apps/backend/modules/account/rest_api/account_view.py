@@ -16,7 +16,6 @@ from modules.account.types import (
     UpdateAccountProfileParams,
 )
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 
 
@@ -37,20 +36,15 @@ class AccountView(MethodView):
 
     @access_auth_middleware
     def get(self, id: str) -> ResponseReturnValue:
-        account_params = AccountSearchByIdParams(id=id)
-        account = AccountService.get_account_by_id(params=account_params)
-        account_dict = asdict(account)
-
         include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
 
-        if include_notification_preferences:
-            try:
-                notification_preferences = AccountService.get_account_notification_preferences_by_account_id(
-                    account_id=account.id
-                )
-                account_dict["notification_preferences"] = asdict(notification_preferences)
-            except AccountNotificationPreferencesNotFoundError:
-                pass
+        account, notification_preferences = AccountService.get_account_profile_by_id(
+            params=AccountSearchByIdParams(id=id), include_notification_preferences=include_notification_preferences
+        )
+        account_dict = asdict(account)
+
+        if notification_preferences is not None:
+            account_dict["notification_preferences"] = asdict(notification_preferences)
 
         return jsonify(account_dict), 200
 
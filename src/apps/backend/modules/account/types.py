@@ -55,6 +55,15 @@ class Account:
     username: str
 
 
+@dataclass(frozen=True)
+class AccountProfile:
+    id: str
+    first_name: str
+    last_name: str
+    phone_number: Optional[PhoneNumber]
+    username: str
+
+
 @dataclass(frozen=True)
 class ResetPasswordParams:
     account_id: str
@@ -76,6 +85,7 @@ class AccountErrorCode:
     USERNAME_ALREADY_EXISTS: str = "ACCOUNT_ERR_01"
     BAD_REQUEST: str = "ACCOUNT_ERR_04"
     PHONE_NUMBER_ALREADY_EXISTS: str = "ACCOUNT_ERR_05"
+    IDENTITY_BACKFILL_CONFLICT: str = "ACCOUNT_ERR_06"
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,48 @@
+from datetime import timedelta
+from typing import Any, List
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.workers.account_deletion_cascade_worker import AccountDeletionCascadeWorker
+from modules.application.types import BaseWorker, WorkerExecutionMode
+
+
+class AccountDeletionCascadeSweepWorker(BaseWorker):
+    """
+    Starts `AccountDeletionCascadeWorker` again for deleted accounts still marked `cascade_pending`, either because
+    the cascade could not be started when the account was deleted or because it did not finish. An account is only
+    swept once its last cascade has had `AccountDeletionCascadeWorker.max_execution_time_in_seconds` to complete.
+    Each run claims up to `batch_size` accounts and starts their cascades as child workers that outlive the sweep.
+    """
+
+    execution_mode = WorkerExecutionMode.THREAD
+    batch_size: int = 200
+    max_retries = 1
+
+    @classmethod
+    def execute(cls, *args: Any) -> List[str]:
+        return AccountWriter.claim_accounts_pending_deletion_cascade(
+            batch_size=cls.batch_size,
+            cascade_timeout_in_seconds=AccountDeletionCascadeWorker.max_execution_time_in_seconds,
+        )
+
+    async def run(self, *args: Any) -> None:
+        account_ids: List[str] = await workflow.execute_activity(
+            self.execute,
+            args=args,
+            start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+            retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
+        )
+
+        # The cascade started at deletion is deduplicated by account id and its id cannot be reused, so each sweep
+        # starts the cascade under a fresh id
+        for account_id in account_ids:
+            await workflow.start_child_workflow(
+                AccountDeletionCascadeWorker.__name__,
+                args=[account_id],
+                id=f"{AccountDeletionCascadeWorker.__name__}-sweep-{workflow.uuid4()}",
+                task_queue=AccountDeletionCascadeWorker.priority.value,
+                parent_close_policy=workflow.ParentClosePolicy.ABANDON,
+            )
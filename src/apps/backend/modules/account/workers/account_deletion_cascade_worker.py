@@ -0,0 +1,112 @@
+import asyncio
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from bson.objectid import ObjectId
+from temporalio import activity, workflow
+from temporalio.common import RetryPolicy
+
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import PhoneNumber
+from modules.application.types import BaseWorker
+from modules.authentication.authentication_service import AuthenticationService
+from modules.logger.logger import Logger
+from modules.notification.notification_service import NotificationService
+from modules.task.task_service import TaskService
+
+
+class AccountDeletionCascadeWorker(BaseWorker):
+    """
+    Deactivates the tasks, notification preferences, OTPs and password reset tokens of a deleted account.
+
+    Each collection is drained `batch_size` documents per `update_many`, pausing `batch_interval_in_seconds` between
+    batches so a large account does not saturate the database. Batches only match documents that are still active,
+    so a retried attempt picks up whatever is left. The deactivated counts per collection are sent as the activity
+    heartbeat details and carried over by the retried attempt. The account's `cascade_pending` flag is cleared at the
+    end, until then `AccountDeletionCascadeSweepWorker` starts the cascade again.
+    """
+
+    batch_size: int = 500
+    batch_interval_in_seconds: float = 0.1
+    heartbeat_timeout_in_seconds: int = 60
+    max_execution_time_in_seconds: int = 3600
+
+    @classmethod
+    async def execute(cls, *args: Any) -> Dict[str, int]:
+        account_id: str = args[0]
+        account_bson = await asyncio.to_thread(
+            AccountRepository.collection().find_one, {"_id": ObjectId(account_id)}, {"active": 1, "phone_number": 1}
+        )
+        if account_bson is None or account_bson.get("active"):
+            Logger.error(message=f"Skipping deletion cascade, account {account_id} is missing or still active")
+            return {}
+
+        progress = cls._get_resumed_progress()
+        for name, deactivate_batch in cls._get_cascade_steps(account_id, account_bson):
+            progress.setdefault(name, 0)
+            while True:
+                deactivated_count = await asyncio.to_thread(deactivate_batch)
+                if not deactivated_count:
+                    break
+
+                progress[name] += deactivated_count
+                activity.heartbeat(progress)
+                await asyncio.sleep(cls.batch_interval_in_seconds)
+
+        await asyncio.to_thread(AccountWriter.mark_deletion_cascade_as_done, account_id=account_id)
+        Logger.info(message=f"Deactivated documents of deleted account {account_id}: {progress}")
+        return progress
+
+    async def run(self, *args: Any) -> None:
+        await workflow.execute_activity(
+            self.execute,
+            args=args,
+            start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+            heartbeat_timeout=timedelta(seconds=self.heartbeat_timeout_in_seconds),
+            retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
+        )
+
+    @classmethod
+    def _get_cascade_steps(cls, account_id: str, account_bson: Dict[str, Any]) -> List[Tuple[str, Callable[[], int]]]:
+        steps: List[Tuple[str, Callable[[], int]]] = [
+            (
+                "tasks",
+                lambda: TaskService.deactivate_tasks_by_account_id(account_id=account_id, batch_size=cls.batch_size),
+            ),
+            (
+                "notification_preferences",
+                lambda: NotificationService.deactivate_account_notification_preferences_by_account_id(
+                    account_id=account_id, batch_size=cls.batch_size
+                ),
+            ),
+            (
+                "password_reset_tokens",
+                lambda: AuthenticationService.set_password_reset_tokens_as_used_by_account_id(
+                    account_id=account_id, batch_size=cls.batch_size
+                ),
+            ),
+        ]
+
+        # OTPs are keyed by phone number, so only accounts created by phone number have any
+        phone_number_data = account_bson.get("phone_number")
+        if phone_number_data:
+            phone_number = PhoneNumber(**phone_number_data)
+            steps.append(
+                (
+                    "otps",
+                    lambda: AuthenticationService.expire_otps_by_phone_number(
+                        phone_number=phone_number, batch_size=cls.batch_size
+                    ),
+                )
+            )
+
+        return steps
+
+    @staticmethod
+    def _get_resumed_progress() -> Dict[str, int]:
+        heartbeat_details = activity.info().heartbeat_details
+        if not heartbeat_details:
+            return {}
+
+        return dict(heartbeat_details[0])
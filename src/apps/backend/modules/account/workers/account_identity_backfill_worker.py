@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from modules.account.errors import AccountIdentityBackfillConflictError
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import PhoneNumber
+from modules.application.batch_scan_worker import BatchScanWorker
+from modules.logger.logger import Logger
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+class AccountIdentityBackfillWorker(BatchScanWorker):
+    """
+    Populates `username_lc` and `phone_e164` on accounts created before `AccountWriter` maintained them, and
+    records its completion once every account is backfilled.
+    """
+
+    repository = AccountRepository
+    parallelism = 4
+
+    @classmethod
+    async def execute(cls, *args: Any) -> None:
+        await super().execute(*args)
+
+        # Conflicting accounts fail the scan before this point, so they keep the backfill from being recorded
+        await asyncio.to_thread(AccountWriter.mark_identity_backfill_as_done)
+
+    @classmethod
+    def get_filter(cls, *args: Any) -> Dict[str, Any]:
+        return {"$or": [{"username_lc": {"$exists": False}}, {"phone_e164": {"$exists": False}}]}
+
+    @classmethod
+    def process_batch(cls, documents: List[Dict[str, Any]], *args: Any) -> None:
+        updates = []
+        for document in documents:
+            username = document.get("username")
+            phone_number = document.get("phone_number")
+            updates.append(
+                UpdateOne(
+                    {"_id": document["_id"]},
+                    {
+                        "$set": {
+                            "username_lc": AccountUtil.normalize_username(username) if username else None,
+                            "phone_e164": (
+                                AccountUtil.get_phone_e164(PhoneNumber(**phone_number)) if phone_number else None
+                            ),
+                        }
+                    },
+                )
+            )
+
+        try:
+            AccountRepository.collection().bulk_write(updates, ordered=False)
+
+        except BulkWriteError as exc:
+            write_errors = exc.details.get("writeErrors", [])
+            if any(error["code"] != DUPLICATE_KEY_ERROR_CODE for error in write_errors):
+                raise
+
+            # Active accounts whose usernames only differ in case, or whose phone numbers only differ in format,
+            # cannot share the normalized value. The rest of the batch is written, then the worker fails so the
+            # duplicates are merged by hand before the backfill runs again.
+            conflicting_account_ids = [str(documents[error["index"]]["_id"]) for error in write_errors]
+            error = AccountIdentityBackfillConflictError(account_ids=conflicting_account_ids)
+            Logger.error(message=error.message)
+            raise error
@@ -1,7 +1,8 @@
-from typing import Any, Tuple, Type
+from typing import Any, List, Optional, Tuple, Type
 
+from modules.application.internal.startup_job_runner import StartupJobRunner
 from modules.application.internal.worker_manager import WorkerManager
-from modules.application.types import BaseWorker, Worker
+from modules.application.types import BaseWorker, StartupJob, Worker, WorkerFilter, WorkerPage
 
 
 class ApplicationService:
@@ -9,13 +10,33 @@ class ApplicationService:
     def connect_temporal_server() -> None:
         return WorkerManager.connect_temporal_server()
 
+    @staticmethod
+    def register_startup_job(*, job: StartupJob) -> None:
+        return StartupJobRunner.register(job)
+
+    @staticmethod
+    def run_startup_jobs() -> None:
+        return StartupJobRunner.start()
+
     @staticmethod
     def get_worker_by_id(*, worker_id: str) -> Worker:
         return WorkerManager.get_worker_by_id(worker_id=worker_id)
 
     @staticmethod
-    def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...] = ()) -> str:
-        return WorkerManager.run_worker_immediately(cls=cls, arguments=arguments)
+    def list_workers(*, worker_filter: WorkerFilter, page_token: Optional[str] = None) -> WorkerPage:
+        return WorkerManager.list_workers(worker_filter=worker_filter, page_token=page_token)
+
+    @staticmethod
+    def run_worker_immediately(
+        *, cls: Type[BaseWorker], arguments: Tuple[Any, ...] = (), deduplicate: bool = False
+    ) -> str:
+        return WorkerManager.run_worker_immediately(cls=cls, arguments=arguments, deduplicate=deduplicate)
+
+    @staticmethod
+    def run_workers_bulk(
+        *, cls: Type[BaseWorker], arguments_list: List[Tuple[Any, ...]], deduplicate: bool = False
+    ) -> List[str]:
+        return WorkerManager.run_workers_bulk(cls=cls, arguments_list=arguments_list, deduplicate=deduplicate)
 
     @staticmethod
     def schedule_worker_as_cron(*, cls: Type[BaseWorker], cron_schedule: str) -> str:
@@ -0,0 +1,131 @@
+import asyncio
+from abc import abstractmethod
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from bson.objectid import ObjectId
+from temporalio import activity, workflow
+from temporalio.common import RetryPolicy
+
+from modules.application.repository import ApplicationRepository
+from modules.application.types import BaseWorker, BatchScanPartition
+
+
+class BatchScanWorker(BaseWorker):
+    """
+    Base class for workers that walk a whole Mongo collection, such as backfills, stats rebuilds and cascade deletes.
+
+    The collection is split into `parallelism` `_id` ranges that are paged through concurrently, `batch_size`
+    documents at a time. After every batch the last processed `_id` of each range is sent as the activity
+    heartbeat details, so a retried attempt resumes where the previous one stopped instead of starting over.
+    Documents must use ObjectId `_id`s, and `process_batch()` must be idempotent for the batch in flight when
+    an attempt fails.
+    """
+
+    repository: Type[ApplicationRepository]
+    batch_size: int = 500
+    parallelism: int = 1
+    heartbeat_timeout_in_seconds: int = 60
+    max_execution_time_in_seconds: int = 3600
+
+    @classmethod
+    def get_filter(cls, *args: Any) -> Dict[str, Any]:
+        """
+        Override to restrict the scan to a subset of the collection, receives the worker arguments
+        """
+        return {}
+
+    @classmethod
+    @abstractmethod
+    def process_batch(cls, documents: List[Dict[str, Any]], *args: Any) -> None:
+        """
+        Subclasses must implement process_batch(), it runs on a thread so blocking pymongo calls are fine
+        """
+
+    @classmethod
+    async def execute(cls, *args: Any) -> None:
+        partitions = cls._get_resumed_partitions()
+        if partitions is None:
+            partitions = await asyncio.to_thread(cls._plan_partitions, args)
+
+        await asyncio.gather(*[cls._scan_partition(partition, partitions, args) for partition in partitions])
+
+    async def run(self, *args: Any) -> None:
+        await workflow.execute_activity(
+            self.execute,
+            args=args,
+            start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+            heartbeat_timeout=timedelta(seconds=self.heartbeat_timeout_in_seconds),
+            retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
+        )
+
+    @classmethod
+    async def _scan_partition(
+        cls, partition: BatchScanPartition, partitions: List[BatchScanPartition], args: Tuple[Any, ...]
+    ) -> None:
+        while not partition.done:
+            last_id = await asyncio.to_thread(cls._process_next_batch, partition, args)
+
+            if last_id is None:
+                partition.done = True
+            else:
+                partition.last_id = last_id
+
+            activity.heartbeat([asdict(p) for p in partitions])
+
+    @classmethod
+    def _process_next_batch(cls, partition: BatchScanPartition, args: Tuple[Any, ...]) -> Optional[str]:
+        id_range: Dict[str, ObjectId] = {}
+        if partition.last_id is not None:
+            id_range["$gt"] = ObjectId(partition.last_id)
+        elif partition.start_id is not None:
+            id_range["$gte"] = ObjectId(partition.start_id)
+        if partition.end_id is not None:
+            id_range["$lt"] = ObjectId(partition.end_id)
+
+        query = cls.get_filter(*args)
+        if id_range:
+            query = {**query, "_id": id_range}
+
+        documents = list(cls.repository.collection().find(query).sort("_id", 1).limit(cls.batch_size))
+        if not documents:
+            return None
+
+        cls.process_batch(documents, *args)
+        return str(documents[-1]["_id"])
+
+    @classmethod
+    def _plan_partitions(cls, args: Tuple[Any, ...]) -> List[BatchScanPartition]:
+        query = cls.get_filter(*args)
+        total_count = cls.repository.collection().count_documents(query)
+
+        if cls.parallelism <= 1 or total_count <= cls.batch_size:
+            return [BatchScanPartition(start_id=None, end_id=None)]
+
+        # Split the matching documents into equally sized `_id` ranges
+        boundaries: List[Optional[str]] = [None]
+        for index in range(1, cls.parallelism):
+            boundary = list(
+                cls.repository.collection()
+                .find(query, {"_id": 1})
+                .sort("_id", 1)
+                .skip(index * total_count // cls.parallelism)
+                .limit(1)
+            )
+            if boundary:
+                boundaries.append(str(boundary[0]["_id"]))
+        boundaries.append(None)
+
+        return [
+            BatchScanPartition(start_id=boundaries[index], end_id=boundaries[index + 1])
+            for index in range(len(boundaries) - 1)
+        ]
+
+    @staticmethod
+    def _get_resumed_partitions() -> Optional[List[BatchScanPartition]]:
+        heartbeat_details = activity.info().heartbeat_details
+        if not heartbeat_details:
+            return None
+
+        return [BatchScanPartition(**partition) for partition in heartbeat_details[0]]
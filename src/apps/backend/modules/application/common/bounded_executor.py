@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, TypeVar
+
+from modules.application.common.types import ExecutorStats
+from modules.application.errors import ExecutorQueueTimeoutError, ExecutorSaturatedError
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Thread pool that runs at most `max_workers` calls at a time and sheds load instead of queueing without
+    bound. A call is rejected right away once `max_queue_size` calls are already waiting, and a queued call
+    that has not started within `max_queue_time_in_seconds` is cancelled. The caller blocks until its call
+    completes, so this only moves CPU-bound work that releases the GIL, e.g. bcrypt, off a capped number of
+    request threads.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue_size: int, max_queue_time_in_seconds: float) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.max_queue_time_in_seconds = max_queue_time_in_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._total_queue_time_in_seconds = 0.0
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._queued >= self.max_queue_size and self._active >= self.max_workers:
+                self._rejected += 1
+                raise ExecutorSaturatedError(executor_name=self.name)
+            self._queued += 1
+
+        future: "Future[T]" = self._executor.submit(self._run_task, time.monotonic(), fn, *args)
+        try:
+            return future.result(timeout=self.max_queue_time_in_seconds)
+
+        except FutureTimeoutError:
+            # A call that already started is allowed to finish, only calls still in the queue are shed
+            if not future.cancel():
+                return future.result()
+
+            with self._lock:
+                self._queued -= 1
+                self._timed_out += 1
+            raise ExecutorQueueTimeoutError(
+                executor_name=self.name, queue_time_in_seconds=self.max_queue_time_in_seconds
+            )
+
+    def get_stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                active=self._active,
+                queued=self._queued,
+                completed=self._completed,
+                rejected=self._rejected,
+                timed_out=self._timed_out,
+                total_queue_time_in_seconds=self._total_queue_time_in_seconds,
+            )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run_task(self, queued_at: float, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_queue_time_in_seconds += time.monotonic() - queued_at
+
+        try:
+            return fn(*args)
+
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
@@ -0,0 +1,63 @@
+import threading
+import time
+
+from modules.application.common.types import CircuitBreakerState
+from modules.application.errors import CircuitOpenError
+from modules.logger.logger import Logger
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency is degraded. After `failure_threshold` consecutive failures the circuit opens
+    and every call is rejected with `CircuitOpenError` for `reset_timeout_in_seconds`. The circuit then half
+    opens and lets a single trial call through, which closes it on success and opens it again on failure.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout_in_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_in_seconds = reset_timeout_in_seconds
+        self._lock = threading.Lock()
+        self._state = CircuitBreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._state == CircuitBreakerState.OPEN:
+                retry_after = self._opened_at + self.reset_timeout_in_seconds - time.monotonic()
+                if retry_after > 0:
+                    raise CircuitOpenError(client_name=self.name, retry_after_in_seconds=retry_after)
+                self._state = CircuitBreakerState.HALF_OPEN
+
+            if self._state == CircuitBreakerState.HALF_OPEN:
+                if self._trial_in_progress:
+                    raise CircuitOpenError(client_name=self.name, retry_after_in_seconds=0)
+                self._trial_in_progress = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == CircuitBreakerState.HALF_OPEN:
+                Logger.info(message=f"Circuit of {self.name} closed, the trial call succeeded")
+            self._state = CircuitBreakerState.CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._trial_in_progress = False
+            if self._state == CircuitBreakerState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != CircuitBreakerState.OPEN:
+                    Logger.error(
+                        message=f"Circuit of {self.name} opened after {self._consecutive_failures} consecutive "
+                        f"failures, calls are rejected for {self.reset_timeout_in_seconds} seconds"
+                    )
+                self._state = CircuitBreakerState.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,88 @@
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.application.common.circuit_breaker import CircuitBreaker
+from modules.application.errors import CircuitOpenError
+from modules.application.internal.worker_metrics import WorkerMetrics
+from modules.config.config_service import ConfigService
+
+RETRYABLE_STATUS_CODE = 429
+
+
+class HTTPClient:
+    """
+    Pooled `requests` session for the calls to one external provider. Connections are kept alive in a pool of
+    `pool_size` per host, each request is bounded by the connect and read timeouts, and a `CircuitBreaker`
+    rejects requests right away once the provider keeps failing. Connection errors, timeouts, 429 and 5xx
+    responses count as failures, other 4xx responses are caused by the request and do not. Requests are not
+    retried here, callers such as the notification outbox retry with backoff. Every request is recorded by
+    `WorkerMetrics.record_http_request`.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        pool_size: int,
+        connect_timeout_in_seconds: float,
+        read_timeout_in_seconds: float,
+        failure_threshold: int,
+        reset_timeout_in_seconds: float,
+    ) -> None:
+        self.name = name
+        self.timeout = (connect_timeout_in_seconds, read_timeout_in_seconds)
+        self.circuit_breaker = CircuitBreaker(
+            name=name, failure_threshold=failure_threshold, reset_timeout_in_seconds=reset_timeout_in_seconds
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @staticmethod
+    def from_config(*, name: str, key: str) -> "HTTPClient":
+        return HTTPClient(
+            name=name,
+            pool_size=ConfigService[int].get_value(key=f"{key}.pool_size"),
+            connect_timeout_in_seconds=ConfigService[float].get_value(key=f"{key}.connect_timeout_in_seconds"),
+            read_timeout_in_seconds=ConfigService[float].get_value(key=f"{key}.read_timeout_in_seconds"),
+            failure_threshold=ConfigService[int].get_value(key=f"{key}.circuit_breaker.failure_threshold"),
+            reset_timeout_in_seconds=ConfigService[float].get_value(
+                key=f"{key}.circuit_breaker.reset_timeout_in_seconds"
+            ),
+        )
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        try:
+            self.circuit_breaker.before_call()
+        except CircuitOpenError:
+            WorkerMetrics.record_http_request(
+                client_name=self.name,
+                outcome="short_circuited",
+                duration_in_seconds=None,
+                circuit_state=self.circuit_breaker.state,
+            )
+            raise
+
+        failed = True
+        started_at = time.monotonic()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            failed = response.status_code >= 500 or response.status_code == RETRYABLE_STATUS_CODE
+            return response
+
+        finally:
+            if failed:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            WorkerMetrics.record_http_request(
+                client_name=self.name,
+                outcome="failure" if failed else "success",
+                duration_in_seconds=time.monotonic() - started_at,
+                circuit_state=self.circuit_breaker.state,
+            )
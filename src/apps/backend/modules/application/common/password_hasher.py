@@ -0,0 +1,51 @@
+import threading
+from typing import Optional
+
+import bcrypt
+
+from modules.application.common.bounded_executor import BoundedExecutor
+from modules.config.config_service import ConfigService
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded executor per server process, so a burst of logins or signups can only occupy
+    `password_hashing.max_concurrency` request threads and is shed with a 429 or 503 once the queue is full,
+    instead of starving every other request.
+    """
+
+    ROUNDS = 10
+    EXECUTOR: Optional[BoundedExecutor] = None
+    EXECUTOR_LOCK = threading.Lock()
+
+    @staticmethod
+    def hash(value: str) -> str:
+        return PasswordHasher._get_executor().run(PasswordHasher._hash, value)
+
+    @staticmethod
+    def compare(*, value: str, hashed_value: str) -> bool:
+        return PasswordHasher._get_executor().run(PasswordHasher._compare, value, hashed_value)
+
+    @staticmethod
+    def _get_executor() -> BoundedExecutor:
+        # Created lazily so each gunicorn worker starts its own threads after the fork
+        if PasswordHasher.EXECUTOR is None:
+            with PasswordHasher.EXECUTOR_LOCK:
+                if PasswordHasher.EXECUTOR is None:
+                    PasswordHasher.EXECUTOR = BoundedExecutor(
+                        name="password hashing",
+                        max_workers=ConfigService[int].get_value(key="password_hashing.max_concurrency"),
+                        max_queue_size=ConfigService[int].get_value(key="password_hashing.max_queue_size"),
+                        max_queue_time_in_seconds=ConfigService[float].get_value(
+                            key="password_hashing.max_queue_time_in_seconds"
+                        ),
+                    )
+        return PasswordHasher.EXECUTOR
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        return bcrypt.hashpw(value.encode("utf-8"), bcrypt.gensalt(rounds=PasswordHasher.ROUNDS)).decode()
+
+    @staticmethod
+    def _compare(value: str, hashed_value: str) -> bool:
+        return bcrypt.checkpw(value.encode("utf-8"), hashed_value.encode("utf-8"))
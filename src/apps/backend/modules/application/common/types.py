@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Generic, List, TypeVar
 
 T = TypeVar("T")
@@ -42,4 +42,36 @@ class PaginationResult(Generic[T]):
     total_pages: int
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    active: int
+    queued: int
+    completed: int
+    rejected: int
+    timed_out: int
+    total_queue_time_in_seconds: float
+
+    @property
+    def average_queue_time_in_seconds(self) -> float:
+        return self.total_queue_time_in_seconds / self.completed if self.completed else 0.0
+
+
+class CircuitBreakerState(StrEnum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
 UNSET = object()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class AppError(Exception):
@@ -32,6 +32,11 @@ class WorkerErrorCode:
     WORKER_ALREADY_COMPLETED: str = "WORKER_ERR_05"
     WORKER_ALREADY_CANCELLED: str = "WORKER_ERR_06"
     WORKER_ALREADY_TERMINATED: str = "WORKER_ERR_07"
+    WORKER_REQUEST_TIMEOUT: str = "WORKER_ERR_08"
+    WORKER_BAD_REQUEST: str = "WORKER_ERR_09"
+    WORKER_LIST_ERROR: str = "WORKER_ERR_10"
+    WORKER_BULK_START_ERROR: str = "WORKER_ERR_11"
+    WORKER_ACCESS_FORBIDDEN: str = "WORKER_ERR_12"
 
 
 class WorkerClientConnectionError(AppError):
@@ -99,3 +104,90 @@ class WorkerAlreadyTerminatedError(AppError):
             http_status_code=400,
             message=f"Worker with id: {worker_id} has already been terminated. Verify the worker ID and try again.",
         )
+
+
+class WorkerRequestTimeoutError(AppError):
+    def __init__(self, timeout_in_seconds: int) -> None:
+        super().__init__(
+            code=WorkerErrorCode.WORKER_REQUEST_TIMEOUT,
+            http_status_code=504,
+            message=f"Temporal server did not respond within {timeout_in_seconds} seconds. "
+            f"Check temporal server logs for more information.",
+        )
+
+
+class WorkerBulkStartError(AppError):
+    def __init__(self, worker_name: str, worker_ids: List[Optional[str]]) -> None:
+        failed_count = worker_ids.count(None)
+        super().__init__(
+            code=WorkerErrorCode.WORKER_BULK_START_ERROR,
+            http_status_code=500,
+            message=f"Could not start {failed_count} of {len(worker_ids)} workers with name: {worker_name}. "
+            f"Check temporal server logs for more information.",
+        )
+        # The ids of the workers that did start, in the order of the arguments, with None for those that did not
+        self.worker_ids = worker_ids
+
+
+class WorkerBadRequestError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=WorkerErrorCode.WORKER_BAD_REQUEST, http_status_code=400, message=message)
+
+
+class WorkerAccessForbiddenError(AppError):
+    def __init__(self, account_id: str) -> None:
+        super().__init__(
+            code=WorkerErrorCode.WORKER_ACCESS_FORBIDDEN,
+            http_status_code=403,
+            message=f"Account with id: {account_id} is not an operator and cannot access workers.",
+        )
+
+
+class WorkerListError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=WorkerErrorCode.WORKER_LIST_ERROR,
+            http_status_code=500,
+            message="Could not list workers. Check temporal server logs for more information.",
+        )
+
+
+@dataclass(frozen=True)
+class ExecutorErrorCode:
+    EXECUTOR_SATURATED: str = "EXECUTOR_ERR_01"
+    EXECUTOR_QUEUE_TIMEOUT: str = "EXECUTOR_ERR_02"
+
+
+class ExecutorSaturatedError(AppError):
+    def __init__(self, executor_name: str) -> None:
+        super().__init__(
+            code=ExecutorErrorCode.EXECUTOR_SATURATED,
+            http_status_code=429,
+            message=f"Too many {executor_name} requests are waiting to be processed. Please try again shortly.",
+        )
+
+
+class ExecutorQueueTimeoutError(AppError):
+    def __init__(self, executor_name: str, queue_time_in_seconds: float) -> None:
+        super().__init__(
+            code=ExecutorErrorCode.EXECUTOR_QUEUE_TIMEOUT,
+            http_status_code=503,
+            message=f"The {executor_name} request could not be started within {queue_time_in_seconds} seconds. "
+            f"Please try again shortly.",
+        )
+
+
+@dataclass(frozen=True)
+class HTTPClientErrorCode:
+    CIRCUIT_OPEN: str = "HTTP_CLIENT_ERR_01"
+
+
+class CircuitOpenError(AppError):
+    def __init__(self, client_name: str, retry_after_in_seconds: float) -> None:
+        super().__init__(
+            code=HTTPClientErrorCode.CIRCUIT_OPEN,
+            http_status_code=503,
+            message=f"{client_name} is failing, requests are paused for {retry_after_in_seconds:.0f} more seconds. "
+            f"Please try again shortly.",
+        )
+        self.retry_after_in_seconds = retry_after_in_seconds
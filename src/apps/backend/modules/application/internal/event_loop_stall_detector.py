@@ -0,0 +1,88 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from modules.logger.logger import Logger
+
+
+class EventLoopStallDetector:
+    """
+    Debug helper that reports when the Temporal worker event loop is blocked for longer than a threshold.
+
+    A watchdog thread schedules a no-op callback on the loop and waits for it to run. When it does not run
+    in time, the activity owning the current asyncio task and the frame the loop thread is stuck in are
+    logged once the loop recovers.
+    """
+
+    _RUNNING_ACTIVITIES: Dict[asyncio.Task, str] = {}
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold_in_ms: int) -> None:
+        self.loop = loop
+        self.threshold = threshold_in_ms / 1000
+        self.loop_thread_id: Optional[int] = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._watch, name="event-loop-stall-detector", daemon=True)
+
+    @staticmethod
+    @contextmanager
+    def track_activity(activity_name: str) -> Iterator[None]:
+        task = asyncio.current_task()
+        if task is None:
+            yield
+            return
+
+        EventLoopStallDetector._RUNNING_ACTIVITIES[task] = activity_name
+        try:
+            yield
+        finally:
+            EventLoopStallDetector._RUNNING_ACTIVITIES.pop(task, None)
+
+    def start(self) -> None:
+        self.loop_thread_id = threading.get_ident()
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def _watch(self) -> None:
+        while not self.stopped.is_set():
+            responded = threading.Event()
+            started_at = time.monotonic()
+            self.loop.call_soon_threadsafe(responded.set)
+
+            if not responded.wait(self.threshold):
+                activity_name = self._get_current_activity_name()
+                blocking_frame = self._get_loop_thread_frame()
+
+                while not responded.wait(self.threshold) and not self.stopped.is_set():
+                    pass
+
+                stalled_for_ms = (time.monotonic() - started_at) * 1000
+                Logger.warn(
+                    message=f"Event loop stalled for {stalled_for_ms:.0f}ms while running activity "
+                    f"'{activity_name}', blocked at {blocking_frame}"
+                )
+
+            self.stopped.wait(self.threshold)
+
+    def _get_current_activity_name(self) -> str:
+        task = asyncio.current_task(self.loop)
+        if task is None:
+            return "unknown"
+        return self._RUNNING_ACTIVITIES.get(task, task.get_name())
+
+    def _get_loop_thread_frame(self) -> str:
+        if self.loop_thread_id is None:
+            return "unknown"
+
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return "unknown"
+
+        # Innermost frames first, the caller of a blocking library call is usually within the first few
+        stack = reversed(traceback.extract_stack(frame, limit=3))
+        return " <- ".join(f"{summary.filename}:{summary.lineno} in {summary.name}" for summary in stack)
@@ -0,0 +1,62 @@
+import dataclasses
+import zlib
+from typing import List, Sequence
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter, PayloadCodec
+
+from modules.config.config_service import ConfigService
+
+
+class PayloadCompressionCodec(PayloadCodec):
+    """
+    Compresses workflow and activity payloads larger than a threshold before they are written to the
+    Temporal history.
+
+    The whole serialized payload, metadata included, is compressed and stored in a new payload marked with
+    the `binary/zlib` encoding. Smaller payloads pass through untouched, so the codec can be enabled on a
+    cluster with existing history. Decoding never depends on the configuration, so compressed payloads stay
+    readable after compression is disabled.
+    """
+
+    ENCODING = b"binary/zlib"
+
+    def __init__(self, enabled: bool, threshold_in_bytes: int, level: int) -> None:
+        self.enabled = enabled
+        self.threshold_in_bytes = threshold_in_bytes
+        self.level = level
+
+    @staticmethod
+    def get_data_converter() -> DataConverter:
+        codec = PayloadCompressionCodec(
+            enabled=ConfigService[bool].get_value(key="temporal.payload_compression.enabled"),
+            threshold_in_bytes=ConfigService[int].get_value(key="temporal.payload_compression.threshold_in_bytes"),
+            level=ConfigService[int].get_value(key="temporal.payload_compression.level"),
+        )
+        return dataclasses.replace(DataConverter.default, payload_codec=codec)
+
+    async def encode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        return [self._encode_payload(payload) for payload in payloads]
+
+    async def decode(self, payloads: Sequence[Payload]) -> List[Payload]:
+        return [self._decode_payload(payload) for payload in payloads]
+
+    def _encode_payload(self, payload: Payload) -> Payload:
+        if not self.enabled or payload.ByteSize() < self.threshold_in_bytes:
+            return payload
+
+        compressed = zlib.compress(payload.SerializeToString(), self.level)
+
+        # Incompressible data, e.g. already compressed exports, is cheaper to store as is
+        if len(compressed) >= payload.ByteSize():
+            return payload
+
+        return Payload(metadata={"encoding": self.ENCODING}, data=compressed)
+
+    def _decode_payload(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") != self.ENCODING:
+            return payload
+
+        decoded = Payload()
+        decoded.ParseFromString(zlib.decompress(payload.data))
+        return decoded
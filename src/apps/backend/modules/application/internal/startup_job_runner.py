@@ -0,0 +1,153 @@
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from modules.application.errors import WorkerClientConnectionError, WorkerRequestTimeoutError
+from modules.application.internal.store.startup_job_repository import StartupJobRepository
+from modules.application.internal.worker_manager import WorkerManager
+from modules.application.types import StartupJob
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError
+from modules.config.types import ErrorCode
+from modules.logger.logger import Logger
+
+
+class StartupJobRunner:
+    """
+    Runs registered startup jobs, such as seeding data or scheduling cron workers, once per deployment instead
+    of once per web worker.
+
+    Jobs run on a background thread so that web workers serve requests straight away. Before running a job,
+    a worker takes a lease on the job's document in Mongo; the other workers skip the job while the lease is
+    held and once the job has completed for the current deployment, or for any deployment when it is `run_once`.
+    Jobs that need Temporal wait until the background connection to the Temporal server succeeds.
+    """
+
+    RUN_ONCE_DEPLOYMENT_ID = "*"
+
+    JOBS: List[StartupJob] = []
+
+    @staticmethod
+    def register(job: StartupJob) -> None:
+        StartupJobRunner.JOBS.append(job)
+
+    @staticmethod
+    def start() -> None:
+        if not ConfigService[bool].get_value(key="startup_jobs.enabled"):
+            Logger.info(message="Startup jobs are disabled by config flag.")
+            return
+
+        # Resolved before the thread starts, so a missing deployment id fails the boot instead of a background log
+        deployment_id = StartupJobRunner._get_deployment_id()
+        threading.Thread(
+            target=StartupJobRunner.run_jobs, args=(deployment_id,), name="startup-jobs", daemon=True
+        ).start()
+
+    @staticmethod
+    def run_jobs(deployment_id: str) -> None:
+        owner = f"{socket.gethostname()}-{os.getpid()}"
+
+        for job in StartupJobRunner.JOBS:
+            if not job.requires_temporal:
+                StartupJobRunner._run_job(job, deployment_id, owner)
+
+        StartupJobRunner._connect_temporal_server()
+
+        for job in StartupJobRunner.JOBS:
+            if job.requires_temporal:
+                StartupJobRunner._run_job(job, deployment_id, owner)
+
+    @staticmethod
+    def _get_deployment_id() -> str:
+        deployment_id = ConfigService[str].get_value(key="startup_jobs.deployment_id", default="")
+        if deployment_id:
+            return deployment_id
+
+        # Every pod has its own gunicorn master, so deployments running more than one pod must share an explicit id
+        if ConfigService[bool].get_value(key="startup_jobs.require_deployment_id"):
+            raise MissingKeyError(missing_key="startup_jobs.deployment_id", error_code=ErrorCode.MISSING_KEY)
+
+        # Without an explicit id, the workers forked by the same gunicorn master form one deployment
+        return f"{socket.gethostname()}-{os.getppid()}"
+
+    @staticmethod
+    def _connect_temporal_server() -> None:
+        backoff = ConfigService[int].get_value(key="startup_jobs.temporal_connect_backoff_initial_in_seconds")
+        backoff_max = ConfigService[int].get_value(key="startup_jobs.temporal_connect_backoff_max_in_seconds")
+
+        while True:
+            try:
+                WorkerManager.connect_temporal_server()
+                return
+
+            except (WorkerClientConnectionError, WorkerRequestTimeoutError) as e:
+                Logger.error(message=f"{e.message} Retrying in {backoff} seconds.")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, backoff_max)
+
+    @staticmethod
+    def _run_job(job: StartupJob, deployment_id: str, owner: str) -> None:
+        if job.run_once:
+            deployment_id = StartupJobRunner.RUN_ONCE_DEPLOYMENT_ID
+
+        try:
+            if not StartupJobRunner._acquire_lease(job.name, deployment_id, owner):
+                Logger.info(message=f"Startup job '{job.name}' already ran or is running elsewhere, skipping")
+                return
+
+        except PyMongoError as e:
+            Logger.error(message=f"Could not acquire the lease for startup job '{job.name}': {e}")
+            return
+
+        try:
+            job.run()
+
+        except Exception as e:
+            Logger.error(message=f"Startup job '{job.name}' failed: {e}")
+            StartupJobRunner._release_lease(job.name, owner, completed_deployment_id=None)
+            return
+
+        StartupJobRunner._release_lease(job.name, owner, completed_deployment_id=deployment_id)
+        Logger.info(message=f"Startup job '{job.name}' completed for deployment '{deployment_id}'")
+
+    @staticmethod
+    def _acquire_lease(job_name: str, deployment_id: str, owner: str) -> bool:
+        lease_in_seconds = ConfigService[int].get_value(key="startup_jobs.lease_in_seconds")
+        now = datetime.utcnow()
+
+        try:
+            # When the job document exists but does not match, the upsert collides on `_id`, i.e. the lease is
+            # held by another worker or the job already completed for this deployment
+            StartupJobRepository.collection().find_one_and_update(
+                {
+                    "_id": job_name,
+                    "completed_deployment_id": {"$ne": deployment_id},
+                    "$or": [{"lease_expires_at": None}, {"lease_expires_at": {"$lte": now}}],
+                },
+                {"$set": {"lease_owner": owner, "lease_expires_at": now + timedelta(seconds=lease_in_seconds)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+
+        except DuplicateKeyError:
+            return False
+
+        return True
+
+    @staticmethod
+    def _release_lease(job_name: str, owner: str, completed_deployment_id: Optional[str]) -> None:
+        update: Dict[str, Any] = {"lease_owner": None, "lease_expires_at": None}
+        if completed_deployment_id is not None:
+            update = {**update, "completed_deployment_id": completed_deployment_id, "completed_at": datetime.utcnow()}
+
+        try:
+            StartupJobRepository.collection().update_one({"_id": job_name, "lease_owner": owner}, {"$set": update})
+
+        except PyMongoError as e:
+            Logger.error(message=f"Could not release the lease for startup job '{job_name}': {e}")
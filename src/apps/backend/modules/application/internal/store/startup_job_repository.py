@@ -0,0 +1,16 @@
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+
+
+class StartupJobRepository(ApplicationRepository):
+    """
+    One document per startup job, keyed by the job name, holding the current lease and the deployment the job
+    last completed for.
+    """
+
+    collection_name = "startup_jobs"
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        return True
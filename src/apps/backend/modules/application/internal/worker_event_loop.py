@@ -0,0 +1,55 @@
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class WorkerEventLoop:
+    """
+    Owns a long-lived asyncio event loop running on a daemon thread, one per process.
+
+    Synchronous callers (e.g. gunicorn request threads) submit coroutines to it instead of spinning up
+    a fresh loop with asyncio.run() on every call, which lets loop-bound resources such as the Temporal
+    client be reused across calls.
+    """
+
+    _LOCK = threading.Lock()
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+    _pid: Optional[int] = None
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._LOCK:
+            # A forked child inherits the attributes but not the thread, so start a new loop for it
+            if cls._loop is None or cls._thread is None or not cls._thread.is_alive() or cls._pid != os.getpid():
+                cls._start()
+
+            assert cls._loop is not None
+            return cls._loop
+
+    @classmethod
+    def run(cls, coro: Coroutine[Any, Any, T], *, timeout: float) -> T:
+        future = asyncio.run_coroutine_threadsafe(coro, cls.get_loop())
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    @classmethod
+    def _start(cls) -> None:
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=cls._run_forever, args=(loop,), name="worker-event-loop", daemon=True)
+        thread.start()
+
+        cls._loop = loop
+        cls._thread = thread
+        cls._pid = os.getpid()
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
@@ -0,0 +1,102 @@
+import asyncio
+import contextvars
+import importlib
+import inspect
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, Type
+
+from modules.application.types import BaseWorker, WorkerExecutionMode, WorkerPriority, WorkerQueueSettings
+from modules.config.config_service import ConfigService
+from modules.logger.logger_manager import LoggerManager
+
+
+def _call_blocking(execute: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+    # An async execute() that blocks gets its own event loop in the pool thread or process
+    if inspect.iscoroutinefunction(execute):
+        return asyncio.run(execute(*args))
+    return execute(*args)
+
+
+def _execute_in_process(module_name: str, class_name: str, args: Tuple[Any, ...]) -> Any:
+    # Resolve the worker by name in the child process, since the registered class attributes are not picklable
+    cls = getattr(importlib.import_module(module_name), class_name)
+    return _call_blocking(getattr(cls, "unwrapped_execute", cls.execute), args)
+
+
+class WorkerExecutor:
+    """
+    Pools used to run `execute()` of THREAD and PROCESS workers, one pool per priority queue and mode.
+    """
+
+    _LOCK = threading.Lock()
+    _EXECUTORS: Dict[Tuple[WorkerPriority, WorkerExecutionMode], Executor] = {}
+
+    @staticmethod
+    def get_queue_settings(priority: WorkerPriority) -> WorkerQueueSettings:
+        key_prefix = f"temporal.queues.{priority.value}"
+        return WorkerQueueSettings(
+            max_concurrent_activities=ConfigService[int].get_value(key=f"{key_prefix}.max_concurrent_activities"),
+            max_concurrent_workflow_tasks=ConfigService[int].get_value(
+                key=f"{key_prefix}.max_concurrent_workflow_tasks"
+            ),
+            max_concurrent_activity_task_polls=ConfigService[int].get_value(
+                key=f"{key_prefix}.max_concurrent_activity_task_polls"
+            ),
+            max_concurrent_workflow_task_polls=ConfigService[int].get_value(
+                key=f"{key_prefix}.max_concurrent_workflow_task_polls"
+            ),
+            thread_pool_max_workers=ConfigService[int].get_value(key=f"{key_prefix}.thread_pool_max_workers"),
+            process_pool_max_workers=ConfigService[int].get_value(key=f"{key_prefix}.process_pool_max_workers"),
+            min_process_count=ConfigService[int].get_value(key=f"{key_prefix}.min_process_count"),
+            max_process_count=ConfigService[int].get_value(key=f"{key_prefix}.max_process_count"),
+            backlog_per_process=ConfigService[int].get_value(key=f"{key_prefix}.backlog_per_process"),
+        )
+
+    @staticmethod
+    def get_executor(priority: WorkerPriority, execution_mode: WorkerExecutionMode) -> Executor:
+        with WorkerExecutor._LOCK:
+            executor = WorkerExecutor._EXECUTORS.get((priority, execution_mode))
+            if executor is None:
+                executor = WorkerExecutor._create_executor(priority, execution_mode)
+                WorkerExecutor._EXECUTORS[(priority, execution_mode)] = executor
+
+            return executor
+
+    @staticmethod
+    async def run(cls: Type[BaseWorker], args: Tuple[Any, ...], execution_mode: WorkerExecutionMode) -> Any:
+        loop = asyncio.get_running_loop()
+        executor = WorkerExecutor.get_executor(cls.priority, execution_mode)
+
+        if execution_mode == WorkerExecutionMode.PROCESS:
+            return await loop.run_in_executor(executor, _execute_in_process, cls.__module__, cls.__name__, args)
+
+        # Copy the context so that temporalio.activity.info() keeps working inside the thread
+        context = contextvars.copy_context()
+        execute = getattr(cls, "unwrapped_execute")
+        return await loop.run_in_executor(executor, lambda: context.run(_call_blocking, execute, args))
+
+    @staticmethod
+    def shutdown() -> None:
+        with WorkerExecutor._LOCK:
+            for executor in WorkerExecutor._EXECUTORS.values():
+                executor.shutdown(wait=True)
+
+            WorkerExecutor._EXECUTORS.clear()
+
+    @staticmethod
+    def _create_executor(priority: WorkerPriority, execution_mode: WorkerExecutionMode) -> Executor:
+        settings = WorkerExecutor.get_queue_settings(priority)
+
+        if execution_mode == WorkerExecutionMode.PROCESS:
+            # Forking a process that runs the Temporal core threads is unsafe, so children are spawned instead
+            return ProcessPoolExecutor(
+                max_workers=settings.process_pool_max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=LoggerManager.mount_logger,
+            )
+
+        return ThreadPoolExecutor(
+            max_workers=settings.thread_pool_max_workers, thread_name_prefix=f"worker-{priority.value.lower()}"
+        )
@@ -1,34 +1,55 @@
 import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import uuid
-from typing import Any, Optional, Tuple, Type, cast
+from typing import Any, Coroutine, List, Optional, Tuple, Type, TypeVar, cast
 
 from temporalio.client import Client, WorkflowExecutionStatus, WorkflowHandle
+from temporalio.common import WorkflowIDReusePolicy
 from temporalio.exceptions import WorkflowAlreadyStartedError
-from temporalio.service import RetryConfig, RPCError
+from temporalio.service import RetryConfig, RPCError, RPCStatusCode
 
+from modules.application.common.ttl_cache import TTLCache
 from modules.application.errors import (
     WorkerAlreadyCancelledError,
     WorkerAlreadyCompletedError,
     WorkerAlreadyTerminatedError,
+    WorkerBadRequestError,
+    WorkerBulkStartError,
     WorkerClientConnectionError,
     WorkerIdNotFoundError,
+    WorkerListError,
     WorkerNotRegisteredError,
+    WorkerRequestTimeoutError,
     WorkerStartError,
 )
-from modules.application.types import BaseWorker, Worker
+from modules.application.internal.payload_compression_codec import PayloadCompressionCodec
+from modules.application.internal.worker_event_loop import WorkerEventLoop
+from modules.application.types import BaseWorker, Worker, WorkerFilter, WorkerPage
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from temporal_config import TemporalConfig
 
+T = TypeVar("T")
+
 
 class WorkerManager:
     CLIENT: Optional[Client] = None
+    CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+    WORKER_PAGE_CACHE: Optional[TTLCache[Tuple[str, Optional[str]], WorkerPage]] = None
 
     @staticmethod
     async def _connect_temporal_server() -> None:
         server_address = ConfigService[str].get_value(key="temporal.server_address")
         try:
-            WorkerManager.CLIENT = await Client.connect(server_address, retry_config=RetryConfig(max_retries=3))
+            WorkerManager.CLIENT = await Client.connect(
+                server_address,
+                retry_config=RetryConfig(max_retries=3),
+                data_converter=PayloadCompressionCodec.get_data_converter(),
+            )
+            WorkerManager.CLIENT_LOOP = asyncio.get_running_loop()
 
             Logger.info(message=f"Connected to temporal server at {server_address}")
 
@@ -37,23 +58,46 @@ class WorkerManager:
 
     @staticmethod
     async def _get_client() -> Client:
-        if WorkerManager.CLIENT is None:
+        # The client is bound to the loop it was created on, reconnect if that loop is no longer the current one
+        if WorkerManager.CLIENT is None or WorkerManager.CLIENT_LOOP is not asyncio.get_running_loop():
             await WorkerManager._connect_temporal_server()
         return cast(
             Client, WorkerManager.CLIENT
         )  # Safe to cast since _connect_temporal_server will throw if connection fails
 
+    @staticmethod
+    def _run_in_event_loop(coro: Coroutine[Any, Any, T], timeout: Optional[int] = None) -> T:
+        if timeout is None:
+            timeout = ConfigService[int].get_value(key="temporal.request_timeout_in_seconds")
+        try:
+            return WorkerEventLoop.run(coro, timeout=timeout)
+
+        except TimeoutError:
+            raise WorkerRequestTimeoutError(timeout_in_seconds=timeout)
+
     @staticmethod
     async def _get_worker_status(handle: WorkflowHandle) -> Optional[WorkflowExecutionStatus]:
         info = await handle.describe()
         return info.status
 
     @staticmethod
-    async def _start_worker(cls: Type[BaseWorker], arguments: Tuple[Any, ...], cron_schedule: str = "") -> str:
+    def _get_deterministic_worker_id(cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
+        serialized_arguments = json.dumps(arguments, sort_keys=True, default=str)
+        return f"{cls.__name__}-{hashlib.sha256(serialized_arguments.encode()).hexdigest()[:32]}"
+
+    @staticmethod
+    async def _start_worker(
+        cls: Type[BaseWorker], arguments: Tuple[Any, ...], cron_schedule: str = "", deduplicate: bool = False
+    ) -> str:
         if not cls in TemporalConfig.WORKERS:
             raise WorkerNotRegisteredError(worker_name=cls.__name__)
 
-        worker_id = f"{cls.__name__}-cron" if cron_schedule else f"{cls.__name__}-{str(uuid.uuid4())}"
+        if cron_schedule:
+            worker_id = f"{cls.__name__}-cron"
+        elif deduplicate:
+            worker_id = WorkerManager._get_deterministic_worker_id(cls, arguments)
+        else:
+            worker_id = f"{cls.__name__}-{str(uuid.uuid4())}"
 
         client = await WorkerManager._get_client()
         try:
@@ -63,6 +107,10 @@ class WorkerManager:
                 id=worker_id,
                 task_queue=cls.priority.value,
                 cron_schedule=cron_schedule if cron_schedule else "",
+                # A deduplicated worker never runs twice for the same arguments, even after the first run has closed
+                id_reuse_policy=(
+                    WorkflowIDReusePolicy.REJECT_DUPLICATE if deduplicate else WorkflowIDReusePolicy.ALLOW_DUPLICATE
+                ),
             )
         except WorkflowAlreadyStartedError:
             Logger.info(message=f"Worker {worker_id} already running, skipping starting new instance")
@@ -86,8 +134,86 @@ class WorkerManager:
         )
 
     @staticmethod
-    async def _run_worker_immediately(cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
-        return await WorkerManager._start_worker(cls, arguments)
+    def _get_list_workers_query(worker_filter: WorkerFilter) -> str:
+        conditions = []
+
+        if worker_filter.worker_type is not None:
+            # Only registered worker names are accepted, so the value is safe to embed in the query
+            if worker_filter.worker_type not in [worker.__name__ for worker in TemporalConfig.WORKERS]:
+                raise WorkerNotRegisteredError(worker_name=worker_filter.worker_type)
+            conditions.append(f"WorkflowType = '{worker_filter.worker_type}'")
+
+        if worker_filter.status is not None:
+            # The visibility store names statuses in PascalCase, e.g. CONTINUED_AS_NEW is 'ContinuedAsNew'
+            status_name = "".join(part.capitalize() for part in worker_filter.status.name.split("_"))
+            conditions.append(f"ExecutionStatus = '{status_name}'")
+
+        return " AND ".join(conditions)
+
+    @staticmethod
+    async def _list_workers(query: str, page_token: Optional[str]) -> WorkerPage:
+        try:
+            next_page_token = base64.urlsafe_b64decode(page_token) if page_token else None
+        except (binascii.Error, ValueError):
+            raise WorkerBadRequestError("Invalid page token.")
+
+        client = await WorkerManager._get_client()
+        page_size = ConfigService[int].get_value(key="temporal.list_workers.page_size")
+        iterator = client.list_workflows(query, page_size=page_size, next_page_token=next_page_token)
+        await iterator.fetch_next_page()
+
+        return WorkerPage(
+            items=[
+                Worker(
+                    id=execution.id,
+                    status=execution.status,
+                    start_time=execution.start_time,
+                    close_time=execution.close_time,
+                    task_queue=execution.task_queue,
+                    worker_type=execution.workflow_type,
+                )
+                for execution in iterator.current_page or []
+            ],
+            next_page_token=(
+                base64.urlsafe_b64encode(iterator.next_page_token).decode() if iterator.next_page_token else None
+            ),
+        )
+
+    @staticmethod
+    def _get_worker_page_cache() -> TTLCache[Tuple[str, Optional[str]], WorkerPage]:
+        if WorkerManager.WORKER_PAGE_CACHE is None:
+            WorkerManager.WORKER_PAGE_CACHE = TTLCache(
+                ttl_in_seconds=ConfigService[int].get_value(key="temporal.list_workers.cache_ttl_in_seconds"),
+                max_size=ConfigService[int].get_value(key="temporal.list_workers.cache_max_size"),
+            )
+        return WorkerManager.WORKER_PAGE_CACHE
+
+    @staticmethod
+    async def _run_worker_immediately(cls: Type[BaseWorker], arguments: Tuple[Any, ...], deduplicate: bool) -> str:
+        return await WorkerManager._start_worker(cls, arguments, deduplicate=deduplicate)
+
+    @staticmethod
+    async def _run_workers_bulk(
+        cls: Type[BaseWorker], arguments_list: List[Tuple[Any, ...]], deduplicate: bool
+    ) -> List[Optional[str]]:
+        if not cls in TemporalConfig.WORKERS:
+            raise WorkerNotRegisteredError(worker_name=cls.__name__)
+
+        # Bound the number of in-flight start requests so a large batch does not flood the server
+        max_concurrency = ConfigService[int].get_value(key="temporal.bulk_start.max_concurrency")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def start_worker(arguments: Tuple[Any, ...]) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await WorkerManager._start_worker(cls, arguments, deduplicate=deduplicate)
+
+                # One failed start must not lose the ids of the workers that did start
+                except RPCError as e:
+                    Logger.error(message=f"Could not start worker {cls.__name__} with arguments {arguments}: {e}")
+                    return None
+
+        return list(await asyncio.gather(*[start_worker(arguments) for arguments in arguments_list]))
 
     @staticmethod
     async def _schedule_worker_as_cron(cls: Type[BaseWorker], cron_schedule: str) -> str:
@@ -128,12 +254,12 @@ class WorkerManager:
 
     @staticmethod
     def connect_temporal_server() -> None:
-        asyncio.run(WorkerManager._connect_temporal_server())
+        WorkerManager._run_in_event_loop(WorkerManager._connect_temporal_server())
 
     @staticmethod
     def get_worker_by_id(*, worker_id: str) -> Worker:
         try:
-            res = asyncio.run(WorkerManager._get_worker_by_id(worker_id=worker_id))
+            res = WorkerManager._run_in_event_loop(WorkerManager._get_worker_by_id(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -141,19 +267,61 @@ class WorkerManager:
         return res
 
     @staticmethod
-    def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...]) -> str:
+    def list_workers(*, worker_filter: WorkerFilter, page_token: Optional[str] = None) -> WorkerPage:
+        query = WorkerManager._get_list_workers_query(worker_filter)
+
+        # Dashboards poll the same pages, serve them from a short-lived cache instead of querying visibility
+        cache = WorkerManager._get_worker_page_cache()
+        page = cache.get((query, page_token))
+        if page is not None:
+            return page
+
+        try:
+            page = WorkerManager._run_in_event_loop(WorkerManager._list_workers(query=query, page_token=page_token))
+
+        except RPCError as e:
+            if e.status == RPCStatusCode.INVALID_ARGUMENT:
+                raise WorkerBadRequestError("Invalid page token.")
+
+            Logger.error(message=f"Failed to list workers with query '{query}': {e}")
+            raise WorkerListError()
+
+        cache.set((query, page_token), page)
+        return page
+
+    @staticmethod
+    def run_worker_immediately(*, cls: Type[BaseWorker], arguments: Tuple[Any, ...], deduplicate: bool = False) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._run_worker_immediately(cls=cls, arguments=arguments))
+            worker_id = WorkerManager._run_in_event_loop(
+                WorkerManager._run_worker_immediately(cls=cls, arguments=arguments, deduplicate=deduplicate)
+            )
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
 
         return worker_id
 
+    @staticmethod
+    def run_workers_bulk(
+        *, cls: Type[BaseWorker], arguments_list: List[Tuple[Any, ...]], deduplicate: bool = False
+    ) -> List[str]:
+        timeout = ConfigService[int].get_value(key="temporal.bulk_start.timeout_in_seconds")
+        worker_ids = WorkerManager._run_in_event_loop(
+            WorkerManager._run_workers_bulk(cls=cls, arguments_list=arguments_list, deduplicate=deduplicate),
+            timeout=timeout,
+        )
+
+        if None in worker_ids:
+            raise WorkerBulkStartError(worker_name=cls.__name__, worker_ids=worker_ids)
+
+        return cast(List[str], worker_ids)
+
     @staticmethod
     def schedule_worker_as_cron(*, cls: Type[BaseWorker], cron_schedule: str) -> str:
         try:
-            worker_id = asyncio.run(WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule))
+            worker_id = WorkerManager._run_in_event_loop(
+                WorkerManager._schedule_worker_as_cron(cls=cls, cron_schedule=cron_schedule)
+            )
 
         except RPCError:
             raise WorkerStartError(worker_name=cls.__name__)
@@ -163,7 +331,7 @@ class WorkerManager:
     @staticmethod
     def cancel_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._cancel_worker(worker_id=worker_id))
+            WorkerManager._run_in_event_loop(WorkerManager._cancel_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
@@ -171,7 +339,7 @@ class WorkerManager:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         try:
-            asyncio.run(WorkerManager._terminate_worker(worker_id=worker_id))
+            WorkerManager._run_in_event_loop(WorkerManager._terminate_worker(worker_id=worker_id))
 
         except RPCError:
             raise WorkerIdNotFoundError(worker_id=worker_id)
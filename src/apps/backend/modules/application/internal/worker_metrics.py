@@ -0,0 +1,73 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import AsyncIterator, Dict, Optional
+
+from temporalio import activity
+from temporalio.common import MetricMeter
+from temporalio.runtime import Runtime
+
+from modules.application.common.types import CircuitBreakerState
+
+
+class WorkerMetrics:
+    """
+    Records per-worker execution metrics on the Temporal runtime metric meter, so they are exported next to
+    the SDK's own slot and latency metrics. Outside a worker process with telemetry enabled the meter is a
+    no-op.
+    """
+
+    CIRCUIT_STATE_VALUES: Dict[CircuitBreakerState, int] = {
+        CircuitBreakerState.CLOSED: 0,
+        CircuitBreakerState.HALF_OPEN: 1,
+        CircuitBreakerState.OPEN: 2,
+    }
+
+    @staticmethod
+    @asynccontextmanager
+    async def record_execution(worker_name: str) -> AsyncIterator[None]:
+        meter = activity.metric_meter().with_additional_attributes({"worker": worker_name})
+
+        if activity.info().attempt > 1:
+            meter.create_counter("app_worker_retries", "Worker executions that are a retry of a failed attempt").add(1)
+
+        outcome = "success"
+        started_at = time.monotonic()
+        try:
+            yield
+
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+
+        except Exception:
+            outcome = "failure"
+            raise
+
+        finally:
+            meter.create_counter("app_worker_executions", "Worker executions by outcome").add(1, {"outcome": outcome})
+            meter.create_histogram_timedelta(
+                "app_worker_execution_duration", "Worker execution duration", unit="s"
+            ).record(timedelta(seconds=time.monotonic() - started_at), {"outcome": outcome})
+
+    @staticmethod
+    def record_http_request(
+        *, client_name: str, outcome: str, duration_in_seconds: Optional[float], circuit_state: CircuitBreakerState
+    ) -> None:
+        # Provider requests are sent outside of activity context too, e.g. from the dispatcher's thread pool
+        meter = WorkerMetrics.get_process_meter().with_additional_attributes({"client": client_name})
+
+        meter.create_counter("app_http_client_requests", "Provider requests by outcome").add(1, {"outcome": outcome})
+        if duration_in_seconds is not None:
+            meter.create_histogram_timedelta(
+                "app_http_client_request_duration", "Provider request duration", unit="s"
+            ).record(timedelta(seconds=duration_in_seconds), {"outcome": outcome})
+        meter.create_gauge(
+            "app_http_client_circuit_state", "Provider circuit state, 0 closed, 1 half open and 2 open"
+        ).set(WorkerMetrics.CIRCUIT_STATE_VALUES[circuit_state])
+
+    @staticmethod
+    def get_process_meter() -> MetricMeter:
+        # temporal_server.py sets its Prometheus runtime as the default, other processes get a no-op meter
+        return Runtime.default().metric_meter
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pymongo import MongoClient
 from pymongo.collection import Collection
@@ -61,3 +61,17 @@ class ApplicationRepository(ABC):
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         return False
+
+    @classmethod
+    def update_many_in_batch(cls, query: Dict[str, Any], update: Dict[str, Any], batch_size: int) -> int:
+        """
+        Applies `update` to at most `batch_size` documents matching `query` and returns how many were modified.
+        Call it until it returns 0 to drain a large match in short writes. `update` must make the documents stop
+        matching `query`, e.g. by setting `active` to False, or the same batch is picked up again.
+        """
+        document_ids = [document["_id"] for document in cls.collection().find(query, {"_id": 1}).limit(batch_size)]
+        if not document_ids:
+            return 0
+
+        result = cls.collection().update_many({**query, "_id": {"$in": document_ids}}, update)
+        return int(result.modified_count)
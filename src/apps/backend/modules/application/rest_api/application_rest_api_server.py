@@ -0,0 +1,10 @@
+from flask import Blueprint
+
+from modules.application.rest_api.application_router import ApplicationRouter
+
+
+class ApplicationRestApiServer:
+    @staticmethod
+    def create() -> Blueprint:
+        application_api_blueprint = Blueprint("application", __name__)
+        return ApplicationRouter.create_route(blueprint=application_api_blueprint)
@@ -0,0 +1,11 @@
+from flask import Blueprint
+
+from modules.application.rest_api.worker_view import WorkerView
+
+
+class ApplicationRouter:
+    @staticmethod
+    def create_route(*, blueprint: Blueprint) -> Blueprint:
+        blueprint.add_url_rule("/workers", view_func=WorkerView.as_view("worker_view"), methods=["GET"])
+
+        return blueprint
@@ -0,0 +1,54 @@
+from typing import Any, Dict, List
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+from temporalio.client import WorkflowExecutionStatus
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import WorkerAccessForbiddenError, WorkerBadRequestError
+from modules.application.types import Worker, WorkerFilter
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.config.config_service import ConfigService
+
+
+class WorkerView(MethodView):
+    OPERATOR_ACCOUNT_IDS = ConfigService[List[str]].bind(key="temporal.list_workers.operator_account_ids", default=[])
+
+    @access_auth_middleware
+    def get(self) -> ResponseReturnValue:
+        # Worker ids and arguments describe other accounts, so only operators may list them
+        account_id = getattr(request, "account_id")
+        if account_id not in WorkerView.OPERATOR_ACCOUNT_IDS():
+            raise WorkerAccessForbiddenError(account_id=account_id)
+
+        status = request.args.get("status")
+        if status is not None and status.upper() not in WorkflowExecutionStatus.__members__:
+            raise WorkerBadRequestError(f"Invalid worker status: {status}")
+
+        worker_filter = WorkerFilter(
+            worker_type=request.args.get("type"),
+            status=WorkflowExecutionStatus[status.upper()] if status is not None else None,
+        )
+        page = ApplicationService.list_workers(worker_filter=worker_filter, page_token=request.args.get("page_token"))
+
+        return (
+            jsonify(
+                {
+                    "items": [WorkerView._serialize_worker(worker) for worker in page.items],
+                    "next_page_token": page.next_page_token,
+                }
+            ),
+            200,
+        )
+
+    @staticmethod
+    def _serialize_worker(worker: Worker) -> Dict[str, Any]:
+        return {
+            "id": worker.id,
+            "status": worker.status.name if worker.status else None,
+            "start_time": worker.start_time.isoformat(),
+            "close_time": worker.close_time.isoformat() if worker.close_time else None,
+            "task_queue": worker.task_queue,
+            "worker_type": worker.worker_type,
+        }
@@ -1,8 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Optional, Type
+from typing import Any, Callable, List, Optional, Sequence, Type
 
 from temporalio import workflow
 from temporalio.client import WorkflowExecutionStatus
@@ -14,24 +15,35 @@ class WorkerPriority(Enum):
     CRITICAL = "CRITICAL"
 
 
+class WorkerExecutionMode(Enum):
+    ASYNC = "ASYNC"
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
 class BaseWorker(ABC):
     """
     Base class for all Temporal workers.
     """
 
     priority: WorkerPriority = WorkerPriority.DEFAULT
+    execution_mode: WorkerExecutionMode = WorkerExecutionMode.ASYNC
     max_execution_time_in_seconds: int = 600
     max_retries: int = 3
+    fan_out_chunk_size: int = 100
+    fan_out_max_concurrency: int = 10
+    fan_out_max_chunks_per_run: int = 200
 
     @staticmethod
     @abstractmethod
-    async def execute(*args: Any) -> None:
+    def execute(*args: Any) -> Any:
         """
-        Subclasses must implement the execute() method, where the worker logic goes
+        Subclasses must implement the execute() method, where the worker logic goes.
+        It must be `async` for ASYNC workers and a regular function for THREAD and PROCESS workers.
         """
 
     @abstractmethod
-    async def run(self, *args: Any) -> None:
+    async def run(self, *args: Any) -> Any:
         """
         Subclasses must implement the run() method, which is the application's entry point
         """
@@ -42,6 +54,68 @@ class BaseWorker(ABC):
             retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
         )
 
+    async def fan_out(self, items: Sequence[Any], *args: Any, summary: Any = None) -> Any:
+        """
+        Runs execute(chunk, *args) for every `fan_out_chunk_size` items of `items` as separate activities, with at most
+        `fan_out_max_concurrency` in flight, and folds the chunk results in order into a summary with
+        `aggregate_fan_out_result()`, which is returned.
+
+        To keep the workflow history small, the workflow continues as new with `args=[remaining_items, *args, summary]`
+        after `fan_out_max_chunks_per_run` chunks, so run() must accept the summary so far as its last parameter and
+        pass it back as `summary`. Only the summary is carried over, the chunk results themselves are not.
+        """
+        chunk_size = self.fan_out_chunk_size
+        chunks = [list(items[index : index + chunk_size]) for index in range(0, len(items), chunk_size)]
+        chunks_in_run = chunks[: self.fan_out_max_chunks_per_run]
+
+        semaphore = asyncio.Semaphore(self.fan_out_max_concurrency)
+
+        async def execute_chunk(chunk: List[Any]) -> Any:
+            async with semaphore:
+                return await workflow.execute_activity(
+                    self.execute,
+                    args=[chunk, *args],
+                    start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+                    retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
+                )
+
+        for result in await asyncio.gather(*[execute_chunk(chunk) for chunk in chunks_in_run]):
+            summary = self.aggregate_fan_out_result(summary, result)
+
+        remaining_items = list(items[len(chunks_in_run) * chunk_size :])
+        if remaining_items:
+            workflow.continue_as_new(args=[remaining_items, *args, summary])
+
+        return summary
+
+    def aggregate_fan_out_result(self, summary: Any, result: Any) -> Any:
+        """
+        Folds the result of one fan-out chunk into the summary, which is None before the first chunk. Results are
+        added up by default, so execute() should return counts; override this to keep e.g. per-status counts.
+        """
+        return result if summary is None else summary + result
+
+
+@dataclass(frozen=True)
+class WorkerQueueSettings:
+    max_concurrent_activities: int
+    max_concurrent_workflow_tasks: int
+    max_concurrent_activity_task_polls: int
+    max_concurrent_workflow_task_polls: int
+    thread_pool_max_workers: int
+    process_pool_max_workers: int
+    min_process_count: int
+    max_process_count: int
+    backlog_per_process: int
+
+
+@dataclass
+class BatchScanPartition:
+    start_id: Optional[str]
+    end_id: Optional[str]
+    last_id: Optional[str] = None
+    done: bool = False
+
 
 @dataclass(frozen=True)
 class RegisteredWorker:
@@ -57,3 +131,24 @@ class Worker:
     close_time: Optional[datetime]
     task_queue: str
     worker_type: str
+
+
+@dataclass(frozen=True)
+class WorkerFilter:
+    worker_type: Optional[str] = None
+    status: Optional[WorkflowExecutionStatus] = None
+
+
+@dataclass(frozen=True)
+class WorkerPage:
+    items: List[Worker]
+    next_page_token: Optional[str]
+
+
+@dataclass(frozen=True)
+class StartupJob:
+    name: str
+    run: Callable[[], Any]
+    requires_temporal: bool = False
+    # Completes once for good instead of once per deployment, e.g. a data migration
+    run_once: bool = False
@@ -2,16 +2,17 @@ from typing import Any
 
 import requests
 
-from modules.application.types import BaseWorker
+from modules.application.types import BaseWorker, WorkerExecutionMode
 from modules.logger.logger import Logger
 
 
 class HealthCheckWorker(BaseWorker):
+    execution_mode = WorkerExecutionMode.THREAD
     max_execution_time_in_seconds = 10
     max_retries = 1
 
     @staticmethod
-    async def execute(*args: Any) -> None:
+    def execute(*args: Any) -> None:
         try:
             res = requests.get("http://localhost:8080/api/", timeout=3)
 
@@ -60,6 +60,12 @@ class AuthenticationService:
     def set_password_reset_token_as_used_by_id(password_reset_token_id: str) -> PasswordResetToken:
         return PasswordResetTokenWriter.set_password_reset_token_as_used(password_reset_token_id)
 
+    @staticmethod
+    def set_password_reset_tokens_as_used_by_account_id(*, account_id: str, batch_size: int) -> int:
+        return PasswordResetTokenWriter.set_password_reset_tokens_as_used_by_account_id(
+            account_id=account_id, batch_size=batch_size
+        )
+
     @staticmethod
     def verify_password_reset_token(account_id: str, token: str) -> PasswordResetToken:
         return PasswordResetTokenReader.verify_password_reset_token(account_id=account_id, token=token)
@@ -85,7 +91,7 @@ class AuthenticationService:
         )
 
         EmailService.send_email_for_account(
-            account_id=account_id, bypass_preferences=True, params=password_reset_email_params
+            account_id=account_id, bypass_preferences=True, contains_secret=True, params=password_reset_email_params
         )
 
     @staticmethod
@@ -98,10 +104,16 @@ class AuthenticationService:
                 message_body=f"{otp.otp_code} is your One Time Password (OTP) for verification.",
                 recipient_phone=recipient_phone_number,
             )
-            SMSService.send_sms_for_account(account_id=account_id, bypass_preferences=True, params=send_sms_params)
+            SMSService.send_sms_for_account(
+                account_id=account_id, bypass_preferences=True, contains_secret=True, params=send_sms_params
+            )
 
         return otp
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
         return OTPWriter.verify_otp(params=params)
+
+    @staticmethod
+    def expire_otps_by_phone_number(*, phone_number: PhoneNumber, batch_size: int) -> int:
+        return OTPWriter.expire_otps_by_phone_number(phone_number=phone_number, batch_size=batch_size)
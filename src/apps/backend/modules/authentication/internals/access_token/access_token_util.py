@@ -1,18 +1,27 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 import jwt
 
 from modules.account.types import Account
+from modules.application.common.ttl_cache import TTLCache
 from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError, OTPIncorrectError
 from modules.authentication.types import AccessToken, AccessTokenPayload, OTP, OTPStatus
 from modules.config.config_service import ConfigService
 
 
 class AccessTokenUtil:
+    VERIFICATION_CACHE: Optional[TTLCache[bytes, AccessTokenPayload]] = None
+    TOKEN_SIGNING_KEY = ConfigService[str].bind(key="accounts.token_signing_key")
+    TOKEN_EXPIRY_DAYS = ConfigService[int].bind(key="accounts.token_expiry_days")
+    VERIFICATION_CACHE_ENABLED = ConfigService[bool].bind(key="accounts.access_token_cache.enabled", default=False)
+
     @staticmethod
     def generate_access_token(*, account: Account) -> AccessToken:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
-        jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days"))
+        jwt_signing_key = AccessTokenUtil.TOKEN_SIGNING_KEY()
+        jwt_expiry = timedelta(days=AccessTokenUtil.TOKEN_EXPIRY_DAYS())
         expiry_time = datetime.now() + jwt_expiry
 
         payload = {"account_id": account.id, "exp": expiry_time.timestamp()}
@@ -22,7 +31,37 @@ class AccessTokenUtil:
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
-        jwt_signing_key = ConfigService[str].get_value(key="accounts.token_signing_key")
+        cache = AccessTokenUtil._get_verification_cache()
+        if cache is None:
+            return AccessTokenUtil._decode_access_token(token)[0]
+
+        # Keyed by digest so raw tokens are not kept in memory
+        token_digest = hashlib.sha256(token.encode()).digest()
+        payload = cache.get(token_digest)
+        if payload is not None:
+            return payload
+
+        payload, expires_at = AccessTokenUtil._decode_access_token(token)
+
+        # A verified token stays valid until it expires, so it never has to be verified again before then
+        ttl_in_seconds = expires_at - time.time()
+        if ttl_in_seconds > 0:
+            cache.set(token_digest, payload, ttl_in_seconds=ttl_in_seconds)
+
+        return payload
+
+    @staticmethod
+    def _get_verification_cache() -> Optional[TTLCache[bytes, AccessTokenPayload]]:
+        if AccessTokenUtil.VERIFICATION_CACHE is None and AccessTokenUtil.VERIFICATION_CACHE_ENABLED():
+            AccessTokenUtil.VERIFICATION_CACHE = TTLCache(
+                ttl_in_seconds=ConfigService[int].get_value(key="accounts.token_expires_in_seconds"),
+                max_size=ConfigService[int].get_value(key="accounts.access_token_cache.max_size"),
+            )
+        return AccessTokenUtil.VERIFICATION_CACHE
+
+    @staticmethod
+    def _decode_access_token(token: str) -> Tuple[AccessTokenPayload, float]:
+        jwt_signing_key = AccessTokenUtil.TOKEN_SIGNING_KEY()
 
         try:
             verified_token = jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
@@ -31,7 +70,7 @@ class AccessTokenUtil:
         except jwt.ExpiredSignatureError:
             raise AccessTokenExpiredError(message="Access token has expired. Please login again.")
 
-        return AccessTokenPayload(account_id=verified_token.get("account_id"))
+        return AccessTokenPayload(account_id=verified_token.get("account_id")), float(verified_token.get("exp", 0))
 
     @staticmethod
     def validate_otp_for_access_token(*, otp: OTP) -> None:
@@ -8,12 +8,16 @@ from modules.config.config_service import ConfigService
 
 
 class OTPUtil:
+    DEFAULT_OTP_ENABLED = ConfigService[bool].bind(key="public.default_otp.enabled", default=False)
+    DEFAULT_OTP_CODE = ConfigService[str].bind(key="public.default_otp.code")
+    DEFAULT_OTP_WHITELISTED_PHONE_NUMBER = ConfigService[str].bind(
+        key="public.default_otp.whitelisted_phone_number", default=""
+    )
 
     @staticmethod
     def generate_otp(length: int, phone_number: str) -> str:
         if OTPUtil.should_use_default_otp_for_phone_number(phone_number):
-            default_otp = ConfigService[str].get_value(key="public.default_otp.code")
-            return default_otp
+            return OTPUtil.DEFAULT_OTP_CODE()
         return "".join(secrets.choice(string.digits) for _ in range(length))
 
     @staticmethod
@@ -28,19 +32,11 @@ class OTPUtil:
 
     @staticmethod
     def should_use_default_otp_for_phone_number(phone_number: str) -> bool:
-        default_otp_enabled = ConfigService[bool].get_value(key="public.default_otp.enabled", default=False)
-
-        if not default_otp_enabled:
+        if not OTPUtil.DEFAULT_OTP_ENABLED():
             return False
 
-        has_whitelist_config = ConfigService.has_value(key="public.default_otp.whitelisted_phone_number")
-
-        if not has_whitelist_config:
-            return True
-
-        whitelisted_phone_number = ConfigService[str].get_value(
-            key="public.default_otp.whitelisted_phone_number", default=""
-        )
+        # A missing whitelist resolves to the empty default, which allows every phone number
+        whitelisted_phone_number = OTPUtil.DEFAULT_OTP_WHITELISTED_PHONE_NUMBER()
 
         if not whitelisted_phone_number:
             return True
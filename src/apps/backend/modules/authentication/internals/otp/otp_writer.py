@@ -1,4 +1,6 @@
 from dataclasses import asdict
+from datetime import datetime
+from typing import Any
 
 from pymongo import ReturnDocument
 
@@ -13,40 +15,62 @@ from modules.authentication.types import OTP, CreateOTPParams, OTPStatus, Verify
 class OTPWriter:
     @staticmethod
     def expire_previous_otps(phone_number: PhoneNumber) -> None:
-        phone_number_dict = asdict(phone_number)
-        previous_otps = OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict})
-        for otp in previous_otps:
-            OTPRepository.collection().update_one(
-                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
-            )
+        OTPRepository.collection().update_many(
+            {**OTPWriter._get_phone_number_filter(phone_number), "active": True},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.utcnow()}},
+        )
+
+    @staticmethod
+    def expire_otps_by_phone_number(*, phone_number: PhoneNumber, batch_size: int) -> int:
+        return OTPRepository.update_many_in_batch(
+            {**OTPWriter._get_phone_number_filter(phone_number), "active": True},
+            {"$set": {"active": False, "status": OTPStatus.EXPIRED, "updated_at": datetime.utcnow()}},
+            batch_size,
+        )
 
     @staticmethod
     def create_new_otp(*, params: CreateOTPParams) -> OTP:
         OTPWriter.expire_previous_otps(phone_number=params.phone_number)
         phone_number = PhoneNumber(**asdict(params)["phone_number"])
         otp_code = OTPUtil.generate_otp(length=4, phone_number=phone_number.phone_number)
+        # Set explicitly, the TTL index on created_at expires OTPs relative to the current UTC time
+        created_at = datetime.utcnow()
         otp_bson = OTPModel(
-            active=True, id=None, phone_number=phone_number, otp_code=otp_code, status=str(OTPStatus.PENDING)
+            active=True,
+            id=None,
+            phone_number=phone_number,
+            otp_code=otp_code,
+            status=str(OTPStatus.PENDING),
+            created_at=created_at,
+            updated_at=created_at,
         ).to_bson()
         query = OTPRepository.collection().insert_one(otp_bson)
-        otp_bson = OTPRepository.collection().find_one({"_id": query.inserted_id})
-        return OTPUtil.convert_otp_bson_to_otp(otp_bson)
+        return OTPUtil.convert_otp_bson_to_otp({**otp_bson, "_id": query.inserted_id})
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams) -> OTP:
-        phone_number_dict = asdict(params.phone_number)
-        otp_bson = OTPRepository.collection().find_one(
-            {"otp_code": params.otp_code, "phone_number": phone_number_dict}, sort=[("_id", -1)]
-        )
-        if otp_bson is None:
-            raise OTPIncorrectError()
-
-        if not otp_bson["active"]:
-            raise OTPExpiredError()
+        otp_filter = {**OTPWriter._get_phone_number_filter(params.phone_number), "otp_code": params.otp_code}
 
         updated_otp_bson = OTPRepository.collection().find_one_and_update(
-            {"_id": otp_bson["_id"]},
-            {"$set": {"active": False, "status": OTPStatus.SUCCESS}},
+            {**otp_filter, "active": True},
+            {"$set": {"active": False, "status": OTPStatus.SUCCESS, "updated_at": datetime.utcnow()}},
+            sort=[("_id", -1)],
             return_document=ReturnDocument.AFTER,
         )
-        return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
+        if updated_otp_bson is not None:
+            return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
+
+        # Only a rejected code pays for a second query, to tell an expired code from an incorrect one
+        if OTPRepository.collection().find_one(otp_filter, projection={"_id": 1}) is not None:
+            raise OTPExpiredError()
+
+        raise OTPIncorrectError()
+
+    @staticmethod
+    def _get_phone_number_filter(phone_number: PhoneNumber) -> dict[str, Any]:
+        # Matched by field rather than as an embedded document, which depends on field order and cannot use the
+        # compound index
+        return {
+            "phone_number.phone_number": phone_number.phone_number,
+            "phone_number.country_code": phone_number.country_code,
+        }
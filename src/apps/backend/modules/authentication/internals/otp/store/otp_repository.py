@@ -3,6 +3,7 @@ from pymongo.errors import OperationFailure
 
 from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 OTP_VALIDATION_SCHEMA = {
@@ -35,8 +36,19 @@ class OTPRepository(ApplicationRepository):
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
+        # Replaced by the compound index, which also serves lookups by phone number
+        if "phone_number_1" in collection.index_information():
+            collection.drop_index("phone_number_1")
 
-        collection.create_index("phone_number")
+        collection.create_index(
+            [("phone_number.phone_number", 1), ("phone_number.country_code", 1), ("active", 1), ("otp_code", 1)],
+            name="phone_number_active_otp_code_index",
+        )
+        collection.create_index(
+            "created_at",
+            name="created_at_ttl_index",
+            expireAfterSeconds=ConfigService[int].get_value(key="accounts.otp_retention_in_seconds"),
+        )
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": OTP_VALIDATION_SCHEMA,
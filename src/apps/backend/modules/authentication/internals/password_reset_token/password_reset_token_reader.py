@@ -12,27 +12,27 @@ from modules.authentication.types import PasswordResetToken
 class PasswordResetTokenReader:
     @staticmethod
     def get_password_reset_token_by_account_id(account_id: str) -> PasswordResetToken:
-        cursor = (
-            PasswordResetTokenRepository.collection().find({"account": ObjectId(account_id)}).sort("expires_at", -1)
+        token_bson = PasswordResetTokenRepository.collection().find_one(
+            {"account": ObjectId(account_id)}, sort=[("expires_at", -1)]
         )
-
-        try:
-            token_data = next(cursor)
-        except StopIteration:
+        if token_bson is None:
             raise PasswordResetTokenNotFoundError()
 
-        return PasswordResetToken(
-            id=str(token_data.get("_id")),
-            is_expired=PasswordResetTokenUtil.is_token_expired(token_data.get("expires_at")),
-            account=token_data.get("account"),
-            token=token_data.get("token"),
-            expires_at=token_data.get("expires_at"),
-            is_used=token_data.get("is_used"),
-        )
+        return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(token_bson)
 
     @staticmethod
     def verify_password_reset_token(account_id: str, token: str) -> PasswordResetToken:
-        password_reset_token = PasswordResetTokenReader.get_password_reset_token_by_account_id(account_id)
+        token_bson = PasswordResetTokenRepository.collection().find_one(
+            {"token": PasswordResetTokenUtil.hash_password_reset_token(token), "account": ObjectId(account_id)}
+        )
+
+        # An unknown token is checked against the latest token of the account only to report why it is rejected
+        if token_bson is None:
+            password_reset_token = PasswordResetTokenReader.get_password_reset_token_by_account_id(account_id)
+        else:
+            password_reset_token = PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
+                token_bson
+            )
 
         if password_reset_token.is_expired:
             raise AccountBadRequestError(
@@ -43,8 +43,8 @@ class PasswordResetTokenReader:
                 f"Password reset is already used for accountId {account_id}. Please retry with new link"
             )
 
-        is_token_valid = PasswordResetTokenUtil.compare_password(
-            password=token, hashed_password=password_reset_token.token
+        is_token_valid = PasswordResetTokenUtil.compare_password_reset_token(
+            reset_token=token, token_hash=password_reset_token.token
         )
         if not is_token_valid:
             raise AccountBadRequestError(
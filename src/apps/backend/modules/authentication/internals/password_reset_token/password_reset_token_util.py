@@ -1,10 +1,9 @@
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
@@ -14,21 +13,18 @@ from modules.config.config_service import ConfigService
 
 class PasswordResetTokenUtil:
 
-    @staticmethod
-    def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
-
-    @staticmethod
-    def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
-
     @staticmethod
     def generate_password_reset_token() -> str:
         return hashlib.sha256(os.urandom(60)).hexdigest()
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        return bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        # Reset tokens are 256 random bits, so a fast digest is as hard to reverse as bcrypt and can be indexed
+        return hashlib.sha256(reset_token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def compare_password_reset_token(*, reset_token: str, token_hash: str) -> bool:
+        return hmac.compare_digest(PasswordResetTokenUtil.hash_password_reset_token(reset_token), token_hash)
 
     @staticmethod
     def get_token_expires_at() -> datetime:
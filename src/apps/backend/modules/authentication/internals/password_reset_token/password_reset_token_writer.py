@@ -15,6 +15,11 @@ class PasswordResetTokenWriter:
         token_hash = PasswordResetTokenUtil.hash_password_reset_token(token)
         expires_at = PasswordResetTokenUtil.get_token_expires_at()
 
+        # Only the latest link of an account may reset its password, earlier ones are revoked as used
+        PasswordResetTokenRepository.collection().update_many(
+            {"account": ObjectId(account_id), "is_used": False}, {"$set": {"is_used": True}}
+        )
+
         new_token_data = {
             "account": ObjectId(account_id),
             "expires_at": expires_at,
@@ -22,12 +27,9 @@ class PasswordResetTokenWriter:
             "is_used": False,
         }
         created_token = PasswordResetTokenRepository.collection().insert_one(new_token_data)
-        password_reset_token_bson = PasswordResetTokenRepository.collection().find_one(
-            {"_id": created_token.inserted_id}
-        )
 
         return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(
-            password_reset_token_bson
+            {**new_token_data, "_id": created_token.inserted_id}
         )
 
     @staticmethod
@@ -41,3 +43,9 @@ class PasswordResetTokenWriter:
             raise PasswordResetTokenNotFoundError()
 
         return PasswordResetTokenUtil.convert_password_reset_token_bson_to_password_reset_token(updated_token)
+
+    @staticmethod
+    def set_password_reset_tokens_as_used_by_account_id(*, account_id: str, batch_size: int) -> int:
+        return PasswordResetTokenRepository.update_many_in_batch(
+            {"account": ObjectId(account_id), "is_used": False}, {"$set": {"is_used": True}}, batch_size
+        )
@@ -5,6 +5,7 @@ from modules.application.repository import ApplicationRepository
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
+from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA = {
@@ -27,7 +28,18 @@ class PasswordResetTokenRepository(ApplicationRepository):
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index("token")
+        # Tokens used to be bcrypt hashes behind a non-unique index, which conflicts with the unique digest index
+        indexes = collection.index_information()
+        if "token_1" in indexes and not indexes["token_1"].get("unique"):
+            collection.drop_index("token_1")
+
+        collection.create_index("token", name="token_index", unique=True)
+        collection.create_index([("account", 1), ("expires_at", -1)], name="account_expires_at_index")
+        collection.create_index(
+            "expires_at",
+            name="expires_at_ttl_index",
+            expireAfterSeconds=ConfigService[int].get_value(key="accounts.password_reset_token_retention_in_seconds"),
+        )
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA,
@@ -18,3 +18,29 @@ class ConfigService(Generic[ConfigType]):
     @classmethod
     def has_value(cls, key: str) -> bool:
         return cls.config_manager.has(key)
+
+    @classmethod
+    def bind(cls, key: str, default: Optional[ConfigType] = None) -> "ConfigAccessor[ConfigType]":
+        return ConfigAccessor(key=key, default=default)
+
+
+class ConfigAccessor(Generic[ConfigType]):
+    """
+    Typed accessor for a single config key, bound once at import with `ConfigService[T].bind(...)` and called
+    on hot paths. The value is resolved on the first call and then served from memory until a new
+    `ConfigManager` replaces the current one. A missing key raises `MissingKeyError` on every call, as
+    `ConfigService.get_value` does.
+    """
+
+    def __init__(self, key: str, default: Optional[ConfigType] = None) -> None:
+        self.key = key
+        self.default = default
+        self._config_manager: Optional[ConfigManager] = None
+        self._value: Optional[ConfigType] = None
+
+    def __call__(self) -> ConfigType:
+        config_manager = ConfigService.config_manager
+        if config_manager is not self._config_manager:
+            self._value = ConfigService[ConfigType].get_value(key=self.key, default=self.default)
+            self._config_manager = config_manager
+        return cast(ConfigType, self._value)
@@ -1,10 +1,11 @@
-from typing import Optional, cast
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, cast
 
 from modules.config.internals.config_files.app_env_config_file import AppEnvConfig
 from modules.config.internals.config_files.custom_env_config_file import CustomEnvConfig
 from modules.config.internals.config_files.default_config_file import DefaultConfig
 from modules.config.internals.config_utils import ConfigUtil
-from modules.config.internals.types import Config
+from modules.config.internals.types import AllowedConfigValueTypes, Config
 from modules.config.types import ConfigType
 
 
@@ -21,24 +22,29 @@ class ConfigManager:
 
         self.config_store: Config = merged_content
 
+        # Every dotted key, sections included, is resolved once here so a lookup is a single dict access
+        self.compiled_config: Mapping[str, AllowedConfigValueTypes] = MappingProxyType(
+            ConfigManager._compile_config(merged_content)
+        )
+
     def get(self, key: str, default: Optional[ConfigType] = None) -> Optional[ConfigType]:
-        value = self._traverse_config(key)
-        return value if value is not None else default
+        value = self.compiled_config.get(key)
+        return cast(ConfigType, value) if value is not None else default
 
     def has(self, key: str) -> bool:
-        return self._traverse_config(key) is not None
-
-    def _traverse_config(self, key: str) -> Optional[ConfigType]:
-        values = self.config_store
-        for k in key.split(self.CONFIG_KEY_SEPARATOR):
-            if not isinstance(values, dict) or k not in values:
-                return None
+        return self.compiled_config.get(key) is not None
 
-            next_values = values[k]
+    @staticmethod
+    def _compile_config(config: Config, prefix: str = "") -> Dict[str, AllowedConfigValueTypes]:
+        compiled_config: Dict[str, AllowedConfigValueTypes] = {}
 
-            if not isinstance(next_values, dict):
-                return cast(ConfigType, next_values)
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            compiled_config[path] = value
 
-            values = next_values
+            if isinstance(value, dict):
+                compiled_config.update(
+                    ConfigManager._compile_config(value, prefix=f"{path}{ConfigManager.CONFIG_KEY_SEPARATOR}")
+                )
 
-        return cast(ConfigType, values)
+        return compiled_config
@@ -10,6 +10,10 @@ from modules.config.config_service import ConfigService
 
 
 class DatadogHandler(StreamHandler):
+    API_KEY = ConfigService[str].bind(key="datadog.api_key")
+    SITE_NAME = ConfigService[str].bind(key="datadog.site_name")
+    APP_NAME = ConfigService[str].bind(key="datadog.app_name")
+
     def __init__(self, ddsource: str) -> None:
         StreamHandler.__init__(self)
         self.ddsource = ddsource
@@ -24,9 +28,9 @@ class DatadogHandler(StreamHandler):
 
     def emit(self, record: LogRecord) -> None:
         msg = self.format(record)
-        datadog_api_key = ConfigService[str].get_value(key="datadog.api_key")
-        datadog_host = ConfigService[str].get_value(key="datadog.site_name")
-        data_app_name = ConfigService[str].get_value(key="datadog.app_name")
+        datadog_api_key = DatadogHandler.API_KEY()
+        datadog_host = DatadogHandler.SITE_NAME()
+        data_app_name = DatadogHandler.APP_NAME()
         config = Configuration()
         config.api_key["apiKeyAuth"] = datadog_api_key
         config.server_variables["site"] = datadog_host
@@ -0,0 +1,41 @@
+from dataclasses import asdict
+
+from modules.notification.internals.notification_digest_writer import NotificationDigestWriter
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.twilio_params import SMSParams
+from modules.notification.types import NotificationChannel, SendEmailParams, SendSMSParams
+
+
+class DigestService:
+    """
+    Buffers notifications per account instead of sending them right away. `NotificationDigestFlushWorker` sends
+    each buffer as one email or SMS once the channel's `notifications.digest.<channel>.window_in_seconds` is over.
+    Preferences are checked when the digest is sent.
+    """
+
+    @staticmethod
+    def add_email_to_digest(*, account_id: str, params: SendEmailParams) -> None:
+        # Emails are coalesced per template, which renders the template data of all of them
+        EmailParams.validate(params)
+        NotificationDigestWriter.add_item(
+            account_id=account_id,
+            channel=NotificationChannel.EMAIL,
+            digest_key=params.template_id,
+            payload={
+                "recipient": asdict(params.recipient),
+                "sender": asdict(params.sender),
+                "template_id": params.template_id,
+            },
+            item=params.template_data or {},
+        )
+
+    @staticmethod
+    def add_sms_to_digest(*, account_id: str, params: SendSMSParams) -> None:
+        SMSParams.validate(params)
+        NotificationDigestWriter.add_item(
+            account_id=account_id,
+            channel=NotificationChannel.SMS,
+            digest_key="",
+            payload={"recipient_phone": asdict(params.recipient_phone)},
+            item={"message_body": params.message_body},
+        )
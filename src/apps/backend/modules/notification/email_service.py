@@ -1,12 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Dict, List, Tuple
+
+from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
-from modules.notification.internals.sendgrid_service import SendGridService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendEmailParams
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.sendgrid_email_params import EmailParams
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.errors import ValidationError
+from modules.notification.types import BulkEmailResult, NotificationChannel, SendEmailForAccountParams, SendEmailParams
 
 
 class EmailService:
+    SYNCHRONOUS = ConfigService[bool].bind(key="notifications.outbox.synchronous", default=False)
+    MAX_PERSONALIZATIONS_PER_REQUEST = ConfigService[int].bind(
+        key="notifications.bulk_email.max_personalizations_per_request"
+    )
+    BULK_MAX_CONCURRENCY = ConfigService[int].bind(key="notifications.bulk_email.max_concurrency")
+
     @staticmethod
-    def send_email_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendEmailParams) -> None:
+    def send_email_for_account(
+        *, account_id: str, bypass_preferences: bool = False, contains_secret: bool = False, params: SendEmailParams
+    ) -> None:
         if not bypass_preferences:
             preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
                 account_id
@@ -19,4 +35,72 @@ class EmailService:
                 )
                 return
 
-        return SendGridService.send_email(params)
+        if EmailService.SYNCHRONOUS():
+            return SendGridService.send_email(params)
+
+        # Validated here so invalid params still fail the request instead of being dead-lettered by the dispatcher
+        EmailParams.validate(params)
+        NotificationOutboxWriter.create_message(
+            account_id=account_id,
+            channel=NotificationChannel.EMAIL,
+            contains_secret=contains_secret,
+            payload=asdict(params),
+        )
+
+    @staticmethod
+    def send_bulk_emails(
+        *, params_list: List[SendEmailForAccountParams], bypass_preferences: bool = False
+    ) -> BulkEmailResult:
+        """
+        Sends many emails with one SendGrid request per template, sender and up to
+        `notifications.bulk_email.max_personalizations_per_request` recipients. Meant for workers sending broadcasts
+        or digests, so it calls SendGrid directly instead of going through the outbox.
+        """
+        skipped = 0
+        failed = 0
+        preferences_by_account_id = (
+            {}
+            if bypass_preferences
+            else AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(
+                list({account_params.account_id for account_params in params_list})
+            )
+        )
+
+        # SendGrid applies one template and sender to all personalizations of a request
+        groups: Dict[Tuple[str, str, str], List[SendEmailParams]] = {}
+        for account_params in params_list:
+            params = account_params.params
+            if not bypass_preferences:
+                preferences = preferences_by_account_id.get(account_params.account_id)
+                if preferences is None or not preferences.email_enabled:
+                    skipped += 1
+                    continue
+
+            try:
+                EmailParams.validate(params)
+            except ValidationError as e:
+                Logger.error(message=f"Email to {params.recipient.email} not sent: {e.message}")
+                failed += 1
+                continue
+
+            groups.setdefault((params.template_id, params.sender.email, params.sender.name), []).append(params)
+
+        chunk_size = EmailService.MAX_PERSONALIZATIONS_PER_REQUEST()
+        chunks = [
+            group[index : index + chunk_size] for group in groups.values() for index in range(0, len(group), chunk_size)
+        ]
+
+        sent = 0
+        with ThreadPoolExecutor(max_workers=EmailService.BULK_MAX_CONCURRENCY()) as executor:
+            futures = [(chunk, executor.submit(SendGridService.send_personalized_emails, chunk)) for chunk in chunks]
+            for chunk, future in futures:
+                try:
+                    future.result()
+                    sent += len(chunk)
+                except Exception as e:
+                    Logger.error(
+                        message=f"Bulk email using template {chunk[0].template_id} failed for {len(chunk)} recipients: {e}"
+                    )
+                    failed += len(chunk)
+
+        return BulkEmailResult(failed=failed, sent=sent, skipped=skipped)
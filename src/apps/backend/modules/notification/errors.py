@@ -27,7 +27,9 @@ class AccountNotificationPreferencesNotFoundError(AppError):
 
 class ServiceError(AppError):
     def __init__(self, err: Exception) -> None:
-        super().__init__(message=err.args[2], code=NotificationErrorCode.SERVICE_ERROR)
+        # Twilio REST errors carry the provider message third, other errors are formatted as they are
+        message = err.args[2] if len(err.args) > 2 else str(err)
+        super().__init__(message=message, code=NotificationErrorCode.SERVICE_ERROR)
         self.code = NotificationErrorCode.SERVICE_ERROR
         self.stack = getattr(err, "stack", None)
         self.http_status_code = 503
@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional
+
+from modules.application.common.ttl_cache import TTLCache
+from modules.config.config_service import ConfigService
+from modules.notification.types import AccountNotificationPreferences, CachedAccountNotificationPreferences
+
+
+class AccountNotificationPreferencesCache:
+    """
+    Per-process cache of active preferences by account id, filled by `AccountNotificationPreferenceReader` and
+    kept current by `AccountNotificationPreferenceWriter`. Writes in other server processes are only seen once
+    the entry expires, so `ttl_in_seconds` bounds how long a send can use outdated preferences. Accounts without
+    preferences are cached too, for the shorter `not_found_ttl_in_seconds`, since another process may create them.
+    """
+
+    CACHE: Optional[TTLCache[str, CachedAccountNotificationPreferences]] = None
+    ENABLED = ConfigService[bool].bind(key="notifications.preferences_cache.enabled", default=False)
+    NOT_FOUND_TTL_IN_SECONDS = ConfigService[float].bind(key="notifications.preferences_cache.not_found_ttl_in_seconds")
+
+    @staticmethod
+    def get(account_id: str) -> Optional[CachedAccountNotificationPreferences]:
+        cache = AccountNotificationPreferencesCache._get_cache()
+        return cache.get(account_id) if cache is not None else None
+
+    @staticmethod
+    def get_many(account_ids: List[str]) -> Dict[str, CachedAccountNotificationPreferences]:
+        cache = AccountNotificationPreferencesCache._get_cache()
+        if cache is None:
+            return {}
+
+        cached_preferences = {}
+        for account_id in account_ids:
+            cached = cache.get(account_id)
+            if cached is not None:
+                cached_preferences[account_id] = cached
+        return cached_preferences
+
+    @staticmethod
+    def set(preferences: AccountNotificationPreferences) -> None:
+        # Also replaces a not found entry, so preferences created by this process are used right away
+        cache = AccountNotificationPreferencesCache._get_cache()
+        if cache is not None:
+            cache.set(preferences.account_id, CachedAccountNotificationPreferences(preferences=preferences))
+
+    @staticmethod
+    def set_not_found(account_id: str) -> None:
+        cache = AccountNotificationPreferencesCache._get_cache()
+        if cache is not None:
+            cache.set(
+                account_id,
+                CachedAccountNotificationPreferences(preferences=None),
+                ttl_in_seconds=AccountNotificationPreferencesCache.NOT_FOUND_TTL_IN_SECONDS(),
+            )
+
+    @staticmethod
+    def delete(account_id: str) -> None:
+        cache = AccountNotificationPreferencesCache._get_cache()
+        if cache is not None:
+            cache.delete(account_id)
+
+    @staticmethod
+    def _get_cache() -> Optional[TTLCache[str, CachedAccountNotificationPreferences]]:
+        if AccountNotificationPreferencesCache.CACHE is None and AccountNotificationPreferencesCache.ENABLED():
+            AccountNotificationPreferencesCache.CACHE = TTLCache(
+                ttl_in_seconds=ConfigService[float].get_value(key="notifications.preferences_cache.ttl_in_seconds"),
+                max_size=ConfigService[int].get_value(key="notifications.preferences_cache.max_size"),
+            )
+        return AccountNotificationPreferencesCache.CACHE
@@ -1,6 +1,9 @@
+from typing import Any, Dict, List, Optional
+
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import AccountNotificationPreferences
@@ -9,13 +12,78 @@ from modules.notification.types import AccountNotificationPreferences
 class AccountNotificationPreferenceReader:
     @staticmethod
     def get_account_notification_preferences_by_account_id(account_id: str) -> AccountNotificationPreferences:
+        cached = AccountNotificationPreferencesCache.get(account_id)
+        if cached is not None:
+            if cached.preferences is None:
+                raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
+            return cached.preferences
+
         notification_preferences = AccountNotificationPreferencesRepository.collection().find_one(
             {"account_id": account_id, "active": True}
         )
 
         if notification_preferences is None:
+            AccountNotificationPreferencesCache.set_not_found(account_id)
             raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
 
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+        preferences = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             notification_preferences
         )
+        AccountNotificationPreferencesCache.set(preferences)
+        return preferences
+
+    @staticmethod
+    def get_account_notification_preferences_by_account_ids(
+        account_ids: List[str],
+    ) -> Dict[str, AccountNotificationPreferences]:
+        # Accounts without preferences are left out of the result
+        cached_by_account_id = AccountNotificationPreferencesCache.get_many(account_ids)
+        preferences_by_account_id = {
+            account_id: cached.preferences
+            for account_id, cached in cached_by_account_id.items()
+            if cached.preferences is not None
+        }
+        uncached_account_ids = [account_id for account_id in account_ids if account_id not in cached_by_account_id]
+        if not uncached_account_ids:
+            return preferences_by_account_id
+
+        notification_preferences_bsons = AccountNotificationPreferencesRepository.collection().find(
+            {"account_id": {"$in": uncached_account_ids}, "active": True}
+        )
+        for notification_preferences in notification_preferences_bsons:
+            preferences = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+                notification_preferences
+            )
+            AccountNotificationPreferencesCache.set(preferences)
+            preferences_by_account_id[preferences.account_id] = preferences
+
+        for account_id in uncached_account_ids:
+            if account_id not in preferences_by_account_id:
+                AccountNotificationPreferencesCache.set_not_found(account_id)
+
+        return preferences_by_account_id
+
+    @staticmethod
+    def get_account_notification_preferences_lookup_stage(*, local_field: str, as_field: str) -> dict[str, Any]:
+        # The equality join on the indexed account_id is combined with a sub-pipeline (MongoDB 5.0+), so only the
+        # active preferences are joined and inactive ones never leave the database
+        return {
+            "$lookup": {
+                "from": AccountNotificationPreferencesRepository.collection_name,
+                "localField": local_field,
+                "foreignField": "account_id",
+                "pipeline": [{"$match": {"active": True}}, {"$limit": 1}],
+                "as": as_field,
+            }
+        }
+
+    @staticmethod
+    def get_active_account_notification_preferences(
+        notification_preferences_bsons: List[dict[str, Any]]
+    ) -> Optional[AccountNotificationPreferences]:
+        if not notification_preferences_bsons:
+            return None
+
+        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+            notification_preferences_bsons[0]
+        )
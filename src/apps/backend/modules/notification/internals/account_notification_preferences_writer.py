@@ -2,15 +2,11 @@ from datetime import datetime
 from typing import Any
 from pymongo import ReturnDocument
 
-from modules.notification.internals.store.account_notification_preferences_model import (
-    AccountNotificationPreferencesModel,
-)
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
-from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import (
     CreateOrUpdateAccountNotificationPreferencesParams,
     AccountNotificationPreferences,
@@ -19,29 +15,11 @@ from modules.notification.types import (
 
 class AccountNotificationPreferenceWriter:
     @staticmethod
-    def _create_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        preferences_model = AccountNotificationPreferencesModel(
-            account_id=account_id,
-            id=None,
-            email_enabled=preferences.email_enabled if preferences.email_enabled is not None else True,
-            push_enabled=preferences.push_enabled if preferences.push_enabled is not None else True,
-            sms_enabled=preferences.sms_enabled if preferences.sms_enabled is not None else True,
-        ).to_bson()
-
-        query = AccountNotificationPreferencesRepository.collection().insert_one(preferences_model)
-        created_preferences = AccountNotificationPreferencesRepository.collection().find_one({"_id": query.inserted_id})
-
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
-            created_preferences
-        )
-
-    @staticmethod
-    def _update_account_notification_preferences(
+    def create_or_update_account_notification_preferences(
         account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
     ) -> AccountNotificationPreferences:
-        update_data: dict[str, Any] = {"updated_at": datetime.now()}
+        now = datetime.now()
+        update_data: dict[str, Any] = {"updated_at": now}
 
         if preferences.email_enabled is not None:
             update_data["email_enabled"] = preferences.email_enabled
@@ -52,20 +30,31 @@ class AccountNotificationPreferenceWriter:
         if preferences.sms_enabled is not None:
             update_data["sms_enabled"] = preferences.sms_enabled
 
+        # Channels left out of the params keep their value, or default to enabled when the preferences are created
+        insert_data: dict[str, Any] = {"created_at": now}
+        for channel in ["email_enabled", "push_enabled", "sms_enabled"]:
+            if channel not in update_data:
+                insert_data[channel] = True
+
         updated_preferences = AccountNotificationPreferencesRepository.collection().find_one_and_update(
-            {"account_id": account_id, "active": True}, {"$set": update_data}, return_document=ReturnDocument.AFTER
+            {"account_id": account_id, "active": True},
+            {"$set": update_data, "$setOnInsert": insert_data},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
         )
 
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+        account_notification_preferences = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             updated_preferences
         )
+        AccountNotificationPreferencesCache.set(account_notification_preferences)
+        return account_notification_preferences
 
     @staticmethod
-    def create_or_update_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        try:
-            AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
-            return AccountNotificationPreferenceWriter._update_account_notification_preferences(account_id, preferences)
-        except AccountNotificationPreferencesNotFoundError:
-            return AccountNotificationPreferenceWriter._create_account_notification_preferences(account_id, preferences)
+    def deactivate_account_notification_preferences_by_account_id(*, account_id: str, batch_size: int) -> int:
+        deactivated_count = AccountNotificationPreferencesRepository.update_many_in_batch(
+            {"account_id": account_id, "active": True},
+            {"$set": {"active": False, "updated_at": datetime.now()}},
+            batch_size,
+        )
+        AccountNotificationPreferencesCache.delete(account_id)
+        return deactivated_count
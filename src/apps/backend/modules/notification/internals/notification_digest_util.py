@@ -0,0 +1,76 @@
+from typing import Any
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.internals.store.notification_digest_model import NotificationDigestModel
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    NotificationDigest,
+    SendEmailParams,
+    SendSMSParams,
+)
+
+
+class NotificationDigestUtil:
+    @staticmethod
+    def convert_notification_digest_bson_to_notification_digest(
+        notification_digest_bson: dict[str, Any]
+    ) -> NotificationDigest:
+        validated_digest_data = NotificationDigestModel.from_bson(notification_digest_bson)
+        return NotificationDigest(
+            id=str(validated_digest_data.id),
+            account_id=validated_digest_data.account_id,
+            channel=NotificationChannel(validated_digest_data.channel),
+            claim_id=validated_digest_data.claim_id,
+            item_count=validated_digest_data.item_count,
+            items=validated_digest_data.items,
+            payload=validated_digest_data.payload,
+        )
+
+    @staticmethod
+    def get_window_in_seconds(channel: NotificationChannel) -> int:
+        return ConfigService[int].get_value(key=f"notifications.digest.{channel.lower()}.window_in_seconds")
+
+    @staticmethod
+    def get_max_items(channel: NotificationChannel) -> int:
+        return ConfigService[int].get_value(key=f"notifications.digest.{channel.lower()}.max_items")
+
+    @staticmethod
+    def convert_digest_to_send_email_params(digest: NotificationDigest) -> SendEmailParams:
+        # A single email is sent as it was added, the event templates cannot render the list of a digest
+        if digest.item_count == 1:
+            template_id = digest.payload["template_id"]
+            template_data = digest.items[0]
+        else:
+            # The digest template renders the template data of each buffered email, and the count of those left
+            # out of the buffer. The template of the buffered emails lets it tell the kinds of digest apart
+            template_id = ConfigService[str].get_value(key="notifications.digest.email.template_id")
+            template_data = {
+                "notifications": digest.items,
+                "notification_count": digest.item_count,
+                "notification_template_id": digest.payload["template_id"],
+            }
+
+        return SendEmailParams(
+            recipient=EmailRecipient(**digest.payload["recipient"]),
+            sender=EmailSender(**digest.payload["sender"]),
+            template_id=template_id,
+            template_data=template_data,
+        )
+
+    @staticmethod
+    def convert_digest_to_send_sms_params(digest: NotificationDigest) -> SendSMSParams:
+        message_bodies = [item["message_body"] for item in digest.items]
+        if digest.item_count == 1:
+            message_body = message_bodies[0]
+        else:
+            lines = [f"You have {digest.item_count} new notifications:", *message_bodies]
+            if digest.item_count > len(message_bodies):
+                lines.append(f"and {digest.item_count - len(message_bodies)} more")
+            message_body = "\n".join(lines)
+
+        return SendSMSParams(
+            message_body=message_body, recipient_phone=PhoneNumber(**digest.payload["recipient_phone"])
+        )
@@ -0,0 +1,83 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, List
+
+from bson.objectid import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.store.notification_digest_repository import NotificationDigestRepository
+from modules.notification.types import NotificationChannel, NotificationDigest, NotificationDigestStatus
+
+
+class NotificationDigestWriter:
+    @staticmethod
+    def add_item(
+        *, account_id: str, channel: NotificationChannel, digest_key: str, payload: dict[str, Any], item: dict[str, Any]
+    ) -> None:
+        now = datetime.utcnow()
+        # The window starts with the first notification of the buffer, later ones do not push the flush back
+        buffer_filter = {
+            "account_id": account_id,
+            "channel": channel,
+            "digest_key": digest_key,
+            "status": NotificationDigestStatus.PENDING,
+        }
+        update = {
+            "$setOnInsert": {
+                "claim_id": None,
+                "created_at": now,
+                "flush_at": now + timedelta(seconds=NotificationDigestUtil.get_window_in_seconds(channel)),
+                "payload": payload,
+            },
+            "$set": {"updated_at": now},
+            "$push": {"items": {"$each": [item], "$slice": -NotificationDigestUtil.get_max_items(channel)}},
+            "$inc": {"item_count": 1},
+        }
+
+        try:
+            NotificationDigestRepository.collection().update_one(buffer_filter, update, upsert=True)
+        except DuplicateKeyError:
+            # A concurrent upsert opened the buffer first, the retry appends to it
+            NotificationDigestRepository.collection().update_one(buffer_filter, update, upsert=True)
+
+    @staticmethod
+    def claim_digests(*, batch_size: int, claim_timeout_in_seconds: int) -> List[NotificationDigest]:
+        now = datetime.utcnow()
+        # Claiming moves flush_at to the end of the lease, so the buffers of a worker that dies mid-flush become due
+        # again and are claimed by the next run
+        due_filter = {
+            "status": {"$in": [NotificationDigestStatus.PENDING, NotificationDigestStatus.FLUSHING]},
+            "flush_at": {"$lte": now},
+        }
+        digest_ids = [
+            digest["_id"]
+            for digest in NotificationDigestRepository.collection()
+            .find(due_filter, {"_id": 1})
+            .sort("flush_at", 1)
+            .limit(batch_size)
+        ]
+        if not digest_ids:
+            return []
+
+        claim_id = uuid.uuid4().hex
+        NotificationDigestRepository.collection().update_many(
+            {**due_filter, "_id": {"$in": digest_ids}},
+            {
+                "$set": {
+                    "status": NotificationDigestStatus.FLUSHING,
+                    "claim_id": claim_id,
+                    "flush_at": now + timedelta(seconds=claim_timeout_in_seconds),
+                    "updated_at": now,
+                }
+            },
+        )
+
+        return [
+            NotificationDigestUtil.convert_notification_digest_bson_to_notification_digest(digest_bson)
+            for digest_bson in NotificationDigestRepository.collection().find({"claim_id": claim_id})
+        ]
+
+    @staticmethod
+    def delete_digest(*, digest: NotificationDigest) -> None:
+        NotificationDigestRepository.collection().delete_one({"_id": ObjectId(digest.id), "claim_id": digest.claim_id})
@@ -0,0 +1,83 @@
+import json
+from typing import Any
+
+from cryptography.fernet import Fernet
+
+from modules.account.types import PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    NotificationOutboxMessage,
+    NotificationOutboxStatus,
+    SendEmailParams,
+    SendSMSParams,
+)
+
+
+class NotificationOutboxUtil:
+    RETRY_BACKOFF_INITIAL_IN_SECONDS = ConfigService[int].bind(
+        key="notifications.outbox.retry_backoff_initial_in_seconds"
+    )
+    RETRY_BACKOFF_MAX_IN_SECONDS = ConfigService[int].bind(key="notifications.outbox.retry_backoff_max_in_seconds")
+    SECRET_ENCRYPTION_KEY = ConfigService[str].bind(key="notifications.outbox.secret_encryption_key")
+    SECRET_TTL_IN_SECONDS = ConfigService[int].bind(key="notifications.outbox.secret_ttl_in_seconds")
+    ENCRYPTED_PAYLOAD_KEY = "encrypted"
+
+    @staticmethod
+    def convert_notification_outbox_bson_to_notification_outbox_message(
+        notification_outbox_bson: dict[str, Any]
+    ) -> NotificationOutboxMessage:
+        validated_message_data = NotificationOutboxModel.from_bson(notification_outbox_bson)
+        return NotificationOutboxMessage(
+            id=str(validated_message_data.id),
+            account_id=validated_message_data.account_id,
+            attempts=validated_message_data.attempts,
+            channel=NotificationChannel(validated_message_data.channel),
+            claim_id=validated_message_data.claim_id,
+            payload=validated_message_data.payload,
+            status=NotificationOutboxStatus(validated_message_data.status),
+        )
+
+    @staticmethod
+    def encrypt_payload(payload: dict[str, Any]) -> dict[str, Any]:
+        fernet = Fernet(NotificationOutboxUtil.SECRET_ENCRYPTION_KEY())
+        return {NotificationOutboxUtil.ENCRYPTED_PAYLOAD_KEY: fernet.encrypt(json.dumps(payload).encode()).decode()}
+
+    @staticmethod
+    def decrypt_payload(payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Returns the payload as it was queued. An encrypted payload older than `secret_ttl_in_seconds` raises
+        `cryptography.fernet.InvalidToken`, as does one encrypted with another key.
+        """
+        encrypted_payload = payload.get(NotificationOutboxUtil.ENCRYPTED_PAYLOAD_KEY)
+        if encrypted_payload is None:
+            return payload
+
+        fernet = Fernet(NotificationOutboxUtil.SECRET_ENCRYPTION_KEY())
+        decrypted_payload: dict[str, Any] = json.loads(
+            fernet.decrypt(encrypted_payload, ttl=NotificationOutboxUtil.SECRET_TTL_IN_SECONDS())
+        )
+        return decrypted_payload
+
+    @staticmethod
+    def convert_payload_to_send_email_params(payload: dict[str, Any]) -> SendEmailParams:
+        return SendEmailParams(
+            recipient=EmailRecipient(**payload["recipient"]),
+            sender=EmailSender(**payload["sender"]),
+            template_id=payload["template_id"],
+            template_data=payload.get("template_data"),
+        )
+
+    @staticmethod
+    def convert_payload_to_send_sms_params(payload: dict[str, Any]) -> SendSMSParams:
+        return SendSMSParams(
+            message_body=payload["message_body"], recipient_phone=PhoneNumber(**payload["recipient_phone"])
+        )
+
+    @staticmethod
+    def get_retry_delay_in_seconds(attempts: int) -> int:
+        backoff = NotificationOutboxUtil.RETRY_BACKOFF_INITIAL_IN_SECONDS() * 2 ** max(attempts - 1, 0)
+        return int(min(backoff, NotificationOutboxUtil.RETRY_BACKOFF_MAX_IN_SECONDS()))
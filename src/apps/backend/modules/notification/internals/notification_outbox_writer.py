@@ -0,0 +1,144 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, List
+
+from bson.objectid import ObjectId
+
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.types import NotificationChannel, NotificationOutboxMessage, NotificationOutboxStatus
+
+
+class NotificationOutboxWriter:
+    MAX_ATTEMPTS = ConfigService[int].bind(key="notifications.outbox.max_attempts")
+
+    @staticmethod
+    def create_message(
+        *, account_id: str, channel: NotificationChannel, contains_secret: bool = False, payload: dict[str, Any]
+    ) -> NotificationOutboxMessage:
+        """
+        Queues a message in its own insert. Mongo transactions are not used in this app, so the message is not
+        written atomically with the change that triggered it: callers queue it once that change is written.
+        A payload that contains a secret is stored encrypted, see `NotificationOutboxUtil.encrypt_payload`.
+        """
+        if contains_secret:
+            payload = NotificationOutboxUtil.encrypt_payload(payload)
+
+        now = datetime.utcnow()
+        message_bson = NotificationOutboxModel(
+            account_id=account_id,
+            channel=channel,
+            id=None,
+            next_attempt_at=now,
+            payload=payload,
+            status=NotificationOutboxStatus.PENDING,
+            created_at=now,
+            updated_at=now,
+        ).to_bson()
+
+        query = NotificationOutboxRepository.collection().insert_one(message_bson)
+        return NotificationOutboxUtil.convert_notification_outbox_bson_to_notification_outbox_message(
+            {**message_bson, "_id": query.inserted_id}
+        )
+
+    @staticmethod
+    def claim_messages(*, batch_size: int, claim_timeout_in_seconds: int) -> List[NotificationOutboxMessage]:
+        now = datetime.utcnow()
+        # Claiming moves next_attempt_at to the end of the lease, so the messages of a dispatcher that dies mid-send
+        # become due again and are claimed by the next one
+        due_filter = {
+            "status": {"$in": [NotificationOutboxStatus.PENDING, NotificationOutboxStatus.SENDING]},
+            "next_attempt_at": {"$lte": now},
+        }
+        message_ids = [
+            message["_id"]
+            for message in NotificationOutboxRepository.collection()
+            .find(due_filter, {"_id": 1})
+            .sort("next_attempt_at", 1)
+            .limit(batch_size)
+        ]
+        if not message_ids:
+            return []
+
+        claim_id = uuid.uuid4().hex
+        NotificationOutboxRepository.collection().update_many(
+            {**due_filter, "_id": {"$in": message_ids}},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.SENDING,
+                    "claim_id": claim_id,
+                    "next_attempt_at": now + timedelta(seconds=claim_timeout_in_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+        )
+
+        # Messages claimed by a concurrent dispatcher in between no longer match the due filter and are left out
+        return [
+            NotificationOutboxUtil.convert_notification_outbox_bson_to_notification_outbox_message(message_bson)
+            for message_bson in NotificationOutboxRepository.collection().find({"claim_id": claim_id})
+        ]
+
+    @staticmethod
+    def mark_message_as_sent(*, message: NotificationOutboxMessage) -> None:
+        now = datetime.utcnow()
+        NotificationOutboxRepository.collection().update_one(
+            {"_id": ObjectId(message.id), "claim_id": message.claim_id},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.SENT,
+                    "claim_id": None,
+                    "last_error": None,
+                    "sent_at": now,
+                    "updated_at": now,
+                }
+            },
+        )
+
+    @staticmethod
+    def mark_message_as_failed(
+        *, message: NotificationOutboxMessage, error: str, retryable: bool
+    ) -> NotificationOutboxStatus:
+        now = datetime.utcnow()
+        update: dict[str, Any] = {"claim_id": None, "last_error": error, "updated_at": now}
+
+        if retryable and message.attempts < NotificationOutboxWriter.MAX_ATTEMPTS():
+            status = NotificationOutboxStatus.PENDING
+            retry_delay = NotificationOutboxUtil.get_retry_delay_in_seconds(message.attempts)
+            update["next_attempt_at"] = now + timedelta(seconds=retry_delay)
+        else:
+            status = NotificationOutboxStatus.FAILED
+            Logger.error(
+                message=f"Dead-lettered {message.channel} notification {message.id} for account {message.account_id} "
+                f"after {message.attempts} attempts: {error}"
+            )
+
+        NotificationOutboxRepository.collection().update_one(
+            {"_id": ObjectId(message.id), "claim_id": message.claim_id}, {"$set": {**update, "status": status}}
+        )
+        return status
+
+    @staticmethod
+    def reschedule_message(
+        *, message: NotificationOutboxMessage, error: str, delay_in_seconds: float
+    ) -> NotificationOutboxStatus:
+        # The send was never attempted, so the attempt taken by the claim is given back
+        now = datetime.utcnow()
+        NotificationOutboxRepository.collection().update_one(
+            {"_id": ObjectId(message.id), "claim_id": message.claim_id},
+            {
+                "$set": {
+                    "status": NotificationOutboxStatus.PENDING,
+                    "claim_id": None,
+                    "last_error": error,
+                    "next_attempt_at": now + timedelta(seconds=delay_in_seconds),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": -1},
+            },
+        )
+        return NotificationOutboxStatus.PENDING
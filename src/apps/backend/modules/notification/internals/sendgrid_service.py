@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 
-import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+import requests
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
+from modules.application.common.http_client import HTTPClient
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
 from modules.notification.internals.sendgrid_email_params import EmailParams
@@ -10,7 +11,15 @@ from modules.notification.types import SendEmailParams
 
 
 class SendGridService:
-    __client: Optional[sendgrid.SendGridAPIClient] = None
+    """
+    Builds messages with the SendGrid helpers and posts them through a pooled `HTTPClient`, as the SendGrid
+    client opens a new connection per request and has no timeout by default.
+    """
+
+    __client: Optional[HTTPClient] = None
+
+    API_KEY = ConfigService[str].bind(key="sendgrid.api_key")
+    BASE_URL = ConfigService[str].bind(key="sendgrid.http.base_url")
 
     @staticmethod
     def send_email(params: SendEmailParams) -> None:
@@ -20,16 +29,43 @@ class SendGridService:
         message.template_id = TemplateId(params.template_id)
         message.dynamic_template_data = params.template_data
 
-        try:
-            client = SendGridService.get_client()
-            client.send(message)
+        SendGridService._send(message)
 
-        except sendgrid.SendGridException as err:
-            raise ServiceError(err)
+    @staticmethod
+    def send_personalized_emails(params_list: List[SendEmailParams]) -> None:
+        """
+        Sends one request with a personalization per params, which must all share the template and the sender
+        """
+        for params in params_list:
+            EmailParams.validate(params)
+
+        sender = params_list[0].sender
+        message = Mail(from_email=From(sender.email, sender.name))
+        message.template_id = TemplateId(params_list[0].template_id)
+        for params in params_list:
+            personalization = Personalization()
+            personalization.add_to(To(params.recipient.email))
+            personalization.dynamic_template_data = params.template_data
+            message.add_personalization(personalization)
+
+        SendGridService._send(message)
 
     @staticmethod
-    def get_client() -> sendgrid.SendGridAPIClient:
+    def get_client() -> HTTPClient:
         if not SendGridService.__client:
-            api_key = ConfigService[str].get_value(key="sendgrid.api_key")
-            SendGridService.__client = sendgrid.SendGridAPIClient(api_key=api_key)
+            SendGridService.__client = HTTPClient.from_config(name="SendGrid", key="sendgrid.http")
         return SendGridService.__client
+
+    @staticmethod
+    def _send(message: Mail) -> None:
+        try:
+            response = SendGridService.get_client().request(
+                "POST",
+                f"{SendGridService.BASE_URL()}/v3/mail/send",
+                json=message.get(),
+                headers={"Authorization": f"Bearer {SendGridService.API_KEY()}"},
+            )
+            response.raise_for_status()
+
+        except requests.RequestException as err:
+            raise ServiceError(err)
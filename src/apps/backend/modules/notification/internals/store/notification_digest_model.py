@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class NotificationDigestModel(BaseModel):
+    account_id: str
+    channel: str
+    digest_key: str
+    flush_at: datetime
+    id: Optional[ObjectId | str]
+    payload: Dict[str, Any]
+    status: str
+
+    claim_id: Optional[str] = None
+    item_count: int = 0
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: Optional[datetime] = field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "NotificationDigestModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            channel=bson_data.get("channel", ""),
+            claim_id=bson_data.get("claim_id"),
+            digest_key=bson_data.get("digest_key", ""),
+            flush_at=bson_data.get("flush_at", datetime.utcnow()),
+            id=bson_data.get("_id"),
+            item_count=bson_data.get("item_count", 0),
+            items=bson_data.get("items", []),
+            payload=bson_data.get("payload", {}),
+            status=bson_data.get("status", ""),
+            created_at=bson_data.get("created_at"),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "notification_digests"
@@ -0,0 +1,60 @@
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.logger.logger import Logger
+from modules.notification.internals.store.notification_digest_model import NotificationDigestModel
+from modules.notification.types import NotificationChannel, NotificationDigestStatus
+
+NOTIFICATION_DIGEST_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account_id", "channel", "digest_key", "flush_at", "item_count", "items", "payload", "status"],
+        "properties": {
+            "account_id": {"bsonType": "string"},
+            "channel": {"enum": [channel.value for channel in NotificationChannel]},
+            "claim_id": {"bsonType": ["string", "null"]},
+            "digest_key": {"bsonType": "string"},
+            "flush_at": {"bsonType": "date"},
+            "item_count": {"bsonType": "int"},
+            "items": {"bsonType": "array", "items": {"bsonType": "object"}},
+            "payload": {"bsonType": "object"},
+            "status": {"enum": [status.value for status in NotificationDigestStatus]},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+        },
+    }
+}
+
+
+class NotificationDigestRepository(ApplicationRepository):
+    collection_name = NotificationDigestModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # One open buffer per account and digest, notifications added while it is flushed start the next one
+        collection.create_index(
+            [("account_id", 1), ("channel", 1), ("digest_key", 1)],
+            name="pending_account_id_channel_digest_key_index",
+            unique=True,
+            partialFilterExpression={"status": NotificationDigestStatus.PENDING.value},
+        )
+        # Serves the flush claim, which looks for pending or lease-expired buffers whose window is over
+        collection.create_index([("status", 1), ("flush_at", 1)], name="status_flush_at_index")
+
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": NOTIFICATION_DIGEST_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:
+                collection.database.create_collection(
+                    cls.collection_name, validator=NOTIFICATION_DIGEST_VALIDATION_SCHEMA
+                )
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection notification_digests: {e.details}")
+        return True
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class NotificationOutboxModel(BaseModel):
+    account_id: str
+    channel: str
+    id: Optional[ObjectId | str]
+    next_attempt_at: datetime
+    payload: Dict[str, Any]
+    status: str
+
+    attempts: int = 0
+    claim_id: Optional[str] = None
+    last_error: Optional[str] = None
+    sent_at: Optional[datetime] = None
+    created_at: Optional[datetime] = field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "NotificationOutboxModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            attempts=bson_data.get("attempts", 0),
+            channel=bson_data.get("channel", ""),
+            claim_id=bson_data.get("claim_id"),
+            id=bson_data.get("_id"),
+            last_error=bson_data.get("last_error"),
+            next_attempt_at=bson_data.get("next_attempt_at", datetime.utcnow()),
+            payload=bson_data.get("payload", {}),
+            sent_at=bson_data.get("sent_at"),
+            status=bson_data.get("status", ""),
+            created_at=bson_data.get("created_at"),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "notification_outbox"
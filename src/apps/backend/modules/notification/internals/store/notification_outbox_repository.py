@@ -0,0 +1,60 @@
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.internals.store.notification_outbox_model import NotificationOutboxModel
+from modules.notification.types import NotificationChannel, NotificationOutboxStatus
+
+NOTIFICATION_OUTBOX_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account_id", "attempts", "channel", "next_attempt_at", "payload", "status"],
+        "properties": {
+            "account_id": {"bsonType": "string"},
+            "attempts": {"bsonType": "int"},
+            "channel": {"enum": [channel.value for channel in NotificationChannel]},
+            "claim_id": {"bsonType": ["string", "null"]},
+            "last_error": {"bsonType": ["string", "null"]},
+            "next_attempt_at": {"bsonType": "date"},
+            "payload": {"bsonType": "object"},
+            "sent_at": {"bsonType": ["date", "null"]},
+            "status": {"enum": [status.value for status in NotificationOutboxStatus]},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+        },
+    }
+}
+
+
+class NotificationOutboxRepository(ApplicationRepository):
+    collection_name = NotificationOutboxModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # Serves the dispatcher claim, which looks for pending or lease-expired messages that are due
+        collection.create_index([("status", 1), ("next_attempt_at", 1)], name="status_next_attempt_at_index")
+        collection.create_index(
+            "sent_at",
+            name="sent_at_ttl_index",
+            expireAfterSeconds=ConfigService[int].get_value(key="notifications.outbox.sent_retention_in_seconds"),
+            partialFilterExpression={"status": NotificationOutboxStatus.SENT.value},
+        )
+
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": NOTIFICATION_OUTBOX_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:
+                collection.database.create_collection(
+                    cls.collection_name, validator=NOTIFICATION_OUTBOX_VALIDATION_SCHEMA
+                )
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection notification_outbox: {e.details}")
+        return True
@@ -1,16 +1,56 @@
-from typing import Optional
+import logging
+from typing import Dict, Optional, Tuple
 
+import requests
 from twilio.base.exceptions import TwilioException
+from twilio.http import HttpClient
+from twilio.http.response import Response
 from twilio.rest import Client
 
+from modules.application.common.http_client import HTTPClient
 from modules.config.config_service import ConfigService
 from modules.notification.errors import ServiceError
 from modules.notification.internals.twilio_params import SMSParams
 from modules.notification.types import SendSMSParams
 
 
+class TwilioHTTPClient(HttpClient):
+    """
+    Adapts a pooled `HTTPClient` to the interface the Twilio client sends its requests through
+    """
+
+    def __init__(self, http_client: HTTPClient) -> None:
+        super().__init__(logger=logging.getLogger("twilio.http_client"), is_async=False)
+        self.http_client = http_client
+
+    def request(
+        self,
+        method: str,
+        uri: str,
+        params: Optional[Dict[str, object]] = None,
+        data: Optional[Dict[str, object]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = False,
+    ) -> Response:
+        try:
+            response = self.http_client.request(
+                method, uri, params=params, data=data, headers=headers, auth=auth, allow_redirects=allow_redirects
+            )
+
+        except requests.RequestException as err:
+            raise TwilioException(f"Request to Twilio failed: {err}")
+
+        return Response(response.status_code, response.text, response.headers)
+
+
 class TwilioService:
     __client: Optional[Client] = None
+    __http_client: Optional[HTTPClient] = None
+
+    BASE_URL = ConfigService[str].bind(key="twilio.http.base_url")
+    MESSAGING_SERVICE_SID = ConfigService[str].bind(key="twilio.messaging_service_sid")
 
     @staticmethod
     def send_sms(params: SendSMSParams) -> None:
@@ -22,7 +62,7 @@ class TwilioService:
             # Send SMS
             client.messages.create(
                 to=params.recipient_phone,
-                messaging_service_sid=ConfigService[str].get_value(key="twilio.messaging_service_sid"),
+                messaging_service_sid=TwilioService.MESSAGING_SERVICE_SID(),
                 body=params.message_body,
             )
 
@@ -36,6 +76,14 @@ class TwilioService:
             auth_token = ConfigService[str].get_value(key="twilio.auth_token")
 
             # Initialize the Twilio client
-            TwilioService.__client = Client(account_sid, auth_token)
+            client = Client(account_sid, auth_token, http_client=TwilioHTTPClient(TwilioService._get_http_client()))
+            client.api.base_url = TwilioService.BASE_URL()
+            TwilioService.__client = client
 
         return TwilioService.__client
+
+    @staticmethod
+    def _get_http_client() -> HTTPClient:
+        if not TwilioService.__http_client:
+            TwilioService.__http_client = HTTPClient.from_config(name="Twilio", key="twilio.http")
+        return TwilioService.__http_client
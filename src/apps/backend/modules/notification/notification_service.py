@@ -1,8 +1,13 @@
+from typing import Any, Dict, List, Optional
+
+from modules.notification.digest_service import DigestService
 from modules.notification.email_service import EmailService
 from modules.notification.sms_service import SMSService
 from modules.notification.internals.account_notification_preferences_writer import AccountNotificationPreferenceWriter
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
 from modules.notification.types import (
+    BulkEmailResult,
+    SendEmailForAccountParams,
     SendEmailParams,
     SendSMSParams,
     CreateOrUpdateAccountNotificationPreferencesParams,
@@ -13,15 +18,25 @@ from modules.notification.types import (
 class NotificationService:
 
     @staticmethod
-    def send_email_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendEmailParams) -> None:
+    def send_email_for_account(
+        *, account_id: str, bypass_preferences: bool = False, contains_secret: bool = False, params: SendEmailParams
+    ) -> None:
         return EmailService.send_email_for_account(
-            account_id=account_id, bypass_preferences=bypass_preferences, params=params
+            account_id=account_id, bypass_preferences=bypass_preferences, contains_secret=contains_secret, params=params
         )
 
     @staticmethod
-    def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
+    def send_bulk_emails(
+        *, params_list: List[SendEmailForAccountParams], bypass_preferences: bool = False
+    ) -> BulkEmailResult:
+        return EmailService.send_bulk_emails(params_list=params_list, bypass_preferences=bypass_preferences)
+
+    @staticmethod
+    def send_sms_for_account(
+        *, account_id: str, bypass_preferences: bool = False, contains_secret: bool = False, params: SendSMSParams
+    ) -> None:
         return SMSService.send_sms_for_account(
-            account_id=account_id, bypass_preferences=bypass_preferences, params=params
+            account_id=account_id, bypass_preferences=bypass_preferences, contains_secret=contains_secret, params=params
         )
 
     @staticmethod
@@ -35,3 +50,35 @@ class NotificationService:
     @staticmethod
     def get_account_notification_preferences_by_account_id(*, account_id: str) -> AccountNotificationPreferences:
         return AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
+
+    @staticmethod
+    def get_account_notification_preferences_lookup_stage(*, local_field: str, as_field: str) -> dict[str, Any]:
+        return AccountNotificationPreferenceReader.get_account_notification_preferences_lookup_stage(
+            local_field=local_field, as_field=as_field
+        )
+
+    @staticmethod
+    def get_active_account_notification_preferences(
+        *, notification_preferences_bsons: List[dict[str, Any]]
+    ) -> Optional[AccountNotificationPreferences]:
+        return AccountNotificationPreferenceReader.get_active_account_notification_preferences(
+            notification_preferences_bsons
+        )
+
+    @staticmethod
+    def deactivate_account_notification_preferences_by_account_id(*, account_id: str, batch_size: int) -> int:
+        return AccountNotificationPreferenceWriter.deactivate_account_notification_preferences_by_account_id(
+            account_id=account_id, batch_size=batch_size
+        )
+
+    @staticmethod
+    def get_preferences_for_accounts(*, account_ids: List[str]) -> Dict[str, AccountNotificationPreferences]:
+        return AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(account_ids)
+
+    @staticmethod
+    def add_email_to_digest(*, account_id: str, params: SendEmailParams) -> None:
+        return DigestService.add_email_to_digest(account_id=account_id, params=params)
+
+    @staticmethod
+    def add_sms_to_digest(*, account_id: str, params: SendSMSParams) -> None:
+        return DigestService.add_sms_to_digest(account_id=account_id, params=params)
@@ -1,14 +1,23 @@
+from dataclasses import asdict
+
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.notification.internals.twilio_service import TwilioService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendSMSParams
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.twilio_params import SMSParams
+from modules.notification.types import NotificationChannel, SendSMSParams
 
 
 class SMSService:
+    SMS_ENABLED = ConfigService[bool].bind(key="sms.enabled")
+    SYNCHRONOUS = ConfigService[bool].bind(key="notifications.outbox.synchronous", default=False)
+
     @staticmethod
-    def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
-        is_sms_enabled = ConfigService[bool].get_value(key="sms.enabled")
+    def send_sms_for_account(
+        *, account_id: str, bypass_preferences: bool = False, contains_secret: bool = False, params: SendSMSParams
+    ) -> None:
+        is_sms_enabled = SMSService.SMS_ENABLED()
         if not is_sms_enabled:
             Logger.warn(message=f"SMS is disabled. Could not send message - {params.message_body}")
             return
@@ -24,4 +33,14 @@ class SMSService:
                 )
                 return
 
-        TwilioService.send_sms(params=params)
+        if SMSService.SYNCHRONOUS():
+            return TwilioService.send_sms(params=params)
+
+        # Validated here so invalid params still fail the request instead of being dead-lettered by the dispatcher
+        SMSParams.validate(params)
+        NotificationOutboxWriter.create_message(
+            account_id=account_id,
+            channel=NotificationChannel.SMS,
+            contains_secret=contains_secret,
+            payload=asdict(params),
+        )
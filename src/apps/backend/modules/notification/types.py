@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from enum import StrEnum
+from typing import Any, Dict, List, Optional
 
 from modules.account.types import PhoneNumber
 
@@ -30,6 +31,12 @@ class AccountNotificationPreferences:
     sms_enabled: bool = True
 
 
+@dataclass(frozen=True)
+class CachedAccountNotificationPreferences:
+    # None records that the account has no active preferences
+    preferences: Optional[AccountNotificationPreferences]
+
+
 @dataclass(frozen=True)
 class SendEmailParams:
     recipient: EmailRecipient
@@ -38,12 +45,78 @@ class SendEmailParams:
     template_data: Dict[str, Any] | None = None
 
 
+@dataclass(frozen=True)
+class SendEmailForAccountParams:
+    account_id: str
+    params: SendEmailParams
+
+
+@dataclass(frozen=True)
+class BulkEmailResult:
+    failed: int
+    sent: int
+    skipped: int
+
+
 @dataclass(frozen=True)
 class SendSMSParams:
     message_body: str
     recipient_phone: PhoneNumber
 
 
+class NotificationChannel(StrEnum):
+    EMAIL: str = "EMAIL"
+    SMS: str = "SMS"
+
+
+class NotificationOutboxStatus(StrEnum):
+    PENDING: str = "PENDING"
+    SENDING: str = "SENDING"
+    SENT: str = "SENT"
+    FAILED: str = "FAILED"
+
+
+@dataclass(frozen=True)
+class NotificationOutboxMessage:
+    id: str
+    account_id: str
+    attempts: int
+    channel: NotificationChannel
+    claim_id: Optional[str]
+    payload: Dict[str, Any]
+    status: NotificationOutboxStatus
+
+
+@dataclass(frozen=True)
+class NotificationOutboxDispatchResult:
+    failed: int
+    retried: int
+    sent: int
+
+
+class NotificationDigestStatus(StrEnum):
+    PENDING: str = "PENDING"
+    FLUSHING: str = "FLUSHING"
+
+
+@dataclass(frozen=True)
+class NotificationDigest:
+    id: str
+    account_id: str
+    channel: NotificationChannel
+    claim_id: Optional[str]
+    item_count: int
+    items: List[Dict[str, Any]]
+    payload: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class NotificationDigestFlushResult:
+    dropped: int
+    flushed: int
+    retried: int
+
+
 @dataclass(frozen=True)
 class NotificationErrorCode:
     PREFERENCES_NOT_FOUND = "NOTIFICATION_ERR_01"
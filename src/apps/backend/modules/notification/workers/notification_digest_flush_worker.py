@@ -0,0 +1,99 @@
+import asyncio
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, Dict
+
+from temporalio import activity, workflow
+from temporalio.common import RetryPolicy
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.notification.email_service import EmailService
+from modules.notification.errors import AccountNotificationPreferencesNotFoundError, ValidationError
+from modules.notification.internals.notification_digest_util import NotificationDigestUtil
+from modules.notification.internals.notification_digest_writer import NotificationDigestWriter
+from modules.notification.sms_service import SMSService
+from modules.notification.types import NotificationChannel, NotificationDigest, NotificationDigestFlushResult
+
+
+class NotificationDigestFlushWorker(BaseWorker):
+    """
+    Sends each notification digest buffered by `DigestService` whose window is over as one email or SMS.
+
+    Scheduled every minute, each run claims due buffers `batch_size` at a time until none are left. A digest is
+    handed to `EmailService` or `SMSService`, so it is queued in the outbox and checked against the preferences
+    like any other notification, and its buffer is then deleted. A buffer that could not be handed over is claimed
+    again once its lease of `claim_timeout_in_seconds` runs out, one without preferences or with invalid params is
+    dropped.
+    """
+
+    max_execution_time_in_seconds = 120
+    max_retries = 1
+    heartbeat_timeout_in_seconds = 30
+
+    @classmethod
+    async def execute(cls, *args: Any) -> Dict[str, int]:
+        batch_size = ConfigService[int].get_value(key="notifications.digest.batch_size")
+
+        totals = {"dropped": 0, "flushed": 0, "retried": 0}
+        while True:
+            result = await cls.flush_due_digests()
+            for key, count in asdict(result).items():
+                totals[key] += count
+            activity.heartbeat(totals)
+
+            if result.dropped + result.flushed + result.retried < batch_size:
+                return totals
+
+    async def run(self, *args: Any) -> None:
+        await workflow.execute_activity(
+            self.execute,
+            args=args,
+            start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+            heartbeat_timeout=timedelta(seconds=self.heartbeat_timeout_in_seconds),
+            retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
+        )
+
+    @classmethod
+    async def flush_due_digests(cls) -> NotificationDigestFlushResult:
+        digests = await asyncio.to_thread(
+            NotificationDigestWriter.claim_digests,
+            batch_size=ConfigService[int].get_value(key="notifications.digest.batch_size"),
+            claim_timeout_in_seconds=ConfigService[int].get_value(key="notifications.digest.claim_timeout_in_seconds"),
+        )
+
+        # Flushing only queues the digests in the outbox, so they are handed over one after the other
+        outcomes = [await asyncio.to_thread(cls._flush_digest, digest) for digest in digests]
+        return NotificationDigestFlushResult(
+            dropped=outcomes.count("dropped"), flushed=outcomes.count("flushed"), retried=outcomes.count("retried")
+        )
+
+    @staticmethod
+    def _flush_digest(digest: NotificationDigest) -> str:
+        try:
+            if digest.channel == NotificationChannel.EMAIL:
+                EmailService.send_email_for_account(
+                    account_id=digest.account_id,
+                    params=NotificationDigestUtil.convert_digest_to_send_email_params(digest),
+                )
+            else:
+                SMSService.send_sms_for_account(
+                    account_id=digest.account_id,
+                    params=NotificationDigestUtil.convert_digest_to_send_sms_params(digest),
+                )
+
+        except (AccountNotificationPreferencesNotFoundError, ValidationError) as e:
+            Logger.error(
+                message=f"Dropped {digest.channel} digest of {digest.item_count} notifications "
+                f"for account {digest.account_id}: {e.message}"
+            )
+            NotificationDigestWriter.delete_digest(digest=digest)
+            return "dropped"
+
+        except Exception as e:
+            Logger.error(message=f"Could not flush {digest.channel} digest {digest.id}, it will be retried: {e}")
+            return "retried"
+
+        NotificationDigestWriter.delete_digest(digest=digest)
+        return "flushed"
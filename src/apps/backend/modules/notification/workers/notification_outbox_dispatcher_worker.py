@@ -0,0 +1,138 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from cryptography.fernet import InvalidToken
+from temporalio import activity, workflow
+from temporalio.common import RetryPolicy
+
+from modules.application.errors import CircuitOpenError
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.notification.errors import ValidationError
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.notification_outbox_writer import NotificationOutboxWriter
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import (
+    NotificationChannel,
+    NotificationOutboxDispatchResult,
+    NotificationOutboxMessage,
+    NotificationOutboxStatus,
+)
+
+
+class NotificationOutboxDispatcherWorker(BaseWorker):
+    """
+    Sends the emails and SMS queued in the notification outbox by `EmailService` and `SMSService`.
+
+    Scheduled every minute, each run polls the outbox for `notifications.outbox.dispatch_duration_in_seconds` and
+    claims due messages `batch_size` at a time, sending at most `max_concurrency` of them at once. A failed send is
+    retried with exponential backoff and dead-lettered as FAILED after `max_attempts`, invalid params right away.
+    Payloads carrying a secret are decrypted just before sending and dead-lettered once older than
+    `secret_ttl_in_seconds`.
+    A message rejected by an open provider circuit is put back until the circuit half opens, without using up an
+    attempt, so an outage does not dead-letter the whole outbox.
+    The activity heartbeats after every sent message, so a slow batch does not miss the heartbeat timeout.
+    Delivery is at least once: a message whose claim lease expires mid-send is sent again.
+    """
+
+    max_execution_time_in_seconds = 120
+    max_retries = 1
+    heartbeat_timeout_in_seconds = 30
+
+    _TOTALS_KEY_BY_STATUS = {
+        NotificationOutboxStatus.FAILED: "failed",
+        NotificationOutboxStatus.PENDING: "retried",
+        NotificationOutboxStatus.SENT: "sent",
+    }
+
+    @classmethod
+    async def execute(cls, *args: Any) -> Dict[str, int]:
+        dispatch_duration = ConfigService[int].get_value(key="notifications.outbox.dispatch_duration_in_seconds")
+        poll_interval = ConfigService[float].get_value(key="notifications.outbox.poll_interval_in_seconds")
+        batch_size = ConfigService[int].get_value(key="notifications.outbox.batch_size")
+
+        totals = {"sent": 0, "retried": 0, "failed": 0}
+
+        def record_dispatch(status: NotificationOutboxStatus) -> None:
+            totals[cls._TOTALS_KEY_BY_STATUS[status]] += 1
+            activity.heartbeat(totals)
+
+        deadline = time.monotonic() + dispatch_duration
+        while time.monotonic() < deadline:
+            activity.heartbeat(totals)
+            result = await cls.dispatch_pending_messages(on_message_dispatched=record_dispatch)
+
+            # A full batch means more messages are likely due, keep draining without waiting
+            if result.sent + result.retried + result.failed < batch_size:
+                await asyncio.sleep(poll_interval)
+
+        return totals
+
+    async def run(self, *args: Any) -> None:
+        await workflow.execute_activity(
+            self.execute,
+            args=args,
+            start_to_close_timeout=timedelta(seconds=self.max_execution_time_in_seconds),
+            heartbeat_timeout=timedelta(seconds=self.heartbeat_timeout_in_seconds),
+            retry_policy=RetryPolicy(maximum_attempts=self.max_retries),
+        )
+
+    @classmethod
+    async def dispatch_pending_messages(
+        cls, on_message_dispatched: Optional[Callable[[NotificationOutboxStatus], None]] = None
+    ) -> NotificationOutboxDispatchResult:
+        messages = await asyncio.to_thread(
+            NotificationOutboxWriter.claim_messages,
+            batch_size=ConfigService[int].get_value(key="notifications.outbox.batch_size"),
+            claim_timeout_in_seconds=ConfigService[int].get_value(key="notifications.outbox.claim_timeout_in_seconds"),
+        )
+
+        semaphore = asyncio.Semaphore(ConfigService[int].get_value(key="notifications.outbox.max_concurrency"))
+
+        async def dispatch(message: NotificationOutboxMessage) -> NotificationOutboxStatus:
+            async with semaphore:
+                status = await asyncio.to_thread(cls._dispatch_message, message)
+
+            if on_message_dispatched:
+                on_message_dispatched(status)
+            return status
+
+        statuses = await asyncio.gather(*[dispatch(message) for message in messages])
+        return NotificationOutboxDispatchResult(
+            failed=statuses.count(NotificationOutboxStatus.FAILED),
+            retried=statuses.count(NotificationOutboxStatus.PENDING),
+            sent=statuses.count(NotificationOutboxStatus.SENT),
+        )
+
+    @staticmethod
+    def _dispatch_message(message: NotificationOutboxMessage) -> NotificationOutboxStatus:
+        try:
+            payload = NotificationOutboxUtil.decrypt_payload(message.payload)
+            if message.channel == NotificationChannel.EMAIL:
+                SendGridService.send_email(NotificationOutboxUtil.convert_payload_to_send_email_params(payload))
+            else:
+                TwilioService.send_sms(params=NotificationOutboxUtil.convert_payload_to_send_sms_params(payload))
+
+        except ValidationError as e:
+            return NotificationOutboxWriter.mark_message_as_failed(message=message, error=e.message, retryable=False)
+
+        except InvalidToken:
+            # A secret such as an OTP is useless once its TTL is over, so it is not sent late
+            return NotificationOutboxWriter.mark_message_as_failed(
+                message=message, error="Encrypted payload expired or was encrypted with another key", retryable=False
+            )
+
+        except CircuitOpenError as e:
+            # A half open circuit rejects everything but its trial call with no wait, so it is retried a second later
+            return NotificationOutboxWriter.reschedule_message(
+                message=message, error=e.message, delay_in_seconds=max(e.retry_after_in_seconds, 1)
+            )
+
+        except Exception as e:
+            return NotificationOutboxWriter.mark_message_as_failed(message=message, error=str(e), retryable=True)
+
+        NotificationOutboxWriter.mark_message_as_sent(message=message)
+        return NotificationOutboxStatus.SENT
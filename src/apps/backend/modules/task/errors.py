@@ -9,10 +9,20 @@ class TaskNotFoundError(AppError):
         )
 
 
+class TaskCommentNotFoundError(AppError):
+    def __init__(self, task_id: str, comment_id: str) -> None:
+        super().__init__(
+            code=TaskErrorCode.COMMENT_NOT_FOUND,
+            http_status_code=404,
+            message=f"Comment with id {comment_id} not found on task with id {task_id}.",
+        )
+
+
 class TaskBadRequestError(AppError):
     def __init__(self, message: str) -> None:
         super().__init__(code=TaskErrorCode.BAD_REQUEST, http_status_code=400, message=message)
 
+
 class TaskUnauthorizedError(AppError):
     def __init__(self, message: str = "You are not authorized to perform this action") -> None:
-        super().__init__(code=TaskErrorCode.UNAUTHORIZED, http_status_code=403, message=message)
\ No newline at end of file
+        super().__init__(code=TaskErrorCode.UNAUTHORIZED, http_status_code=403, message=message)
@@ -3,17 +3,15 @@ from datetime import datetime
 from bson.objectid import ObjectId
 from pymongo import ReturnDocument
 
-from modules.task.errors import TaskNotFoundError
+from modules.task.errors import TaskCommentNotFoundError, TaskNotFoundError
 from modules.task.internal.store.task_model import TaskModel
 from modules.task.internal.store.task_repository import TaskRepository
-from modules.task.internal.task_reader import TaskReader
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import (
     Comment,
     CommentResult,
     CreateTaskParams,
     DeleteTaskParams,
-    GetTaskParams,
     Task,
     TaskDeletionResult,
     UpdateTaskParams,
@@ -34,9 +32,8 @@ class TaskWriter:
         ).to_bson()
 
         query = TaskRepository.collection().insert_one(task_bson)
-        created_task_bson = TaskRepository.collection().find_one({"_id": query.inserted_id})
 
-        return TaskUtil.convert_task_bson_to_task(created_task_bson)
+        return TaskUtil.convert_task_bson_to_task({**task_bson, "_id": query.inserted_id})
 
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
@@ -59,11 +56,9 @@ class TaskWriter:
 
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
-        task = TaskReader.get_task(params=GetTaskParams(account_id=params.account_id, task_id=params.task_id))
-
         deletion_time = datetime.utcnow()
         updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(task.id)},
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
             {"$set": {"active": False, "updated_at": deletion_time}},
             return_document=ReturnDocument.AFTER,
         )
@@ -76,16 +71,6 @@ class TaskWriter:
     
     @staticmethod
     def add_comment(*, params: AddCommentParams) -> CommentResult:
-
-        task = TaskRepository.collection().find_one({
-            "_id": ObjectId(params.task_id),
-            "account_id": params.account_id,
-            "active": True
-        })
-        
-        if not task:
-            raise TaskNotFoundError(f"Task not found: {params.task_id}")
-            
         comment = {
             "id": str(ObjectId()),
             "content": params.content,
@@ -94,13 +79,13 @@ class TaskWriter:
         }
         
         result = TaskRepository.collection().update_one(
-            {"_id": ObjectId(params.task_id)},
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
             {"$push": {"comments": comment},
              "$set": {"updated_at": datetime.utcnow()}}
         )
         
         if result.matched_count == 0:
-            raise TaskNotFoundError(f"Task not found: {params.task_id}")
+            raise TaskNotFoundError(task_id=params.task_id)
             
         return CommentResult(
             id=str(comment["id"]),
@@ -111,23 +96,11 @@ class TaskWriter:
 
     @staticmethod
     def update_comment(*, params: UpdateCommentParams) -> CommentResult:
-        task = TaskRepository.collection().find_one({
-            "_id": ObjectId(params.task_id),
-            "account_id": params.account_id,
-            "active": True,
-            "comments": {
-                "$elemMatch": {
-                    "id": params.comment_id,
-                }
-            }
-        })
-
-        if not task:
-            raise TaskNotFoundError(f"Task or Comment not found: {params.task_id}")
-
-        result = TaskRepository.collection().update_one(
+        updated_task = TaskRepository.collection().find_one_and_update(
             {
                 "_id": ObjectId(params.task_id),
+                "account_id": params.account_id,
+                "active": True,
                 "comments.id": params.comment_id,
             },
             {
@@ -136,21 +109,13 @@ class TaskWriter:
                     "comments.$.updated_at": datetime.utcnow(),
                     "updated_at": datetime.utcnow()
                 }
-            }
+            },
+            projection={"comments": 1},
+            return_document=ReturnDocument.AFTER,
         )
         
-        if result.matched_count == 0:
-            raise TaskNotFoundError("Failed to update comment")
-            
-        updated_task = TaskRepository.collection().find_one({
-            "_id": ObjectId(params.task_id),
-            "account_id": params.account_id,
-            "active": True,
-            "comments.id": params.comment_id
-        })
-        
         if not updated_task:
-            raise TaskNotFoundError("Failed to retrieve updated comment")
+            raise TaskCommentNotFoundError(task_id=params.task_id, comment_id=params.comment_id)
             
         comments = updated_task.get("comments", [])
         updated_comment = None
@@ -160,7 +125,7 @@ class TaskWriter:
                 break
         
         if not updated_comment:
-            raise TaskNotFoundError("Failed to retrieve updated comment")
+            raise TaskCommentNotFoundError(task_id=params.task_id, comment_id=params.comment_id)
             
         return CommentResult(
             id=updated_comment["id"],
@@ -171,22 +136,13 @@ class TaskWriter:
 
     @staticmethod
     def delete_comment(*, params: DeleteCommentParams) -> None:
-        task = TaskRepository.collection().find_one({
-            "_id": ObjectId(params.task_id),
-            "account_id": params.account_id,
-            "active": True,
-            "comments": {
-                "$elemMatch": {
-                    "id": params.comment_id,
-                }
-            }
-        })
-        
-        if not task:
-            raise TaskNotFoundError(f"Task or Comment not found: {params.task_id}")
-                    
         result = TaskRepository.collection().update_one(
-            {"_id": ObjectId(params.task_id)},
+            {
+                "_id": ObjectId(params.task_id),
+                "account_id": params.account_id,
+                "active": True,
+                "comments.id": params.comment_id,
+            },
             {
                 "$pull": {"comments": {"id": params.comment_id}},
                 "$set": {"updated_at": datetime.utcnow()}
@@ -194,4 +150,12 @@ class TaskWriter:
         )
         
         if result.matched_count == 0:
-            raise TaskNotFoundError("Failed to delete comment")
\ No newline at end of file
+            raise TaskCommentNotFoundError(task_id=params.task_id, comment_id=params.comment_id)
+
+    @staticmethod
+    def deactivate_tasks_by_account_id(*, account_id: str, batch_size: int) -> int:
+        return TaskRepository.update_many_in_batch(
+            {"account_id": account_id, "active": True},
+            {"$set": {"active": False, "updated_at": datetime.utcnow()}},
+            batch_size,
+        )
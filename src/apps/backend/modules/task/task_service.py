@@ -47,4 +47,8 @@ class TaskService:
 
     @staticmethod
     def delete_comment(*, params: DeleteCommentParams) -> None:
-        return TaskWriter.delete_comment(params=params)
\ No newline at end of file
+        return TaskWriter.delete_comment(params=params)
+
+    @staticmethod
+    def deactivate_tasks_by_account_id(*, account_id: str, batch_size: int) -> int:
+        return TaskWriter.deactivate_tasks_by_account_id(account_id=account_id, batch_size=batch_size)
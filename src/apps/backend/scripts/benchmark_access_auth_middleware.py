@@ -0,0 +1,54 @@
+import time
+from typing import Callable
+
+from flask import Flask
+
+from modules.account.types import Account, PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+
+ITERATIONS = 20000
+
+
+def benchmark(name: str, token: str, before_request: Callable[[], None]) -> None:
+    app = Flask(__name__)
+
+    @access_auth_middleware
+    def view(account_id: str) -> str:
+        return account_id
+
+    headers = {"Authorization": f"Bearer {token}"}
+    with app.test_request_context(headers=headers):
+        started_at = time.perf_counter()
+        for _ in range(ITERATIONS):
+            before_request()
+            view(account_id="benchmark-account")
+        elapsed = time.perf_counter() - started_at
+
+    print(f"{name:<28}: {elapsed * 1_000_000 / ITERATIONS:7.2f}us per request")
+
+
+def main() -> None:
+    account = Account(
+        id="benchmark-account",
+        first_name="Benchmark",
+        last_name="User",
+        username="benchmark@example.com",
+        hashed_password="",
+        phone_number=PhoneNumber(country_code="+1", phone_number="5550100"),
+    )
+    token = AuthenticationService.create_access_token_by_username_and_password(account=account).token
+    cache = AccessTokenUtil._get_verification_cache()
+    assert cache is not None, "Enable accounts.access_token_cache to run this benchmark"
+
+    # Clearing the cache before every request forces the full jwt.decode path
+    benchmark("middleware without cache", token, before_request=cache.clear)
+    benchmark("middleware with cache", token, before_request=lambda: None)
+
+    stats = cache.get_stats()
+    print(f"cache hit rate: {stats.hit_rate:.2%} ({stats.hits} hits, {stats.misses} misses)")
+
+
+if __name__ == "__main__":
+    main()
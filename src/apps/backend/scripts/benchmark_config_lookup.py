@@ -0,0 +1,38 @@
+import time
+from typing import Any, Callable
+
+from modules.config.config_service import ConfigService
+from modules.config.internals.config_manager import ConfigManager
+
+ITERATIONS = 200000
+KEY = "accounts.access_token_cache.enabled"
+
+
+def walk_config_store(key: str) -> Any:
+    # The nested walk every lookup did before the config was compiled into a flat snapshot
+    values: Any = ConfigService.config_manager.config_store
+    for k in key.split(ConfigManager.CONFIG_KEY_SEPARATOR):
+        values = values[k]
+    return values
+
+
+def benchmark(name: str, lookup: Callable[[], Any]) -> None:
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        lookup()
+    elapsed = time.perf_counter() - started_at
+
+    print(f"{name:<36}: {elapsed * 1_000_000_000 / ITERATIONS:7.0f}ns per lookup")
+
+
+def main() -> None:
+    accessor = ConfigService[bool].bind(key=KEY)
+
+    benchmark("nested walk of config_store", lambda: walk_config_store(KEY))
+    benchmark("ConfigService[bool].get_value", lambda: ConfigService[bool].get_value(key=KEY))
+    benchmark("ConfigService.get_value", lambda: ConfigService.get_value(key=KEY))
+    benchmark("bound accessor", accessor)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Callable, List, Tuple, Type
+
+from pymongo import ReturnDocument, monitoring
+
+from modules.account.types import PhoneNumber
+from modules.authentication.internals.otp.otp_util import OTPUtil
+from modules.authentication.internals.otp.otp_writer import OTPWriter
+from modules.authentication.internals.otp.store.otp_model import OTPModel
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.types import OTP, CreateOTPParams, OTPStatus, VerifyOTPParams
+
+ITERATIONS = 200
+PHONE_NUMBER = PhoneNumber(country_code="+1", phone_number="5550199")
+# OTPs of other phone numbers, so the queries run against a collection that needs its indexes
+OTHER_OTP_COUNT = 20000
+OTHER_OTP_COUNTRY_CODE = "+999"
+LEGACY_INDEX_NAME = "phone_number_1"
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.count += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+# Registered before the repository creates its client, so every command sent to Mongo is counted
+COMMAND_COUNTER = CommandCounter()
+monitoring.register(COMMAND_COUNTER)
+
+
+class LegacyOTPWriter:
+    """
+    The queries OTPWriter sent before issuing and verifying were reduced to single queries, kept as the baseline:
+    previous OTPs are found and expired one update at a time, the issued OTP is read back, and verifying reads the
+    code before updating it. Phone numbers are matched as embedded documents, served by the phone_number_1 index.
+    """
+
+    @staticmethod
+    def create_new_otp(*, params: CreateOTPParams) -> OTP:
+        phone_number_dict = asdict(params.phone_number)
+        for otp in OTPRepository.collection().find({"active": True, "phone_number": phone_number_dict}):
+            OTPRepository.collection().update_one(
+                {"_id": otp["_id"]}, {"$set": {"active": False, "status": OTPStatus.EXPIRED}}
+            )
+
+        created_at = datetime.utcnow()
+        otp_bson = OTPModel(
+            active=True,
+            id=None,
+            phone_number=params.phone_number,
+            otp_code=OTPUtil.generate_otp(length=4, phone_number=params.phone_number.phone_number),
+            status=str(OTPStatus.PENDING),
+            created_at=created_at,
+            updated_at=created_at,
+        ).to_bson()
+        query = OTPRepository.collection().insert_one(otp_bson)
+        return OTPUtil.convert_otp_bson_to_otp(OTPRepository.collection().find_one({"_id": query.inserted_id}))
+
+    @staticmethod
+    def verify_otp(*, params: VerifyOTPParams) -> OTP:
+        otp_bson = OTPRepository.collection().find_one(
+            {"otp_code": params.otp_code, "phone_number": asdict(params.phone_number)}, sort=[("_id", -1)]
+        )
+        assert otp_bson is not None and otp_bson["active"]
+        updated_otp_bson = OTPRepository.collection().find_one_and_update(
+            {"_id": otp_bson["_id"]},
+            {"$set": {"active": False, "status": OTPStatus.SUCCESS}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return OTPUtil.convert_otp_bson_to_otp(updated_otp_bson)
+
+
+def benchmark(operation: Callable[[], None], before_operation: Callable[[], None]) -> Tuple[float, float]:
+    elapsed = 0.0
+    commands = 0
+    for _ in range(ITERATIONS):
+        before_operation()
+
+        commands_before = COMMAND_COUNTER.count
+        started_at = time.perf_counter()
+        operation()
+        elapsed += time.perf_counter() - started_at
+        commands += COMMAND_COUNTER.count - commands_before
+
+    return elapsed * 1000 / ITERATIONS, commands / ITERATIONS
+
+
+def benchmark_writer(writer: Type[OTPWriter] | Type[LegacyOTPWriter]) -> List[Tuple[float, float]]:
+    OTPRepository.collection().delete_many({"phone_number.phone_number": PHONE_NUMBER.phone_number})
+    issued_otps: List[OTP] = []
+
+    def issue_otp() -> None:
+        issued_otps.append(writer.create_new_otp(params=CreateOTPParams(phone_number=PHONE_NUMBER)))
+
+    def verify_otp() -> None:
+        otp = issued_otps[-1]
+        writer.verify_otp(params=VerifyOTPParams(otp_code=otp.otp_code, phone_number=PHONE_NUMBER))
+
+    # Every issue expires the OTP issued by the previous one
+    return [benchmark(issue_otp, before_operation=lambda: None), benchmark(verify_otp, before_operation=issue_otp)]
+
+
+def main() -> None:
+    # Builds the collection and its indexes before anything is measured
+    collection = OTPRepository.collection()
+
+    # Seeded inside the try, so seed documents are removed even when seeding fails or is interrupted
+    try:
+        collection.insert_many(
+            [
+                {
+                    "active": index % 2 == 0,
+                    "otp_code": f"{index % 10000:04d}",
+                    "phone_number": {"country_code": OTHER_OTP_COUNTRY_CODE, "phone_number": f"{index:07d}"},
+                    "status": str(OTPStatus.PENDING),
+                    "created_at": datetime.utcnow(),
+                    "updated_at": datetime.utcnow(),
+                }
+                for index in range(OTHER_OTP_COUNT)
+            ]
+        )
+
+        # The legacy index is only there while the baseline runs, OTPRepository drops it on startup
+        collection.create_index("phone_number", name=LEGACY_INDEX_NAME)
+        before = benchmark_writer(LegacyOTPWriter)
+        collection.drop_index(LEGACY_INDEX_NAME)
+        after = benchmark_writer(OTPWriter)
+
+    finally:
+        collection.delete_many({"phone_number.phone_number": PHONE_NUMBER.phone_number})
+        collection.delete_many({"phone_number.country_code": OTHER_OTP_COUNTRY_CODE})
+        if LEGACY_INDEX_NAME in collection.index_information():
+            collection.drop_index(LEGACY_INDEX_NAME)
+
+    print(f"{ITERATIONS} calls each, {OTHER_OTP_COUNT} OTPs of other phone numbers in the collection")
+    for name, (before_ms, before_commands), (after_ms, after_commands) in zip(
+        ["issue OTP", "verify OTP"], before, after
+    ):
+        print(
+            f"{name:<12}: before {before_ms:6.2f}ms and {before_commands:4.1f} round trips per call, "
+            f"after {after_ms:6.2f}ms and {after_commands:4.1f} round trips per call"
+        )
+
+
+if __name__ == "__main__":
+    main()
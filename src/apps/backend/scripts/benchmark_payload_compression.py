@@ -0,0 +1,63 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from bson.objectid import ObjectId
+from temporalio.converter import DataConverter
+
+from modules.application.internal.payload_compression_codec import PayloadCompressionCodec
+
+ITERATIONS = 50
+THRESHOLD_IN_BYTES = 4096
+LEVELS = [1, 6, 9]
+
+
+def get_sample_arguments() -> Dict[str, List[Any]]:
+    return {
+        "10k account ids": [[str(ObjectId()) for _ in range(10000)]],
+        "1k exported tasks": [
+            [
+                {
+                    "id": str(ObjectId()),
+                    "account_id": str(ObjectId()),
+                    "title": f"Task {index}",
+                    "description": "Follow up with the customer about the renewal and update the CRM notes.",
+                    "active": True,
+                }
+                for index in range(1000)
+            ]
+        ],
+        "small argument": ["account-id"],
+    }
+
+
+async def benchmark(name: str, arguments: List[Any], level: int) -> None:
+    codec = PayloadCompressionCodec(enabled=True, threshold_in_bytes=THRESHOLD_IN_BYTES, level=level)
+    payloads = DataConverter.default.payload_converter.to_payloads(arguments)
+    raw_size = sum(payload.ByteSize() for payload in payloads)
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        encoded = await codec.encode(payloads)
+    encode_ms = (time.perf_counter() - started_at) * 1000 / ITERATIONS
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await codec.decode(encoded)
+    decode_ms = (time.perf_counter() - started_at) * 1000 / ITERATIONS
+
+    encoded_size = sum(payload.ByteSize() for payload in encoded)
+    print(
+        f"{name:<18} level={level}: {raw_size:>8} -> {encoded_size:>8} bytes in history "
+        f"({encoded_size / raw_size:6.1%}), encode {encode_ms:6.2f}ms, decode {decode_ms:6.2f}ms"
+    )
+
+
+async def main() -> None:
+    for name, arguments in get_sample_arguments().items():
+        for level in LEVELS:
+            await benchmark(name, arguments, level)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
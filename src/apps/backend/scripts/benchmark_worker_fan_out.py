@@ -0,0 +1,64 @@
+import asyncio
+import time
+import uuid
+from typing import Any, List
+
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+from modules.application.types import BaseWorker
+from temporal_config import TemporalConfig
+
+ITEM_COUNT = 20000
+CHUNK_SIZE = 100
+CONCURRENCY_LEVELS = [1, 5, 10, 25, 50]
+
+
+class FanOutBenchmarkWorker(BaseWorker):
+    fan_out_chunk_size = CHUNK_SIZE
+    fan_out_max_chunks_per_run = 50
+
+    @staticmethod
+    async def execute(*args: Any) -> int:
+        chunk: List[int] = args[0]
+        await asyncio.sleep(0.01)
+        return len(chunk)
+
+    async def run(self, *args: Any) -> int:
+        items, *summary = args
+        processed_count: int = await self.fan_out(items, summary=summary[0] if summary else None)
+        return processed_count
+
+
+async def main() -> None:
+    TemporalConfig._register_worker(FanOutBenchmarkWorker)
+    task_queue = f"fan-out-benchmark-{uuid.uuid4()}"
+
+    async with await WorkflowEnvironment.start_local() as env:
+        async with Worker(
+            env.client,
+            task_queue=task_queue,
+            workflows=[FanOutBenchmarkWorker],
+            activities=[FanOutBenchmarkWorker.execute],
+            workflow_runner=UnsandboxedWorkflowRunner(),
+            max_concurrent_activities=max(CONCURRENCY_LEVELS),
+        ):
+            print(f"Fanning out {ITEM_COUNT} items in chunks of {CHUNK_SIZE}")
+            for concurrency in CONCURRENCY_LEVELS:
+                FanOutBenchmarkWorker.fan_out_max_concurrency = concurrency
+
+                started_at = time.perf_counter()
+                processed_count = await env.client.execute_workflow(
+                    FanOutBenchmarkWorker.run,
+                    args=[list(range(ITEM_COUNT))],
+                    id=f"fan-out-benchmark-{uuid.uuid4()}",
+                    task_queue=task_queue,
+                )
+                elapsed = time.perf_counter() - started_at
+
+                assert processed_count == ITEM_COUNT
+                print(f"concurrency={concurrency:>3}: {elapsed:6.2f}s, {ITEM_COUNT / elapsed:8.0f} items/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
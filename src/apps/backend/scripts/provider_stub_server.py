@@ -0,0 +1,103 @@
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+from modules.logger.logger import Logger
+
+PORT = 4010
+SENDGRID_MAIL_SEND_PATH = "/v3/mail/send"
+TWILIO_MESSAGES_PATH = re.compile(r"^/2010-04-01/Accounts/(?P<account_sid>\w+)/Messages\.json$")
+
+
+class ProviderStubServer:
+    """
+    Local stand-in for the SendGrid mail send and Twilio message create endpoints, so the provider HTTP clients
+    can be exercised offline. Point `SENDGRID_BASE_URL` and `TWILIO_BASE_URL` at it. `latency_in_seconds` delays
+    every response and `status_code`, when set, replaces the success response, e.g. with 503 to trip the
+    circuit breakers.
+    """
+
+    def __init__(self, port: int = PORT) -> None:
+        self.latency_in_seconds = 0.0
+        self.status_code: Optional[int] = None
+        self.requests: List[Tuple[str, str]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._get_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "ProviderStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _get_handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.requests.append(("POST", self.path))
+                time.sleep(stub.latency_in_seconds)
+
+                twilio_match = TWILIO_MESSAGES_PATH.match(self.path)
+                if stub.status_code is not None:
+                    self._respond(stub.status_code, {"message": "Stubbed failure", "code": stub.status_code})
+                elif self.path == SENDGRID_MAIL_SEND_PATH:
+                    self._respond(202)
+                elif twilio_match:
+                    self._respond(
+                        201,
+                        {
+                            "sid": f"SM{uuid.uuid4().hex}",
+                            "account_sid": twilio_match.group("account_sid"),
+                            "status": "queued",
+                        },
+                    )
+                else:
+                    self._respond(404, {"message": f"No stub for {self.path}"})
+
+            def _respond(self, status_code: int, body: Optional[dict] = None) -> None:
+                content = json.dumps(body).encode() if body is not None else b""
+                try:
+                    self.send_response(status_code)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on its read timeout while the response was delayed
+                    pass
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    server = ProviderStubServer()
+    Logger.info(message=f"Serving SendGrid and Twilio stubs on {server.base_url}")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,19 @@ from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from bin.blueprints import api_blueprint, img_assets_blueprint, react_blueprint
+from modules.account.account_service import AccountService
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
+from modules.account.workers.account_deletion_cascade_sweep_worker import AccountDeletionCascadeSweepWorker
 from modules.application.application_service import ApplicationService
-from modules.application.errors import AppError, WorkerClientConnectionError
+from modules.application.errors import AppError
+from modules.application.rest_api.application_rest_api_server import ApplicationRestApiServer
+from modules.application.types import StartupJob
 from modules.application.workers.health_check_worker import HealthCheckWorker
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
 from modules.config.config_service import ConfigService
-from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.workers.notification_digest_flush_worker import NotificationDigestFlushWorker
+from modules.notification.workers.notification_outbox_dispatcher_worker import NotificationOutboxDispatcherWorker
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from scripts.bootstrap_app import BootstrapApp
 
@@ -24,19 +29,61 @@ cors = CORS(app, resources={r"/*": {"origins": "http://localhost:3000"}})
 # Mount deps
 LoggerManager.mount_logger()
 
-# Run bootstrap tasks
-BootstrapApp().run()
-
-# Connect to Temporal Server
-try:
-    ApplicationService.connect_temporal_server()
-
-    # Start the health check worker
-    # In production, it is optional to run this worker
-    ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
-
-except WorkerClientConnectionError as e:
-    Logger.critical(message=e.message)
+# Run one-time startup jobs once per deployment, in the background so that boot does not wait on Mongo or Temporal
+ApplicationService.register_startup_job(job=StartupJob(name="bootstrap_app", run=BootstrapApp().run))
+
+# Start the health check worker
+# In production, it is optional to run this worker
+ApplicationService.register_startup_job(
+    job=StartupJob(
+        name="schedule_health_check_worker",
+        run=lambda: ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *"),
+        requires_temporal=True,
+    )
+)
+
+# Populate the normalized username and phone number fields on accounts created before they were maintained, until
+# the backfill worker records that every account is done
+ApplicationService.register_startup_job(
+    job=StartupJob(
+        name="backfill_account_identity_fields", run=AccountService.start_identity_backfill, requires_temporal=True
+    )
+)
+
+# Restart the deletion cascades that could not be started or did not finish
+ApplicationService.register_startup_job(
+    job=StartupJob(
+        name="schedule_account_deletion_cascade_sweep_worker",
+        run=lambda: ApplicationService.schedule_worker_as_cron(
+            cls=AccountDeletionCascadeSweepWorker, cron_schedule="*/15 * * * *"
+        ),
+        requires_temporal=True,
+    )
+)
+
+# Send the emails and SMS queued in the notification outbox
+ApplicationService.register_startup_job(
+    job=StartupJob(
+        name="schedule_notification_outbox_dispatcher_worker",
+        run=lambda: ApplicationService.schedule_worker_as_cron(
+            cls=NotificationOutboxDispatcherWorker, cron_schedule="* * * * *"
+        ),
+        requires_temporal=True,
+    )
+)
+
+# Send the notification digests whose window is over
+ApplicationService.register_startup_job(
+    job=StartupJob(
+        name="schedule_notification_digest_flush_worker",
+        run=lambda: ApplicationService.schedule_worker_as_cron(
+            cls=NotificationDigestFlushWorker, cron_schedule="* * * * *"
+        ),
+        requires_temporal=True,
+    )
+)
+
+ApplicationService.run_startup_jobs()
 
 
 # Apply ProxyFix to interpret `X-Forwarded` headers if enabled in configuration
@@ -58,6 +105,10 @@ api_blueprint.register_blueprint(account_blueprint)
 task_blueprint = TaskRestApiServer.create()
 api_blueprint.register_blueprint(task_blueprint)
 
+# Register application apis
+application_blueprint = ApplicationRestApiServer.create()
+api_blueprint.register_blueprint(application_blueprint)
+
 app.register_blueprint(api_blueprint)
 
 # Register frontend elements
@@ -1,20 +1,69 @@
-from typing import List, Type
+import inspect
+from typing import Any, Callable, List, Type
 
 from temporalio import activity, workflow
 
-from modules.application.types import BaseWorker, RegisteredWorker
+from modules.account.workers.account_deletion_cascade_sweep_worker import AccountDeletionCascadeSweepWorker
+from modules.account.workers.account_deletion_cascade_worker import AccountDeletionCascadeWorker
+from modules.account.workers.account_identity_backfill_worker import AccountIdentityBackfillWorker
+from modules.application.internal.event_loop_stall_detector import EventLoopStallDetector
+from modules.application.internal.worker_executor import WorkerExecutor
+from modules.application.internal.worker_metrics import WorkerMetrics
+from modules.application.types import BaseWorker, RegisteredWorker, WorkerExecutionMode
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.config.config_service import ConfigService
+from modules.notification.workers.notification_digest_flush_worker import NotificationDigestFlushWorker
+from modules.notification.workers.notification_outbox_dispatcher_worker import NotificationOutboxDispatcherWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [
+        HealthCheckWorker,
+        AccountIdentityBackfillWorker,
+        AccountDeletionCascadeWorker,
+        AccountDeletionCascadeSweepWorker,
+        NotificationOutboxDispatcherWorker,
+        NotificationDigestFlushWorker,
+    ]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
+    @staticmethod
+    def _get_activity_fn(cls: Type[BaseWorker]) -> Callable[..., Any]:
+        execute = cls.execute
+        execution_mode = cls.execution_mode
+
+        # A synchronous execute() would block the worker event loop, so it always runs on the thread pool
+        if execution_mode == WorkerExecutionMode.ASYNC and not inspect.iscoroutinefunction(execute):
+            execution_mode = WorkerExecutionMode.THREAD
+
+        if execution_mode != WorkerExecutionMode.ASYNC:
+            # Keep the original function around, the executor calls it from a pool thread or process
+            setattr(cls, "unwrapped_execute", execute)
+
+        detect_stalls = ConfigService[bool].get_value(key="temporal.debug.detect_event_loop_stalls", default=False)
+
+        # Always wrap in a plain function, execute() may be a bound classmethod that cannot hold the activity
+        # definition attribute
+        async def execute_activity(*args: Any) -> Any:
+            async with WorkerMetrics.record_execution(cls.__name__):
+                if execution_mode != WorkerExecutionMode.ASYNC:
+                    return await WorkerExecutor.run(cls, args, execution_mode)
+
+                if not detect_stalls:
+                    return await execute(*args)
+
+                with EventLoopStallDetector.track_activity(cls.__name__):
+                    return await execute(*args)
+
+        return execute_activity
+
     @staticmethod
     def _register_worker(cls: Type[BaseWorker]) -> None:
         # Wrap the execute() method so Temporal recognizes it as an activity
-        wrapped_execute = activity.defn(fn=cls.execute, name=f"{cls.__name__}_execute")  # type: ignore
+        wrapped_execute = activity.defn(
+            fn=TemporalConfig._get_activity_fn(cls), name=f"{cls.__name__}_execute"
+        )  # type: ignore
         setattr(cls, "execute", wrapped_execute)
 
         # Wrap the run() method so Temporal recognizes it as the application entry point
@@ -1,10 +1,18 @@
+import argparse
 import asyncio
+import signal
+from datetime import timedelta
+from typing import Any, List, Optional
 
 from dotenv import load_dotenv
 from temporalio.client import Client
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.service import RetryConfig
 from temporalio.worker import UnsandboxedWorkflowRunner, Worker
 
+from modules.application.internal.event_loop_stall_detector import EventLoopStallDetector
+from modules.application.internal.payload_compression_codec import PayloadCompressionCodec
+from modules.application.internal.worker_executor import WorkerExecutor
 from modules.application.types import WorkerPriority
 from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
@@ -12,7 +20,25 @@ from modules.logger.logger_manager import LoggerManager
 from temporal_config import TemporalConfig
 
 
-async def main() -> None:
+def get_runtime(metrics_port: Optional[int]) -> Optional[Runtime]:
+    if not ConfigService[bool].get_value(key="temporal.metrics.enabled", default=False):
+        return None
+
+    host = ConfigService[str].get_value(key="temporal.metrics.host")
+    port = metrics_port or ConfigService[int].get_value(key="temporal.metrics.port")
+    Logger.info(message=f"Exposing temporal worker metrics at http://{host}:{port}/metrics")
+
+    # Slot usage, schedule-to-start latency and activity failures are reported by the SDK itself, the
+    # per-worker and provider request metrics from WorkerMetrics are exported on the same endpoint
+    runtime = Runtime(
+        telemetry=TelemetryConfig(metrics=PrometheusConfig(bind_address=f"{host}:{port}", durations_as_seconds=True))
+    )
+    # Metrics recorded outside of an activity, such as those of the provider HTTP clients, use the default runtime
+    Runtime.set_default(runtime, error_if_already_set=False)
+    return runtime
+
+
+async def main(priorities: Optional[List[WorkerPriority]] = None, metrics_port: Optional[int] = None) -> None:
     load_dotenv()
 
     # Mount logger and workers
@@ -20,17 +46,23 @@ async def main() -> None:
     TemporalConfig.mount_workers()
 
     server_address = ConfigService[str].get_value(key="temporal.server_address")
+    graceful_shutdown_timeout = ConfigService[int].get_value(key="temporal.graceful_shutdown_timeout_in_seconds")
 
     try:
-        client = await Client.connect(server_address, retry_config=RetryConfig(max_retries=3))
+        client = await Client.connect(
+            server_address,
+            retry_config=RetryConfig(max_retries=3),
+            data_converter=PayloadCompressionCodec.get_data_converter(),
+            runtime=get_runtime(metrics_port),
+        )
     except RuntimeError:
         Logger.error(message=f"Failed to connect to Temporal server at {server_address}. Exiting...")
         return
 
-    worker_coros = []
+    temporal_workers = []
 
-    # Iterate over each priority level defined in WorkerPriority enum
-    for priority in WorkerPriority:
+    # Iterate over each requested priority level, all of WorkerPriority by default
+    for priority in priorities or list(WorkerPriority):
         # Filter workers for the current priority
         workers_for_priority = [
             worker.cls for worker in TemporalConfig.get_all_registered_workers() if worker.priority == priority
@@ -42,9 +74,10 @@ async def main() -> None:
         # Only create a application if there are workers for that priority
         if workers_for_priority:
             task_queue = priority.value
+            queue_settings = WorkerExecutor.get_queue_settings(priority)
             Logger.info(
                 message=f"Starting temporal worker on queue '{task_queue}' for priority '{priority.name}' "
-                f"with {len(workers_for_priority)} worker(s)."
+                f"with {len(workers_for_priority)} worker(s) and settings {queue_settings}."
             )
             temporal_worker = Worker(
                 client,
@@ -52,14 +85,58 @@ async def main() -> None:
                 workflows=workers_for_priority,
                 activities=activity_for_priority,
                 workflow_runner=UnsandboxedWorkflowRunner(),
+                max_concurrent_activities=queue_settings.max_concurrent_activities,
+                max_concurrent_workflow_tasks=queue_settings.max_concurrent_workflow_tasks,
+                max_concurrent_activity_task_polls=queue_settings.max_concurrent_activity_task_polls,
+                max_concurrent_workflow_task_polls=queue_settings.max_concurrent_workflow_task_polls,
+                graceful_shutdown_timeout=timedelta(seconds=graceful_shutdown_timeout),
             )
-            worker_coros.append(temporal_worker.run())
+            temporal_workers.append(temporal_worker)
 
-    if worker_coros:
-        await asyncio.gather(*worker_coros)
-    else:
+    if not temporal_workers:
         Logger.error(message="No workers registered for any priority.")
+        return
+
+    # Stop polling and let in-flight activities finish when asked to shut down
+    shutdown_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, shutdown_requested.set)
+
+    stall_detector = None
+    if ConfigService[bool].get_value(key="temporal.debug.detect_event_loop_stalls", default=False):
+        stall_threshold = ConfigService[int].get_value(key="temporal.debug.event_loop_stall_threshold_in_ms")
+        stall_detector = EventLoopStallDetector(loop, threshold_in_ms=stall_threshold)
+        stall_detector.start()
+
+    try:
+        workers_run: asyncio.Future[Any] = asyncio.gather(
+            *[temporal_worker.run() for temporal_worker in temporal_workers]
+        )
+        shutdown_wait: asyncio.Future[Any] = asyncio.ensure_future(shutdown_requested.wait())
+        await asyncio.wait([workers_run, shutdown_wait], return_when=asyncio.FIRST_COMPLETED)
+
+        if shutdown_requested.is_set():
+            Logger.info(message="Shutdown requested, draining temporal workers...")
+            await asyncio.gather(*[temporal_worker.shutdown() for temporal_worker in temporal_workers])
+
+        shutdown_wait.cancel()
+        await workers_run
+    finally:
+        if stall_detector:
+            stall_detector.stop()
+        WorkerExecutor.shutdown()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run temporal workers")
+    parser.add_argument(
+        "--queue",
+        action="append",
+        choices=[priority.value for priority in WorkerPriority],
+        help="Priority queue to serve, can be repeated. Serves all queues by default.",
+    )
+    parser.add_argument("--metrics-port", type=int, help="Port of the Prometheus metrics endpoint.")
+    cli_args = parser.parse_args()
+
+    asyncio.run(main([WorkerPriority(queue) for queue in cli_args.queue or []], metrics_port=cli_args.metrics_port))
@@ -0,0 +1,241 @@
+import asyncio
+import math
+import multiprocessing
+import signal
+import time
+from dataclasses import dataclass, field
+from multiprocessing.process import BaseProcess
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from temporalio.api.enums.v1 import DescribeTaskQueueMode, TaskQueueType
+from temporalio.api.taskqueue.v1 import TaskQueue, TaskQueueVersionSelection
+from temporalio.api.workflowservice.v1 import DescribeTaskQueueRequest
+from temporalio.client import Client
+from temporalio.service import RetryConfig, RPCError
+
+from modules.application.internal.worker_executor import WorkerExecutor
+from modules.application.types import WorkerPriority, WorkerQueueSettings
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+from temporal_config import TemporalConfig
+
+
+def run_worker_process(priority_value: str, metrics_port: int) -> None:
+    # Imported here so that the supervisor itself does not register workflows or activities
+    import temporal_server
+
+    asyncio.run(temporal_server.main([WorkerPriority(priority_value)], metrics_port=metrics_port))
+
+
+@dataclass
+class WorkerProcessSlot:
+    priority: WorkerPriority
+    metrics_port: int
+    process: Optional[BaseProcess] = None
+    started_at: float = 0.0
+    failures: int = 0
+    restart_at: float = 0.0
+
+
+@dataclass
+class QueueProcessGroup:
+    priority: WorkerPriority
+    settings: WorkerQueueSettings
+    slots: List[WorkerProcessSlot] = field(default_factory=list)
+
+
+class TemporalWorkerSupervisor:
+    """
+    Runs `temporal_server.py` as N child processes per priority queue so activity throughput scales with cores.
+
+    Crashed children are restarted with exponential backoff, SIGTERM drains every child before exiting, and
+    the number of children per queue follows the queue backlog reported by the Temporal server within the
+    configured min/max process counts.
+    """
+
+    def __init__(self) -> None:
+        self.check_interval = ConfigService[int].get_value(key="temporal.supervisor.check_interval_in_seconds")
+        self.autoscale_interval = ConfigService[int].get_value(key="temporal.supervisor.autoscale_interval_in_seconds")
+        self.backoff_initial = ConfigService[int].get_value(
+            key="temporal.supervisor.restart_backoff_initial_in_seconds"
+        )
+        self.backoff_max = ConfigService[int].get_value(key="temporal.supervisor.restart_backoff_max_in_seconds")
+        self.stable_uptime = ConfigService[int].get_value(key="temporal.supervisor.stable_process_uptime_in_seconds")
+        self.graceful_shutdown_timeout = ConfigService[int].get_value(
+            key="temporal.graceful_shutdown_timeout_in_seconds"
+        )
+        self.metrics_base_port = ConfigService[int].get_value(key="temporal.metrics.port")
+
+        self.context = multiprocessing.get_context("spawn")
+        # Only supervise queues that have workers, a child for an empty queue would exit straight away
+        self.groups: Dict[WorkerPriority, QueueProcessGroup] = {
+            priority: QueueProcessGroup(priority=priority, settings=WorkerExecutor.get_queue_settings(priority))
+            for priority in WorkerPriority
+            if any(worker.priority == priority for worker in TemporalConfig.WORKERS)
+        }
+        self.retired_slots: List[WorkerProcessSlot] = []
+        self.client: Optional[Client] = None
+        self.shutdown_requested = asyncio.Event()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, self.shutdown_requested.set)
+
+        for group in self.groups.values():
+            self._resize(group, group.settings.min_process_count)
+
+        last_autoscale = time.monotonic()
+        while not self.shutdown_requested.is_set():
+            self._restart_crashed_processes()
+
+            if time.monotonic() - last_autoscale >= self.autoscale_interval:
+                await self._autoscale()
+                last_autoscale = time.monotonic()
+
+            try:
+                await asyncio.wait_for(self.shutdown_requested.wait(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+
+        await self._drain()
+
+    def _start_process(self, slot: WorkerProcessSlot) -> None:
+        process = self.context.Process(
+            target=run_worker_process,
+            args=(slot.priority.value, slot.metrics_port),
+            name=f"temporal-worker-{slot.priority.value}",
+        )
+        process.start()
+        slot.process = process
+        slot.started_at = time.monotonic()
+        Logger.info(message=f"Started temporal worker process {process.pid} for queue '{slot.priority.value}'")
+
+    def _restart_crashed_processes(self) -> None:
+        self.retired_slots = [
+            slot for slot in self.retired_slots if slot.process is not None and slot.process.is_alive()
+        ]
+
+        now = time.monotonic()
+        for group in self.groups.values():
+            for slot in group.slots:
+                if slot.process is not None and slot.process.is_alive():
+                    # Reset the backoff once a process has stayed up long enough
+                    if slot.failures and now - slot.started_at >= self.stable_uptime:
+                        slot.failures = 0
+                    continue
+
+                if slot.process is not None:
+                    slot.failures += 1
+                    delay = min(self.backoff_initial * 2 ** (slot.failures - 1), self.backoff_max)
+                    slot.restart_at = now + delay
+                    Logger.error(
+                        message=f"Temporal worker process {slot.process.pid} for queue '{slot.priority.value}' "
+                        f"exited with code {slot.process.exitcode}, restarting in {delay} seconds"
+                    )
+                    slot.process = None
+
+                if now >= slot.restart_at:
+                    self._start_process(slot)
+
+    def _resize(self, group: QueueProcessGroup, process_count: int) -> None:
+        while len(group.slots) < process_count:
+            slot = WorkerProcessSlot(priority=group.priority, metrics_port=self._allocate_metrics_port())
+            self._start_process(slot)
+            group.slots.append(slot)
+
+        while len(group.slots) > process_count:
+            slot = group.slots.pop()
+            if slot.process is not None and slot.process.is_alive():
+                # SIGTERM lets the child finish its in-flight activities before exiting
+                slot.process.terminate()
+                self.retired_slots.append(slot)
+
+    def _allocate_metrics_port(self) -> int:
+        # Every child exposes its own metrics endpoint, draining children keep theirs until they exit
+        used_ports = {slot.metrics_port for group in self.groups.values() for slot in group.slots}
+        used_ports.update(slot.metrics_port for slot in self.retired_slots)
+
+        port = self.metrics_base_port + 1
+        while port in used_ports:
+            port += 1
+        return port
+
+    async def _autoscale(self) -> None:
+        for group in self.groups.values():
+            settings = group.settings
+            if settings.max_process_count <= settings.min_process_count:
+                continue
+
+            backlog = await self._get_backlog(group.priority)
+            if backlog is None:
+                continue
+
+            desired = math.ceil(backlog / settings.backlog_per_process) if settings.backlog_per_process else 0
+            desired = max(settings.min_process_count, min(settings.max_process_count, desired))
+            current = len(group.slots)
+
+            # Scale up straight to the target, scale down one process at a time to avoid flapping
+            target = desired if desired > current else max(desired, current - 1)
+            if target != current:
+                Logger.info(
+                    message=f"Scaling queue '{group.priority.value}' from {current} to {target} worker process(es) "
+                    f"for a backlog of {backlog}"
+                )
+                self._resize(group, target)
+
+    async def _get_backlog(self, priority: WorkerPriority) -> Optional[int]:
+        try:
+            client = await self._get_client()
+            response = await client.workflow_service.describe_task_queue(
+                DescribeTaskQueueRequest(
+                    namespace=client.namespace,
+                    task_queue=TaskQueue(name=priority.value),
+                    api_mode=DescribeTaskQueueMode.DESCRIBE_TASK_QUEUE_MODE_ENHANCED,
+                    versions=TaskQueueVersionSelection(unversioned=True),
+                    task_queue_types=[TaskQueueType.TASK_QUEUE_TYPE_WORKFLOW, TaskQueueType.TASK_QUEUE_TYPE_ACTIVITY],
+                    report_stats=True,
+                )
+            )
+        except (RPCError, RuntimeError) as e:
+            Logger.error(message=f"Could not fetch backlog for queue '{priority.value}': {e}")
+            return None
+
+        return sum(
+            type_info.stats.approximate_backlog_count
+            for version_info in response.versions_info.values()
+            for type_info in version_info.types_info.values()
+        )
+
+    async def _get_client(self) -> Client:
+        if self.client is None:
+            server_address = ConfigService[str].get_value(key="temporal.server_address")
+            self.client = await Client.connect(server_address, retry_config=RetryConfig(max_retries=3))
+        return self.client
+
+    async def _drain(self) -> None:
+        Logger.info(message="Shutdown requested, draining temporal worker processes...")
+        slots = [slot for group in self.groups.values() for slot in group.slots] + self.retired_slots
+        processes = [slot.process for slot in slots if slot.process is not None and slot.process.is_alive()]
+        for process in processes:
+            process.terminate()
+
+        deadline = time.monotonic() + self.graceful_shutdown_timeout + self.check_interval
+        for process in processes:
+            await asyncio.to_thread(process.join, max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                Logger.error(message=f"Temporal worker process {process.pid} did not drain in time, killing it")
+                process.kill()
+
+
+async def main() -> None:
+    load_dotenv()
+    LoggerManager.mount_logger()
+
+    await TemporalWorkerSupervisor().run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
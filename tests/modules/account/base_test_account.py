@@ -1,6 +1,8 @@
 import unittest
 from typing import Callable
 
+from modules.account.internal.account_reader import AccountReader
+from modules.account.internal.store.account_backfill_repository import AccountBackfillRepository
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
@@ -19,5 +21,7 @@ class BaseTestAccount(unittest.TestCase):
     def teardown_method(self, method: Callable) -> None:
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
+        AccountBackfillRepository.collection().delete_many({})
+        AccountReader.IDENTITY_BACKFILL_DONE = False
         OTPRepository.collection().delete_many({})
         AccountNotificationPreferencesRepository.collection().delete_many({})
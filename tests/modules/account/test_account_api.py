@@ -12,6 +12,7 @@ from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.account.workers.account_deletion_cascade_worker import AccountDeletionCascadeWorker
 from modules.authentication.types import AccessTokenErrorCode, OTPErrorCode
 from modules.config.config_service import ConfigService
 from modules.notification.sms_service import SMSService
@@ -284,7 +285,8 @@ class TestAccountApi(BaseTestAccount):
 
             assert response.status_code == 500
 
-    def test_delete_account_success(self) -> None:
+    @mock.patch("modules.account.account_service.ApplicationService.run_worker_immediately")
+    def test_delete_account_success(self, mock_run_worker_immediately) -> None:
         account = AccountService.create_account_by_username_and_password(
             params=CreateAccountByUsernameAndPasswordParams(
                 first_name="first_name", last_name="last_name", password="password", username="username"
@@ -305,6 +307,9 @@ class TestAccountApi(BaseTestAccount):
 
             assert response.status_code == 204
             assert response.data == b""
+            mock_run_worker_immediately.assert_called_once_with(
+                cls=AccountDeletionCascadeWorker, arguments=(account.id,), deduplicate=True
+            )
 
     def test_delete_account_not_found(self) -> None:
         account = AccountService.create_account_by_username_and_password(
@@ -360,7 +365,8 @@ class TestAccountApi(BaseTestAccount):
             assert response.json
             assert response.json.get("code") == AccessTokenErrorCode.ACCESS_TOKEN_INVALID
 
-    def test_deleted_account_cannot_be_retrieved(self) -> None:
+    @mock.patch("modules.account.account_service.ApplicationService.run_worker_immediately")
+    def test_deleted_account_cannot_be_retrieved(self, mock_run_worker_immediately) -> None:
         account = AccountService.create_account_by_username_and_password(
             params=CreateAccountByUsernameAndPasswordParams(
                 first_name="first_name", last_name="last_name", password="password", username="username"
@@ -389,7 +395,8 @@ class TestAccountApi(BaseTestAccount):
             assert get_response.json
             assert get_response.json.get("code") == AccountErrorCode.NOT_FOUND
 
-    def test_deleted_account_cannot_login(self) -> None:
+    @mock.patch("modules.account.account_service.ApplicationService.run_worker_immediately")
+    def test_deleted_account_cannot_login(self, mock_run_worker_immediately) -> None:
         account = AccountService.create_account_by_username_and_password(
             params=CreateAccountByUsernameAndPasswordParams(
                 first_name="first_name", last_name="last_name", password="password", username="username"
@@ -1,10 +1,24 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
+import pytest
+from bson.objectid import ObjectId
 from server import app
+from temporalio.testing import ActivityEnvironment
 
 from modules.account.account_service import AccountService
-from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundError
+from modules.account.errors import (
+    AccountIdentityBackfillConflictError,
+    AccountNotFoundError,
+    AccountWithIdNotFoundError,
+    AccountWithPhoneNumberExistsError,
+    AccountWithUserNameExistsError,
+)
+from modules.account.internal.account_reader import AccountReader
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
     AccountErrorCode,
     AccountSearchByIdParams,
@@ -13,7 +27,19 @@ from modules.account.types import (
     PhoneNumber,
     UpdateAccountProfileParams,
 )
+from modules.account.workers.account_deletion_cascade_sweep_worker import AccountDeletionCascadeSweepWorker
+from modules.account.workers.account_deletion_cascade_worker import AccountDeletionCascadeWorker
+from modules.account.workers.account_identity_backfill_worker import AccountIdentityBackfillWorker
+from modules.application.errors import WorkerClientConnectionError
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
 from modules.authentication.types import AccessTokenPayload
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams
 from tests.modules.account.base_test_account import BaseTestAccount
 
 
@@ -295,3 +321,214 @@ class TestAccountService(BaseTestAccount):
         assert new_account.id != original_account.id
         assert new_account.phone_number.country_code == "+91"
         assert new_account.phone_number.phone_number == "9999999999"
+
+    def test_usernames_and_phone_numbers_are_unique_after_normalization(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="User@Example.com"
+            )
+        )
+
+        with self.assertRaises(AccountWithUserNameExistsError):
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username="user@example.com "
+                )
+            )
+
+        assert AccountService.get_account_by_username(username="USER@example.com").id == account.id
+
+        AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(
+                phone_number=PhoneNumber(country_code="+91", phone_number="9999999999")
+            )
+        )
+        with self.assertRaises(AccountWithPhoneNumberExistsError):
+            AccountWriter.create_account_by_phone_number(
+                params=CreateAccountByPhoneNumberParams(
+                    phone_number=PhoneNumber(country_code="+91", phone_number="99999 99999")
+                )
+            )
+
+    def test_identity_backfill_populates_normalized_fields(self) -> None:
+        AccountRepository.collection().insert_many(
+            [
+                {"active": True, "username": "Legacy@Example.com", "phone_number": None},
+                {
+                    "active": True,
+                    "username": "",
+                    "phone_number": {"country_code": "+91", "phone_number": "99999 99999"},
+                },
+            ]
+        )
+
+        AccountIdentityBackfillWorker.process_batch(
+            list(AccountRepository.collection().find(AccountIdentityBackfillWorker.get_filter()))
+        )
+
+        assert AccountRepository.collection().count_documents(AccountIdentityBackfillWorker.get_filter()) == 0
+        assert AccountRepository.collection().find_one({"username_lc": "legacy@example.com"})
+        assert AccountRepository.collection().find_one({"phone_e164": "+919999999999"})
+        assert AccountService.get_account_by_phone_number(
+            phone_number=PhoneNumber(country_code="+91", phone_number="9999999999")
+        )
+
+    def test_signup_cannot_take_the_identity_of_an_account_that_is_not_backfilled(self) -> None:
+        AccountRepository.collection().insert_many(
+            [
+                {"active": True, "username": "legacy@example.com", "phone_number": None},
+                {"active": True, "username": "", "phone_number": {"country_code": "+91", "phone_number": "9999999999"}},
+            ]
+        )
+
+        with self.assertRaises(AccountWithUserNameExistsError):
+            AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams(
+                    first_name="first_name", last_name="last_name", password="password", username="legacy@example.com"
+                )
+            )
+        with self.assertRaises(AccountWithPhoneNumberExistsError):
+            AccountWriter.create_account_by_phone_number(
+                params=CreateAccountByPhoneNumberParams(
+                    phone_number=PhoneNumber(country_code="+91", phone_number="9999999999")
+                )
+            )
+
+    def test_identity_backfill_fails_on_duplicate_accounts(self) -> None:
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="user@example.com"
+            )
+        )
+        AccountRepository.collection().insert_many(
+            [
+                {"active": True, "username": "User@Example.com", "phone_number": None},
+                {"active": True, "username": "other@example.com", "phone_number": None},
+            ]
+        )
+
+        with self.assertRaises(AccountIdentityBackfillConflictError):
+            AccountIdentityBackfillWorker.process_batch(
+                list(AccountRepository.collection().find(AccountIdentityBackfillWorker.get_filter()))
+            )
+
+        assert AccountRepository.collection().find_one({"username_lc": "other@example.com"})
+
+    def test_identity_backfill_records_its_completion_only_once_every_account_is_backfilled(self) -> None:
+        AccountRepository.collection().insert_many(
+            [
+                {"active": True, "username": "legacy@example.com", "phone_number": None},
+                {"active": True, "username": "Legacy@Example.com", "phone_number": None},
+            ]
+        )
+
+        with pytest.raises(AccountIdentityBackfillConflictError):
+            asyncio.run(ActivityEnvironment().run(AccountIdentityBackfillWorker.execute))
+        assert not AccountReader.is_identity_backfill_done()
+
+        AccountRepository.collection().delete_many({"username": "Legacy@Example.com"})
+        asyncio.run(ActivityEnvironment().run(AccountIdentityBackfillWorker.execute))
+        assert AccountReader.is_identity_backfill_done()
+
+    def test_signup_relies_on_the_unique_indexes_once_the_identity_backfill_is_done(self) -> None:
+        params = CreateAccountByUsernameAndPasswordParams(
+            first_name="first_name", last_name="last_name", password="password", username="user@example.com"
+        )
+        AccountService.create_account_by_username_and_password(params=params)
+        AccountWriter.mark_identity_backfill_as_done()
+
+        with patch.object(AccountReader, "check_username_not_exist") as mock_check_username_not_exist:
+            with self.assertRaises(AccountWithUserNameExistsError):
+                AccountService.create_account_by_username_and_password(params=params)
+
+        mock_check_username_not_exist.assert_not_called()
+
+    def test_taken_username_is_rejected_before_the_password_is_hashed(self) -> None:
+        params = CreateAccountByUsernameAndPasswordParams(
+            first_name="first_name", last_name="last_name", password="password", username="user@example.com"
+        )
+        AccountService.create_account_by_username_and_password(params=params)
+
+        with patch.object(AccountUtil, "hash_password") as mock_hash_password:
+            with self.assertRaises(AccountWithUserNameExistsError):
+                AccountService.create_account_by_username_and_password(params=params)
+
+        mock_hash_password.assert_not_called()
+
+    @patch(
+        "modules.account.account_service.ApplicationService.run_worker_immediately",
+        side_effect=WorkerClientConnectionError(server_address="localhost:7233"),
+    )
+    def test_cascades_that_could_not_be_started_are_swept(self, mock_run_worker_immediately) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        AccountService.delete_account(account_id=account.id)
+
+        # Within the cascade timeout the account is left to the cascade that may still be running
+        assert AccountDeletionCascadeSweepWorker.execute() == []
+
+        AccountRepository.collection().update_one(
+            {"_id": ObjectId(account.id)},
+            {
+                "$set": {
+                    "cascade_requested_at": datetime.now()
+                    - timedelta(seconds=AccountDeletionCascadeWorker.max_execution_time_in_seconds + 1)
+                }
+            },
+        )
+        assert AccountDeletionCascadeSweepWorker.execute() == [account.id]
+        # The claim gives the restarted cascade time to finish before the account is swept again
+        assert AccountDeletionCascadeSweepWorker.execute() == []
+
+    @patch("modules.account.workers.account_deletion_cascade_worker.activity")
+    @patch("modules.account.account_service.ApplicationService.run_worker_immediately")
+    def test_delete_account_cascades_to_dependent_documents(self, mock_run_worker_immediately, mock_activity) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        account = AccountService.get_or_create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number)
+        )
+        for index in range(3):
+            TaskService.create_task(
+                params=CreateTaskParams(account_id=account.id, title=f"task {index}", description="description")
+            )
+        PasswordResetTokenWriter.create_password_reset_token(account.id, "token")
+
+        AccountService.delete_account(account_id=account.id)
+
+        mock_run_worker_immediately.assert_called_once_with(
+            cls=AccountDeletionCascadeWorker, arguments=(account.id,), deduplicate=True
+        )
+        assert TaskRepository.collection().count_documents({"account_id": account.id, "active": True}) == 3
+        assert AccountRepository.collection().find_one({"_id": ObjectId(account.id)})["cascade_pending"] is True
+
+        mock_activity.info.return_value.heartbeat_details = []
+        with (
+            patch.object(AccountDeletionCascadeWorker, "batch_size", 2),
+            patch.object(AccountDeletionCascadeWorker, "batch_interval_in_seconds", 0),
+        ):
+            progress = asyncio.run(AccountDeletionCascadeWorker.execute(account.id))
+            # A retried attempt finds nothing left to deactivate
+            assert asyncio.run(AccountDeletionCascadeWorker.execute(account.id)) == {
+                "tasks": 0,
+                "notification_preferences": 0,
+                "password_reset_tokens": 0,
+                "otps": 0,
+            }
+
+        assert progress == {"tasks": 3, "notification_preferences": 1, "password_reset_tokens": 1, "otps": 1}
+        assert AccountRepository.collection().find_one({"_id": ObjectId(account.id)})["cascade_pending"] is False
+        assert TaskRepository.collection().count_documents({"account_id": account.id, "active": True}) == 0
+        assert (
+            AccountNotificationPreferencesRepository.collection().count_documents(
+                {"account_id": account.id, "active": True}
+            )
+            == 0
+        )
+        assert (
+            OTPRepository.collection().count_documents({"phone_number.phone_number": "9999999999", "active": True}) == 0
+        )
+        TaskRepository.collection().delete_many({"account_id": account.id})
@@ -3,6 +3,9 @@ import json
 from modules.account.account_service import AccountService
 from modules.account.types import CreateAccountByUsernameAndPasswordParams
 from modules.authentication.types import AccessTokenErrorCode
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 from server import app
@@ -49,6 +52,37 @@ class TestNotificationPreferencesApi(BaseTestAccount):
             assert "account_id" in response.json["notification_preferences"]
             assert response.json["notification_preferences"]["account_id"] == account.id
 
+    def test_get_account_with_notification_preferences_skips_inactive_preferences_and_password(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        AccountNotificationPreferencesRepository.collection().update_one(
+            {"account_id": account.id, "active": True}, {"$set": {"active": False}}
+        )
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False)
+        )
+
+        with app.test_client() as client:
+            access_token_response = client.post(
+                "http://127.0.0.1:8080/api/access-tokens",
+                headers=HEADERS,
+                data=json.dumps({"username": account.username, "password": "password"}),
+            )
+
+            response = client.get(
+                f"{ACCOUNT_URL}/{account.id}?include_notification_preferences=true",
+                headers={"Authorization": f"Bearer {access_token_response.json.get('token')}"},
+            )
+
+            assert response.status_code == 200
+            assert response.json
+            assert "hashed_password" not in response.json
+            assert response.json["username"] == account.username
+            assert response.json["notification_preferences"]["email_enabled"] is False
+
     def test_get_account_without_notification_preferences_parameter(self) -> None:
         account = AccountService.create_account_by_username_and_password(
             params=CreateAccountByUsernameAndPasswordParams(
@@ -5,6 +5,9 @@ from modules.account.types import (
     PhoneNumber,
 )
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 
@@ -184,6 +187,24 @@ class TestNotificationPreferencesService(BaseTestAccount):
         assert preferences.push_enabled is False
         assert preferences.sms_enabled is False
 
+    def test_repeated_updates_keep_a_single_preferences_document(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        for email_enabled in [False, True, False]:
+            preferences = NotificationService.create_or_update_account_notification_preferences(
+                account_id=account.id,
+                preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=email_enabled),
+            )
+
+        assert AccountNotificationPreferencesRepository.collection().count_documents({"account_id": account.id}) == 1
+        assert preferences.email_enabled is False
+        assert preferences.push_enabled is True
+        assert preferences.sms_enabled is True
+
     def test_account_creation_by_username_automatically_creates_notification_preferences(self):
         """Test that creating an account by username automatically creates notification preferences"""
         account = AccountService.create_account_by_username_and_password(
@@ -1,12 +1,16 @@
 import time
+from typing import Any, Tuple
+from unittest import mock
 
 import pytest
 from pytest import MonkeyPatch
 from temporalio.client import WorkflowExecutionStatus
+from temporalio.service import RPCError, RPCStatusCode
 
 from modules.application.application_service import ApplicationService
-from modules.application.errors import WorkerIdNotFoundError, WorkerNotRegisteredError
-from modules.application.types import BaseWorker
+from modules.application.errors import WorkerBulkStartError, WorkerIdNotFoundError, WorkerNotRegisteredError
+from modules.application.internal.worker_manager import WorkerManager
+from modules.application.types import BaseWorker, WorkerFilter
 from modules.application.workers.health_check_worker import HealthCheckWorker
 from modules.logger.logger import Logger
 from tests.modules.application.base_test_application import BaseTestApplication
@@ -23,6 +27,65 @@ class TestApplicationService(BaseTestApplication):
         assert worker_details.id == worker_id
         assert worker_details.status == WorkflowExecutionStatus.COMPLETED
 
+    def test_temporal_client_is_reused_across_calls(self) -> None:
+        worker_id = ApplicationService.run_worker_immediately(cls=HealthCheckWorker)
+        client = WorkerManager.CLIENT
+        assert client is not None
+
+        ApplicationService.get_worker_by_id(worker_id=worker_id)
+        ApplicationService.run_worker_immediately(cls=HealthCheckWorker)
+
+        assert WorkerManager.CLIENT is client
+
+    def test_run_workers_bulk(self) -> None:
+        worker_ids = ApplicationService.run_workers_bulk(cls=HealthCheckWorker, arguments_list=[()] * 5)
+
+        assert len(worker_ids) == 5
+        assert len(set(worker_ids)) == 5
+
+    def test_run_workers_bulk_deduplicates_identical_arguments(self) -> None:
+        arguments_list = [(f"bulk-{time.time()}", index % 2) for index in range(4)]
+
+        worker_ids = ApplicationService.run_workers_bulk(
+            cls=HealthCheckWorker, arguments_list=arguments_list, deduplicate=True
+        )
+        assert worker_ids[0] == worker_ids[2]
+        assert worker_ids[1] == worker_ids[3]
+        assert worker_ids[0] != worker_ids[1]
+
+        time.sleep(1)
+
+        resubmitted_worker_ids = ApplicationService.run_workers_bulk(
+            cls=HealthCheckWorker, arguments_list=arguments_list[:2], deduplicate=True
+        )
+        assert resubmitted_worker_ids == worker_ids[:2]
+
+    def test_run_workers_bulk_reports_the_started_ids_when_some_starts_fail(self) -> None:
+        async def start_worker(cls: Any, arguments: Tuple[Any, ...], deduplicate: bool = False) -> str:
+            if arguments[0] % 2:
+                raise RPCError("unavailable", RPCStatusCode.UNAVAILABLE, b"")
+            return f"worker-{arguments[0]}"
+
+        with mock.patch.object(WorkerManager, "_start_worker", side_effect=start_worker):
+            with pytest.raises(WorkerBulkStartError) as exc_info:
+                ApplicationService.run_workers_bulk(
+                    cls=HealthCheckWorker, arguments_list=[(index,) for index in range(4)]
+                )
+
+        assert exc_info.value.worker_ids == ["worker-0", None, "worker-2", None]
+
+    def test_list_workers_by_type_and_status(self) -> None:
+        worker_id = ApplicationService.run_worker_immediately(cls=HealthCheckWorker)
+        time.sleep(1)
+
+        page = ApplicationService.list_workers(
+            worker_filter=WorkerFilter(worker_type="HealthCheckWorker", status=WorkflowExecutionStatus.COMPLETED)
+        )
+
+        assert all(worker.worker_type == "HealthCheckWorker" for worker in page.items)
+        assert all(worker.status == WorkflowExecutionStatus.COMPLETED for worker in page.items)
+        assert worker_id in [worker.id for worker in page.items]
+
     def test_schedule_worker_as_cron(self) -> None:
         worker_id = ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/1 * * * *")
         assert worker_id
@@ -0,0 +1,67 @@
+import asyncio
+import dataclasses
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List
+
+from temporalio.testing import ActivityEnvironment
+
+from modules.application.batch_scan_worker import BatchScanWorker
+from modules.application.repository import ApplicationRepository
+from modules.application.types import BatchScanPartition
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class BatchScanTestRepository(ApplicationRepository):
+    collection_name = "batch_scan_test_items"
+
+
+class BatchScanTestWorker(BatchScanWorker):
+    repository = BatchScanTestRepository
+    batch_size = 7
+    parallelism = 3
+
+    processed: List[int] = []
+
+    @classmethod
+    def get_filter(cls, *args: Any) -> Dict[str, Any]:
+        return {"active": True}
+
+    @classmethod
+    def process_batch(cls, documents: List[Dict[str, Any]], *args: Any) -> None:
+        cls.processed.extend(document["number"] for document in documents)
+
+
+class TestBatchScanWorker(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        BatchScanTestWorker.processed = []
+        BatchScanTestRepository.collection().insert_many(
+            [{"number": number, "active": number % 10 != 0} for number in range(100)]
+        )
+
+    def teardown_method(self, method: Callable) -> None:
+        super().teardown_method(method)
+        BatchScanTestRepository.collection().delete_many({})
+
+    def test_scan_processes_every_matching_document_once(self) -> None:
+        heartbeats = []
+        env = ActivityEnvironment()
+        env.on_heartbeat = lambda *details: heartbeats.append(details)
+
+        asyncio.run(env.run(BatchScanTestWorker.execute))
+
+        assert sorted(BatchScanTestWorker.processed) == [number for number in range(100) if number % 10 != 0]
+        assert heartbeats
+        assert all(partition["done"] for partition in heartbeats[-1][0])
+
+    def test_scan_resumes_from_heartbeat_details(self) -> None:
+        ids = [document["_id"] for document in BatchScanTestRepository.collection().find({"active": True}).sort("_id")]
+        progress = [asdict(BatchScanPartition(start_id=None, end_id=None, last_id=str(ids[49])))]
+
+        env = ActivityEnvironment()
+        env.info = dataclasses.replace(env.info, heartbeat_details=[progress])
+
+        asyncio.run(env.run(BatchScanTestWorker.execute))
+
+        assert len(BatchScanTestWorker.processed) == 40
+        assert min(BatchScanTestWorker.processed) > 50
@@ -0,0 +1,74 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from server import app
+
+from modules.application.common.bounded_executor import BoundedExecutor
+from modules.application.common.password_hasher import PasswordHasher
+from modules.application.errors import ExecutorErrorCode, ExecutorQueueTimeoutError, ExecutorSaturatedError
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestBoundedExecutor(BaseTestApplication):
+    def _occupy(self, executor: BoundedExecutor, release: threading.Event, calls: int) -> ThreadPoolExecutor:
+        callers = ThreadPoolExecutor(max_workers=calls)
+        for _ in range(calls):
+            callers.submit(executor.run, release.wait)
+        return callers
+
+    def _wait_for(self, executor: BoundedExecutor, active: int, queued: int) -> None:
+        for _ in range(100):
+            stats = executor.get_stats()
+            if stats.active == active and stats.queued == queued:
+                return
+            time.sleep(0.01)
+        raise AssertionError(f"Executor did not reach {active} active and {queued} queued calls")
+
+    def test_rejects_calls_once_the_queue_is_full(self) -> None:
+        executor = BoundedExecutor(name="test", max_workers=1, max_queue_size=1, max_queue_time_in_seconds=5)
+        release = threading.Event()
+        callers = self._occupy(executor, release, calls=2)
+        self._wait_for(executor, active=1, queued=1)
+
+        with self.assertRaises(ExecutorSaturatedError):
+            executor.run(lambda: None)
+
+        release.set()
+        callers.shutdown(wait=True)
+        stats = executor.get_stats()
+        assert (stats.completed, stats.rejected, stats.active, stats.queued) == (2, 1, 0, 0)
+
+    def test_sheds_calls_that_wait_longer_than_the_queue_time(self) -> None:
+        executor = BoundedExecutor(name="test", max_workers=1, max_queue_size=5, max_queue_time_in_seconds=0.05)
+        release = threading.Event()
+        callers = self._occupy(executor, release, calls=1)
+        self._wait_for(executor, active=1, queued=0)
+
+        with self.assertRaises(ExecutorQueueTimeoutError):
+            executor.run(lambda: None)
+
+        release.set()
+        callers.shutdown(wait=True)
+        assert executor.run(lambda: "ran") == "ran"
+        stats = executor.get_stats()
+        assert (stats.completed, stats.timed_out, stats.queued) == (2, 1, 0)
+
+    def test_login_is_shed_with_too_many_requests_when_hashing_is_saturated(self) -> None:
+        saturated_executor = mock.Mock(spec=BoundedExecutor)
+        saturated_executor.run.side_effect = ExecutorSaturatedError(executor_name="password hashing")
+
+        with mock.patch.object(PasswordHasher, "EXECUTOR", saturated_executor), app.test_client() as client:
+            response = client.post(
+                "http://127.0.0.1:8080/api/accounts",
+                headers={"Content-Type": "application/json"},
+                data=json.dumps(
+                    {"first_name": "first_name", "last_name": "last_name", "password": "password", "username": "user"}
+                ),
+            )
+
+        assert response.status_code == 429
+        assert response.json
+        assert response.json.get("code") == ExecutorErrorCode.EXECUTOR_SATURATED
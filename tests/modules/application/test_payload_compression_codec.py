@@ -0,0 +1,35 @@
+import asyncio
+
+from temporalio.converter import DataConverter
+
+from modules.application.internal.payload_compression_codec import PayloadCompressionCodec
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestPayloadCompressionCodec(BaseTestApplication):
+    def test_large_payload_is_compressed_and_round_trips(self) -> None:
+        codec = PayloadCompressionCodec(enabled=True, threshold_in_bytes=1024, level=6)
+        account_ids = [f"{index:024x}" for index in range(5000)]
+        payloads = DataConverter.default.payload_converter.to_payloads([account_ids])
+
+        encoded = asyncio.run(codec.encode(payloads))
+        assert encoded[0].metadata["encoding"] == PayloadCompressionCodec.ENCODING
+        assert encoded[0].ByteSize() < payloads[0].ByteSize()
+
+        decoded = asyncio.run(codec.decode(encoded))
+        assert decoded == payloads
+        assert DataConverter.default.payload_converter.from_payloads(decoded) == [account_ids]
+
+    def test_small_payload_is_left_uncompressed(self) -> None:
+        codec = PayloadCompressionCodec(enabled=True, threshold_in_bytes=1024, level=6)
+        payloads = DataConverter.default.payload_converter.to_payloads(["small"])
+
+        assert asyncio.run(codec.encode(payloads)) == payloads
+
+    def test_compressed_payload_is_decoded_when_compression_is_disabled(self) -> None:
+        payloads = DataConverter.default.payload_converter.to_payloads(["x" * 10000])
+        encoded = asyncio.run(PayloadCompressionCodec(enabled=True, threshold_in_bytes=1024, level=6).encode(payloads))
+
+        disabled_codec = PayloadCompressionCodec(enabled=False, threshold_in_bytes=1024, level=6)
+        assert asyncio.run(disabled_codec.encode(payloads)) == payloads
+        assert asyncio.run(disabled_codec.decode(encoded)) == payloads
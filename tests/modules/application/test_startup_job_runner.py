@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from modules.application.internal.startup_job_runner import StartupJobRunner
+from modules.application.internal.store.startup_job_repository import StartupJobRepository
+from modules.application.types import StartupJob
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestStartupJobRunner(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.runs: List[str] = []
+
+    def teardown_method(self, method: Callable) -> None:
+        super().teardown_method(method)
+        StartupJobRepository.collection().delete_many({})
+
+    def test_job_runs_once_per_deployment(self) -> None:
+        job = StartupJob(name="seed", run=lambda: self.runs.append("seed"))
+
+        StartupJobRunner._run_job(job, deployment_id="deploy-1", owner="worker-1")
+        StartupJobRunner._run_job(job, deployment_id="deploy-1", owner="worker-2")
+        assert self.runs == ["seed"]
+
+        StartupJobRunner._run_job(job, deployment_id="deploy-2", owner="worker-1")
+        assert self.runs == ["seed", "seed"]
+
+    def test_run_once_job_does_not_run_again_in_later_deployments(self) -> None:
+        job = StartupJob(name="migrate", run=lambda: self.runs.append("migrate"), run_once=True)
+
+        StartupJobRunner._run_job(job, deployment_id="deploy-1", owner="worker-1")
+        StartupJobRunner._run_job(job, deployment_id="deploy-2", owner="worker-1")
+
+        assert self.runs == ["migrate"]
+
+    def test_job_is_skipped_while_another_worker_holds_the_lease(self) -> None:
+        job = StartupJob(name="seed", run=lambda: self.runs.append("seed"))
+        StartupJobRepository.collection().insert_one(
+            {"_id": "seed", "lease_owner": "worker-1", "lease_expires_at": datetime.utcnow() + timedelta(minutes=5)}
+        )
+
+        StartupJobRunner._run_job(job, deployment_id="deploy-1", owner="worker-2")
+        assert self.runs == []
+
+        StartupJobRepository.collection().update_one(
+            {"_id": "seed"}, {"$set": {"lease_expires_at": datetime.utcnow() - timedelta(seconds=1)}}
+        )
+
+        StartupJobRunner._run_job(job, deployment_id="deploy-1", owner="worker-2")
+        assert self.runs == ["seed"]
+
+    def test_failed_job_releases_the_lease(self) -> None:
+        def failing_job() -> None:
+            self.runs.append("failed")
+            raise RuntimeError("Temporal is down")
+
+        StartupJobRunner._run_job(StartupJob(name="seed", run=failing_job), deployment_id="deploy-1", owner="worker-1")
+
+        job_document = StartupJobRepository.collection().find_one({"_id": "seed"})
+        assert job_document["lease_owner"] is None
+        assert "completed_deployment_id" not in job_document
+
+        StartupJobRunner._run_job(
+            StartupJob(name="seed", run=lambda: self.runs.append("seed")), deployment_id="deploy-1", owner="worker-2"
+        )
+        assert self.runs == ["failed", "seed"]
+
+    def test_deployment_id_is_required_outside_development(self) -> None:
+        def patch_config(values: Dict[str, Any]) -> Any:
+            compiled_config = {**ConfigService.config_manager.compiled_config, **values}
+            return mock.patch.object(ConfigService.config_manager, "compiled_config", compiled_config)
+
+        with patch_config({"startup_jobs.deployment_id": "", "startup_jobs.require_deployment_id": True}):
+            with self.assertRaises(MissingKeyError):
+                StartupJobRunner._get_deployment_id()
+
+        with patch_config({"startup_jobs.deployment_id": "0123abc", "startup_jobs.require_deployment_id": True}):
+            assert StartupJobRunner._get_deployment_id() == "0123abc"
@@ -0,0 +1,25 @@
+import time
+
+from modules.application.common.ttl_cache import TTLCache
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestTTLCache(BaseTestApplication):
+    def test_entries_expire_after_ttl(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_in_seconds=0.05, max_size=10)
+        cache.set("key", 1)
+
+        assert cache.get("key") == 1
+        time.sleep(0.06)
+        assert cache.get("key") is None
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(ttl_in_seconds=60, max_size=2)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.get("first")
+        cache.set("third", 3)
+
+        assert cache.get("first") == 1
+        assert cache.get("second") is None
+        assert cache.get("third") == 3
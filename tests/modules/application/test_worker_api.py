@@ -0,0 +1,105 @@
+import json
+from datetime import datetime
+from typing import Callable, Optional
+
+from pytest import MonkeyPatch
+from server import app
+from temporalio.client import WorkflowExecutionStatus
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.application.errors import WorkerErrorCode
+from modules.application.internal.worker_manager import WorkerManager
+from modules.application.rest_api.worker_view import WorkerView
+from modules.application.types import Worker, WorkerPage
+from modules.authentication.types import AccessTokenErrorCode
+from tests.modules.application.base_test_application import BaseTestApplication
+
+WORKERS_URL = "http://127.0.0.1:8080/api/workers"
+ACCESS_TOKEN_URL = "http://127.0.0.1:8080/api/access-tokens"
+HEADERS = {"Content-Type": "application/json"}
+
+
+class TestWorkerApi(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        self.monkeypatch = MonkeyPatch()
+        if WorkerManager.WORKER_PAGE_CACHE is not None:
+            WorkerManager.WORKER_PAGE_CACHE.clear()
+
+    def teardown_method(self, method: Callable) -> None:
+        super().teardown_method(method)
+        self.monkeypatch.undo()
+        AccountRepository.collection().delete_many({})
+
+    def _get_access_token(self, is_operator: bool = True) -> str:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        if is_operator:
+            self.monkeypatch.setattr(WorkerView, "OPERATOR_ACCOUNT_IDS", lambda: [account.id])
+        with app.test_client() as client:
+            response = client.post(
+                ACCESS_TOKEN_URL, headers=HEADERS, data=json.dumps({"username": "username", "password": "password"})
+            )
+            return response.json.get("token")
+
+    def _get_workers(self, token: Optional[str], query_params: str = ""):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        with app.test_client() as client:
+            return client.get(f"{WORKERS_URL}?{query_params}", headers=headers)
+
+    def test_list_workers_requires_authentication(self) -> None:
+        response = self._get_workers(token=None)
+
+        assert response.status_code == 401
+        assert response.json.get("code") == AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND
+
+    def test_list_workers_requires_operator(self) -> None:
+        response = self._get_workers(token=self._get_access_token(is_operator=False))
+
+        assert response.status_code == 403
+        assert response.json.get("code") == WorkerErrorCode.WORKER_ACCESS_FORBIDDEN
+
+    def test_list_workers_with_invalid_status(self) -> None:
+        response = self._get_workers(token=self._get_access_token(), query_params="status=sleeping")
+
+        assert response.status_code == 400
+        assert response.json.get("code") == WorkerErrorCode.WORKER_BAD_REQUEST
+
+    def test_list_workers_with_unregistered_type(self) -> None:
+        response = self._get_workers(token=self._get_access_token(), query_params="type=UnknownWorker")
+
+        assert response.status_code == 400
+        assert response.json.get("code") == WorkerErrorCode.WORKER_NOT_REGISTERED
+
+    def test_list_workers_pages_are_cached(self) -> None:
+        queries = []
+
+        async def fake_list_workers(query: str, page_token: Optional[str]) -> WorkerPage:
+            queries.append((query, page_token))
+            worker = Worker(
+                id="HealthCheckWorker-1",
+                status=WorkflowExecutionStatus.FAILED,
+                start_time=datetime(2024, 1, 1),
+                close_time=None,
+                task_queue="DEFAULT",
+                worker_type="HealthCheckWorker",
+            )
+            return WorkerPage(items=[worker], next_page_token="next")
+
+        self.monkeypatch.setattr(WorkerManager, "_list_workers", fake_list_workers)
+        token = self._get_access_token()
+
+        for _ in range(3):
+            response = self._get_workers(token=token, query_params="type=HealthCheckWorker&status=failed")
+
+            assert response.status_code == 200
+            assert response.json["next_page_token"] == "next"
+            assert response.json["items"][0]["id"] == "HealthCheckWorker-1"
+            assert response.json["items"][0]["status"] == "FAILED"
+
+        assert queries == [("WorkflowType = 'HealthCheckWorker' AND ExecutionStatus = 'Failed'", None)]
@@ -0,0 +1,72 @@
+import asyncio
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from temporal_config import TemporalConfig
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+from modules.application.types import BaseWorker
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class FanOutTestWorker(BaseWorker):
+    fan_out_chunk_size = 10
+    fan_out_max_concurrency = 3
+    fan_out_max_chunks_per_run = 4
+
+    @staticmethod
+    async def execute(*args: Any) -> Dict[str, int]:
+        chunk, multiplier = args
+        return {"chunks": 1, "total": sum(chunk) * multiplier}
+
+    async def run(self, *args: Any) -> Dict[str, int]:
+        items, multiplier, *summary = args
+        return await self.fan_out(items, multiplier, summary=summary[0] if summary else None)
+
+    def aggregate_fan_out_result(self, summary: Optional[Dict[str, int]], result: Dict[str, int]) -> Dict[str, int]:
+        if summary is None:
+            return result
+        return {key: summary[key] + result[key] for key in result}
+
+
+class TestWorkerFanOut(BaseTestApplication):
+    def setup_method(self, method: Callable) -> None:
+        super().setup_method(method)
+        # Registering wraps the methods of the worker for Temporal, keep the originals to undo it on teardown
+        self.original_methods = {name: vars(FanOutTestWorker)[name] for name in ("execute", "run")}
+        TemporalConfig._register_worker(FanOutTestWorker)
+
+    def teardown_method(self, method: Callable) -> None:
+        for name, original_method in self.original_methods.items():
+            setattr(FanOutTestWorker, name, original_method)
+        delattr(FanOutTestWorker, "__temporal_workflow_definition")
+        TemporalConfig.REGISTERED_WORKERS[:] = [
+            registered_worker
+            for registered_worker in TemporalConfig.REGISTERED_WORKERS
+            if registered_worker.cls is not FanOutTestWorker
+        ]
+        super().teardown_method(method)
+
+    def test_fan_out_aggregates_chunk_results_across_continue_as_new(self) -> None:
+        async def run_workflow() -> Dict[str, int]:
+            task_queue = f"fan-out-test-{uuid.uuid4()}"
+            async with await WorkflowEnvironment.start_time_skipping() as env:
+                async with Worker(
+                    env.client,
+                    task_queue=task_queue,
+                    workflows=[FanOutTestWorker],
+                    activities=[FanOutTestWorker.execute],
+                    workflow_runner=UnsandboxedWorkflowRunner(),
+                ):
+                    return await env.client.execute_workflow(
+                        FanOutTestWorker.run,
+                        args=[list(range(95)), 2],
+                        id=f"fan-out-test-{uuid.uuid4()}",
+                        task_queue=task_queue,
+                    )
+
+        summary = asyncio.run(run_workflow())
+
+        # 10 chunks over 3 runs, with only the summary carried from one run to the next
+        assert summary == {"chunks": 10, "total": sum(range(95)) * 2}
@@ -0,0 +1,60 @@
+import asyncio
+import dataclasses
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from temporalio.runtime import MetricBuffer, Runtime, TelemetryConfig
+from temporalio.testing import ActivityEnvironment
+
+from modules.application.internal.worker_metrics import WorkerMetrics
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestWorkerMetrics(BaseTestApplication):
+    def _run(self, attempt: int, fail: bool) -> List[Tuple[str, int, Dict[str, Any]]]:
+        buffer = MetricBuffer(buffer_size=100)
+        runtime = Runtime(telemetry=TelemetryConfig(metrics=buffer))
+
+        env = ActivityEnvironment()
+        env.metric_meter = runtime.metric_meter
+        env.info = dataclasses.replace(env.info, attempt=attempt)
+
+        async def execute() -> None:
+            async with WorkerMetrics.record_execution("ExampleWorker"):
+                if fail:
+                    raise ValueError("failed")
+
+        if fail:
+            with pytest.raises(ValueError):
+                asyncio.run(env.run(execute))
+        else:
+            asyncio.run(env.run(execute))
+
+        updates = buffer.retrieve_updates()
+        self.metric_units = {update.metric.name: update.metric.unit for update in updates}
+
+        # Drop the attributes the activity meter adds by default, e.g. namespace and task queue
+        return [
+            (
+                update.metric.name,
+                update.value,
+                {k: v for k, v in update.attributes.items() if k in ("worker", "outcome")},
+            )
+            for update in updates
+        ]
+
+    def test_successful_execution_is_recorded(self) -> None:
+        updates = self._run(attempt=1, fail=False)
+
+        executions = [update for update in updates if update[0] == "app_worker_executions"]
+        assert executions == [("app_worker_executions", 1, {"worker": "ExampleWorker", "outcome": "success"})]
+        assert any(update[0] == "app_worker_execution_duration" for update in updates)
+        # The Prometheus exporter records durations as seconds
+        assert self.metric_units["app_worker_execution_duration"] == "s"
+        assert not any(update[0] == "app_worker_retries" for update in updates)
+
+    def test_failed_retry_is_recorded(self) -> None:
+        updates = self._run(attempt=2, fail=True)
+
+        assert ("app_worker_retries", 1, {"worker": "ExampleWorker"}) in updates
+        assert ("app_worker_executions", 1, {"worker": "ExampleWorker", "outcome": "failure"}) in updates
@@ -1,3 +1,5 @@
+import pytest
+
 from modules.account.account_service import AccountService
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
@@ -5,12 +7,26 @@ from modules.account.types import (
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
+from modules.application.common.types import CacheStats
 from modules.authentication.authentication_service import AuthenticationService
-from modules.authentication.types import CreateOTPParams, OTPBasedAuthAccessTokenRequestParams
+from modules.authentication.errors import AccessTokenInvalidError, OTPExpiredError, OTPIncorrectError
+from modules.authentication.internals.access_token.access_token_util import AccessTokenUtil
+from modules.authentication.internals.otp.store.otp_repository import OTPRepository
+from modules.authentication.types import (
+    CreateOTPParams,
+    OTPBasedAuthAccessTokenRequestParams,
+    OTPStatus,
+    VerifyOTPParams,
+)
 from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
 
 
 class TestAuthenticationService(BaseTestAccessToken):
+    def _get_access_token_cache_stats(self) -> CacheStats:
+        cache = AccessTokenUtil._get_verification_cache()
+        assert cache is not None
+        return cache.get_stats()
+
     def test_get_access_token_by_username_and_password(self) -> None:
         account = AccountService.create_account_by_username_and_password(
             params=CreateAccountByUsernameAndPasswordParams(
@@ -37,6 +53,35 @@ class TestAuthenticationService(BaseTestAccessToken):
 
         assert verified_access_token.account_id == account.id
 
+    def test_verified_access_token_is_served_from_cache(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+        stats_before = self._get_access_token_cache_stats()
+
+        for _ in range(3):
+            assert AuthenticationService.verify_access_token(token=access_token.token).account_id == account.id
+
+        stats = self._get_access_token_cache_stats()
+        assert stats.misses - stats_before.misses == 1
+        assert stats.hits - stats_before.hits == 2
+
+    def test_invalid_access_token_is_not_cached(self) -> None:
+        stats_before = self._get_access_token_cache_stats()
+
+        for _ in range(2):
+            with pytest.raises(AccessTokenInvalidError):
+                AuthenticationService.verify_access_token(token="invalid-token")
+
+        # Every attempt is looked up and missed, and nothing is stored for the token to be served from next time
+        stats = self._get_access_token_cache_stats()
+        assert stats.size == stats_before.size
+        assert stats.hits == stats_before.hits
+        assert stats.misses - stats_before.misses == 2
+
     def test_get_access_token_by_phone_number(self) -> None:
         phone_number = {"country_code": "+91", "phone_number": "9999999999"}
         account = AccountWriter.create_account_by_phone_number(
@@ -76,3 +121,31 @@ class TestAuthenticationService(BaseTestAccessToken):
         verified_access_token = AuthenticationService.verify_access_token(token=access_token.token)
 
         assert verified_access_token.account_id == account.id
+
+    def test_verify_otp_expires_previous_codes_and_succeeds_once(self) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        first_otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=phone_number), account_id="")
+        second_otp = AuthenticationService.create_otp(params=CreateOTPParams(phone_number=phone_number), account_id="")
+
+        assert OTPRepository.collection().count_documents({"active": True}) == 1
+
+        verified_otp = AuthenticationService.verify_otp(
+            params=VerifyOTPParams(otp_code=second_otp.otp_code, phone_number=phone_number)
+        )
+        assert verified_otp.id == second_otp.id
+        assert verified_otp.status == OTPStatus.SUCCESS
+
+        with pytest.raises(OTPExpiredError):
+            AuthenticationService.verify_otp(
+                params=VerifyOTPParams(otp_code=second_otp.otp_code, phone_number=phone_number)
+            )
+
+        incorrect_code = next(
+            code for code in ("0000", "1111") if code not in (first_otp.otp_code, second_otp.otp_code)
+        )
+        with pytest.raises(OTPIncorrectError):
+            AuthenticationService.verify_otp(params=VerifyOTPParams(otp_code=incorrect_code, phone_number=phone_number))
+
+        index_information = OTPRepository.collection().index_information()
+        assert "phone_number_active_otp_code_index" in index_information
+        assert index_information["created_at_ttl_index"]["expireAfterSeconds"] == 86400
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from unittest import mock
 
@@ -10,6 +11,9 @@ from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internals.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
 from modules.authentication.internals.password_reset_token.password_reset_token_writer import PasswordResetTokenWriter
+from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
 from modules.notification.email_service import EmailService
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
@@ -44,6 +48,7 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
             self.assertFalse(response.json["is_used"])
             self.assertTrue(mock_send_email.called)
             self.assertIn("password_reset_link", mock_send_email.call_args.kwargs["params"].template_data)
+            self.assertTrue(mock_send_email.call_args.kwargs["contains_secret"])
             self.assertEqual(response.json["account"], account.id)
 
     @mock.patch.object(EmailService, "send_email_for_account")
@@ -276,3 +281,28 @@ class TestAccountPasswordReset(BaseTestPasswordResetToken):
 
         self.assertTrue(mock_send_email.called)
         self.assertTrue(mock_send_email.call_args.kwargs["bypass_preferences"])
+
+    def test_password_reset_token_is_stored_as_digest_and_only_the_latest_is_verified(self):
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        first_token = PasswordResetTokenUtil.generate_password_reset_token()
+        second_token = PasswordResetTokenUtil.generate_password_reset_token()
+        first_password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account.id, first_token)
+        second_password_reset_token = PasswordResetTokenWriter.create_password_reset_token(account.id, second_token)
+
+        self.assertEqual(first_password_reset_token.token, hashlib.sha256(first_token.encode("utf-8")).hexdigest())
+        self.assertIsNone(PasswordResetTokenRepository.collection().find_one({"token": first_token}))
+
+        with self.assertRaises(AccountBadRequestError):
+            AuthenticationService.verify_password_reset_token(account_id=account.id, token=first_token)
+
+        verified_token = AuthenticationService.verify_password_reset_token(account_id=account.id, token=second_token)
+        self.assertEqual(verified_token.id, second_password_reset_token.id)
+
+        index_information = PasswordResetTokenRepository.collection().index_information()
+        self.assertTrue(index_information["token_index"]["unique"])
+        self.assertEqual(index_information["expires_at_ttl_index"]["expireAfterSeconds"], 86400)
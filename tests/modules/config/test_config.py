@@ -1,8 +1,10 @@
 import os
 from typing import List
+from unittest import mock
 
 from modules.config.config_service import ConfigService
 from modules.config.errors import MissingKeyError
+from modules.config.internals.config_manager import ConfigManager
 from modules.config.types import ErrorCode
 from tests.modules.config.base_test_config import BaseTestConfig
 
@@ -26,3 +28,29 @@ class TestConfig(BaseTestConfig):
 
         populated_env = os.environ.get("APP_ENV")
         assert populated_env == "testing" or populated_env == "docker-test"
+
+    def test_compiled_config_resolves_sections_and_leaves(self) -> None:
+        compiled_config = ConfigService.config_manager.compiled_config
+        assert compiled_config["mongodb.uri"] == ConfigService[str].get_value(key="mongodb.uri")
+        assert compiled_config["mongodb"] == ConfigService.config_manager.config_store["mongodb"]
+
+        with self.assertRaises(TypeError):
+            compiled_config["mongodb.uri"] = "mongodb://overridden"  # type: ignore[index]
+
+    def test_bound_accessor_follows_config_reload(self) -> None:
+        accessor = ConfigService[str].bind(key="mongodb.uri")
+        missing_accessor = ConfigService[str].bind(key="config.missing_key")
+        assert accessor() == ConfigService[str].get_value(key="mongodb.uri")
+
+        with self.assertRaises(MissingKeyError):
+            missing_accessor()
+
+        original_config_manager = ConfigService.config_manager
+        try:
+            with mock.patch.dict(os.environ, {"MONGODB_URI": "mongodb://reloaded:27017/frm-boilerplate-test"}):
+                ConfigService.config_manager = ConfigManager()
+            assert accessor() == "mongodb://reloaded:27017/frm-boilerplate-test"
+        finally:
+            ConfigService.config_manager = original_config_manager
+
+        assert accessor() == ConfigService[str].get_value(key="mongodb.uri")
@@ -0,0 +1,25 @@
+import unittest
+from typing import Callable
+
+from modules.logger.logger_manager import LoggerManager
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.internals.store.notification_digest_repository import NotificationDigestRepository
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+
+
+class BaseTestNotification(unittest.TestCase):
+    def setup_method(self, method: Callable) -> None:
+        print(f"Executing:: {method.__name__}")
+        LoggerManager.mount_logger()
+
+    def teardown_method(self, method: Callable) -> None:
+        print(f"Executed:: {method.__name__}")
+        NotificationDigestRepository.collection().delete_many({})
+        NotificationOutboxRepository.collection().delete_many({})
+        AccountNotificationPreferencesRepository.collection().delete_many({})
+        # The collection is emptied behind the writer's back, so cached preferences must go too
+        if AccountNotificationPreferencesCache.CACHE is not None:
+            AccountNotificationPreferencesCache.CACHE.clear()
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from modules.notification.email_service import EmailService
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    EmailRecipient,
+    EmailSender,
+    SendEmailForAccountParams,
+    SendEmailParams,
+)
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+SENDER = EmailSender(email="sender@example.com", name="Sender")
+
+
+class TestBulkEmail(BaseTestNotification):
+    def _get_params(self, account_id: str, template_id: str) -> SendEmailForAccountParams:
+        return SendEmailForAccountParams(
+            account_id=account_id,
+            params=SendEmailParams(
+                recipient=EmailRecipient(email=f"{account_id}@example.com"),
+                sender=SENDER,
+                template_id=template_id,
+                template_data={"account_id": account_id},
+            ),
+        )
+
+    def test_groups_recipients_into_personalized_requests_per_template(self) -> None:
+        account_ids = [f"account{index}" for index in range(6)]
+        for account_id in account_ids:
+            NotificationService.create_or_update_account_notification_preferences(
+                account_id=account_id,
+                preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=account_id != "account5"),
+            )
+
+        params_list = [self._get_params(account_id, "digest") for account_id in account_ids[:4]]
+        params_list += [self._get_params(account_id, "broadcast") for account_id in account_ids[4:]]
+        params_list.append(self._get_params("account_without_preferences", "broadcast"))
+
+        client = mock.Mock()
+        with (
+            mock.patch.object(SendGridService, "get_client", return_value=client),
+            mock.patch.object(EmailService, "MAX_PERSONALIZATIONS_PER_REQUEST", return_value=3),
+        ):
+            result = NotificationService.send_bulk_emails(params_list=params_list)
+
+        assert (result.sent, result.skipped, result.failed) == (5, 2, 0)
+        messages = sorted(
+            [call.kwargs["json"] for call in client.request.call_args_list],
+            key=lambda message: (message["template_id"], len(message["personalizations"])),
+        )
+        assert [(message["template_id"], len(message["personalizations"])) for message in messages] == [
+            ("broadcast", 1),
+            ("digest", 1),
+            ("digest", 3),
+        ]
+        assert {"to": [{"email": "account4@example.com"}], "dynamic_template_data": {"account_id": "account4"}} in (
+            messages[0]["personalizations"]
+        )
+
+    def test_failed_chunk_does_not_stop_the_others(self) -> None:
+        params_list = [self._get_params(f"account{index}", f"template{index}") for index in range(3)]
+        params_list.append(
+            SendEmailForAccountParams(
+                account_id="invalid",
+                params=SendEmailParams(recipient=EmailRecipient(email="invalid"), sender=SENDER, template_id="t"),
+            )
+        )
+
+        client = mock.Mock()
+        client.request.side_effect = [mock.Mock(), RuntimeError("provider unavailable"), mock.Mock()]
+        with (
+            mock.patch.object(SendGridService, "get_client", return_value=client),
+            mock.patch.object(EmailService, "BULK_MAX_CONCURRENCY", return_value=1),
+        ):
+            result = EmailService.send_bulk_emails(params_list=params_list, bypass_preferences=True)
+
+        assert (result.sent, result.skipped, result.failed) == (2, 0, 2)
+        assert client.request.call_count == 3
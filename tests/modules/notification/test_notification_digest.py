@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime
+from unittest import mock
+
+from modules.account.types import PhoneNumber
+from modules.notification.email_service import EmailService
+from modules.notification.internals.store.notification_digest_repository import NotificationDigestRepository
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.notification_service import NotificationService
+from modules.notification.sms_service import SMSService
+from modules.notification.types import (
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    SendEmailParams,
+    SendSMSParams,
+)
+from modules.notification.workers.notification_digest_flush_worker import NotificationDigestFlushWorker
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+ACCOUNT_ID = "5f7b1b7b4f3b9b1b3f3b9b1b"
+PHONE_NUMBER = PhoneNumber(country_code="+1", phone_number="4155552671")
+
+
+class TestNotificationDigest(BaseTestNotification):
+    def setUp(self) -> None:
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=ACCOUNT_ID, preferences=CreateOrUpdateAccountNotificationPreferencesParams()
+        )
+
+    def _add_email(self, task_title: str, account_id: str = ACCOUNT_ID) -> None:
+        NotificationService.add_email_to_digest(
+            account_id=account_id,
+            params=SendEmailParams(
+                recipient=EmailRecipient(email="user@example.com"),
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id="task_updates",
+                template_data={"task_title": task_title},
+            ),
+        )
+
+    def _end_windows(self) -> None:
+        NotificationDigestRepository.collection().update_many({}, {"$set": {"flush_at": datetime.utcnow()}})
+
+    def test_buffered_emails_are_sent_as_one_digest_once_the_window_is_over(self) -> None:
+        for task_title in ["First", "Second", "Third"]:
+            self._add_email(task_title)
+
+        result = asyncio.run(NotificationDigestFlushWorker.flush_due_digests())
+        assert (result.flushed, NotificationOutboxRepository.collection().count_documents({})) == (0, 0)
+
+        self._end_windows()
+        result = asyncio.run(NotificationDigestFlushWorker.flush_due_digests())
+
+        assert (result.dropped, result.flushed, result.retried) == (0, 1, 0)
+        assert NotificationDigestRepository.collection().count_documents({}) == 0
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["channel"] == NotificationChannel.EMAIL
+        assert message["payload"]["template_id"] == "DIGEST_EMAIL_TEMPLATE_ID"
+        assert message["payload"]["template_data"] == {
+            "notifications": [{"task_title": "First"}, {"task_title": "Second"}, {"task_title": "Third"}],
+            "notification_count": 3,
+            "notification_template_id": "task_updates",
+        }
+
+    def test_digest_of_a_single_email_is_sent_with_its_own_template(self) -> None:
+        self._add_email("First")
+        self._end_windows()
+
+        asyncio.run(NotificationDigestFlushWorker.flush_due_digests())
+
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["payload"]["template_id"] == "task_updates"
+        assert message["payload"]["template_data"] == {"task_title": "First"}
+
+    def test_notifications_added_while_a_digest_is_flushed_start_the_next_one(self) -> None:
+        self._add_email("First")
+        self._end_windows()
+
+        with mock.patch.object(
+            EmailService, "send_email_for_account", side_effect=lambda **kwargs: self._add_email("Second")
+        ):
+            asyncio.run(NotificationDigestFlushWorker.flush_due_digests())
+
+        digests = list(NotificationDigestRepository.collection().find())
+        assert len(digests) == 1
+        assert digests[0]["items"] == [{"task_title": "Second"}]
+
+    @mock.patch.object(SMSService, "SMS_ENABLED", return_value=True)
+    def test_sms_digest_keeps_the_latest_messages_and_counts_the_rest(self, _) -> None:
+        for index in range(7):
+            NotificationService.add_sms_to_digest(
+                account_id=ACCOUNT_ID,
+                params=SendSMSParams(message_body=f"Task {index} was updated", recipient_phone=PHONE_NUMBER),
+            )
+        self._end_windows()
+
+        asyncio.run(NotificationDigestFlushWorker.flush_due_digests())
+
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["payload"]["message_body"] == "\n".join(
+            ["You have 7 new notifications:", *[f"Task {index} was updated" for index in range(2, 7)], "and 2 more"]
+        )
+
+    def test_digest_of_an_account_without_preferences_is_dropped(self) -> None:
+        self._add_email("First", account_id="account_without_preferences")
+        self._end_windows()
+
+        result = asyncio.run(NotificationDigestFlushWorker.flush_due_digests())
+
+        assert (result.dropped, result.flushed) == (1, 0)
+        assert NotificationDigestRepository.collection().count_documents({}) == 0
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
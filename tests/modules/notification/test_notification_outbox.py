@@ -0,0 +1,186 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest import mock
+
+from modules.account.types import PhoneNumber
+from modules.application.errors import CircuitOpenError
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ValidationError
+from modules.notification.internals.notification_outbox_util import NotificationOutboxUtil
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.store.notification_outbox_repository import NotificationOutboxRepository
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.sms_service import SMSService
+from modules.notification.types import (
+    EmailRecipient,
+    EmailSender,
+    NotificationChannel,
+    NotificationOutboxStatus,
+    SendEmailParams,
+    SendSMSParams,
+)
+from modules.notification.workers.notification_outbox_dispatcher_worker import NotificationOutboxDispatcherWorker
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+ACCOUNT_ID = "5f7b1b7b4f3b9b1b3f3b9b1b"
+EMAIL_PARAMS = SendEmailParams(
+    recipient=EmailRecipient(email="user@example.com"),
+    sender=EmailSender(email="sender@example.com", name="Sender"),
+    template_id="template_id",
+    template_data={"first_name": "first_name"},
+)
+
+
+class TestNotificationOutbox(BaseTestNotification):
+    @mock.patch.object(SendGridService, "send_email")
+    def test_email_is_queued_and_sent_by_the_dispatcher(self, mock_send_email) -> None:
+        EmailService.send_email_for_account(account_id=ACCOUNT_ID, bypass_preferences=True, params=EMAIL_PARAMS)
+
+        assert not mock_send_email.called
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["channel"] == NotificationChannel.EMAIL
+        assert message["status"] == NotificationOutboxStatus.PENDING
+
+        result = asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages())
+
+        assert (result.sent, result.retried, result.failed) == (1, 0, 0)
+        mock_send_email.assert_called_once_with(EMAIL_PARAMS)
+        message = NotificationOutboxRepository.collection().find_one({"_id": message["_id"]})
+        assert message["status"] == NotificationOutboxStatus.SENT
+        assert message["attempts"] == 1
+        assert message["sent_at"] is not None
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_dispatcher_reports_every_message_as_soon_as_it_is_sent(self, mock_send_email) -> None:
+        mock_send_email.side_effect = [None, RuntimeError("provider unavailable")]
+        EmailService.send_email_for_account(account_id=ACCOUNT_ID, bypass_preferences=True, params=EMAIL_PARAMS)
+        EmailService.send_email_for_account(account_id=ACCOUNT_ID, bypass_preferences=True, params=EMAIL_PARAMS)
+        on_message_dispatched = mock.Mock()
+
+        result = asyncio.run(
+            NotificationOutboxDispatcherWorker.dispatch_pending_messages(on_message_dispatched=on_message_dispatched)
+        )
+
+        assert (result.sent, result.retried, result.failed) == (1, 1, 0)
+        assert sorted(call.args[0] for call in on_message_dispatched.call_args_list) == sorted(
+            [NotificationOutboxStatus.SENT, NotificationOutboxStatus.PENDING]
+        )
+
+    @mock.patch.object(TwilioService, "send_sms", side_effect=RuntimeError("provider unavailable"))
+    def test_failed_sends_are_retried_with_backoff_then_dead_lettered(self, mock_send_sms) -> None:
+        with mock.patch.object(SMSService, "SMS_ENABLED", return_value=True):
+            SMSService.send_sms_for_account(
+                account_id=ACCOUNT_ID,
+                bypass_preferences=True,
+                params=SendSMSParams(
+                    message_body="1234 is your OTP",
+                    recipient_phone=PhoneNumber(country_code="+1", phone_number="2025550123"),
+                ),
+            )
+
+        result = asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages())
+
+        assert (result.sent, result.retried, result.failed) == (0, 1, 0)
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["status"] == NotificationOutboxStatus.PENDING
+        assert message["next_attempt_at"] > datetime.utcnow()
+        assert message["last_error"] == "provider unavailable"
+
+        # Not due yet, so the next run leaves it alone
+        assert asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages()).retried == 0
+
+        NotificationOutboxRepository.collection().update_one(
+            {"_id": message["_id"]}, {"$set": {"attempts": 4, "next_attempt_at": datetime.utcnow()}}
+        )
+        result = asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages())
+
+        assert (result.sent, result.retried, result.failed) == (0, 0, 1)
+        assert NotificationOutboxRepository.collection().find_one({"_id": message["_id"]})["status"] == (
+            NotificationOutboxStatus.FAILED
+        )
+        assert mock_send_sms.call_count == 2
+
+    @mock.patch.object(
+        SendGridService, "send_email", side_effect=CircuitOpenError(client_name="SendGrid", retry_after_in_seconds=30)
+    )
+    def test_messages_rejected_by_an_open_circuit_are_rescheduled_without_using_an_attempt(
+        self, mock_send_email
+    ) -> None:
+        EmailService.send_email_for_account(account_id=ACCOUNT_ID, bypass_preferences=True, params=EMAIL_PARAMS)
+
+        for _ in range(10):
+            NotificationOutboxRepository.collection().update_many({}, {"$set": {"next_attempt_at": datetime.utcnow()}})
+            result = asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages())
+            assert (result.sent, result.retried, result.failed) == (0, 1, 0)
+
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["status"] == NotificationOutboxStatus.PENDING
+        assert message["attempts"] == 0
+        assert message["next_attempt_at"] > datetime.utcnow() + timedelta(seconds=25)
+        assert mock_send_email.call_count == 10
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_invalid_params_are_rejected_before_queueing(self, mock_send_email) -> None:
+        with self.assertRaises(ValidationError):
+            EmailService.send_email_for_account(
+                account_id=ACCOUNT_ID,
+                bypass_preferences=True,
+                params=SendEmailParams(
+                    recipient=EmailRecipient(email="not an email"),
+                    sender=EmailSender(email="sender@example.com", name="Sender"),
+                    template_id="template_id",
+                ),
+            )
+
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_synchronous_mode_sends_inside_the_request(self, mock_send_email) -> None:
+        with mock.patch.object(EmailService, "SYNCHRONOUS", return_value=True):
+            EmailService.send_email_for_account(account_id=ACCOUNT_ID, bypass_preferences=True, params=EMAIL_PARAMS)
+
+        mock_send_email.assert_called_once_with(EMAIL_PARAMS)
+        assert NotificationOutboxRepository.collection().count_documents({}) == 0
+
+    @mock.patch.object(TwilioService, "send_sms")
+    @mock.patch.object(SendGridService, "send_email")
+    def test_notifications_containing_secrets_are_queued_encrypted(self, mock_send_email, mock_send_sms) -> None:
+        sms_params = SendSMSParams(
+            message_body="1234 is your One Time Password (OTP) for verification.",
+            recipient_phone=PhoneNumber(country_code="+1", phone_number="4155552671"),
+        )
+
+        EmailService.send_email_for_account(
+            account_id=ACCOUNT_ID, bypass_preferences=True, contains_secret=True, params=EMAIL_PARAMS
+        )
+        with mock.patch.object(SMSService, "SMS_ENABLED", return_value=True):
+            SMSService.send_sms_for_account(
+                account_id=ACCOUNT_ID, bypass_preferences=True, contains_secret=True, params=sms_params
+            )
+
+        assert not mock_send_email.called
+        assert not mock_send_sms.called
+        for message in NotificationOutboxRepository.collection().find({"account_id": ACCOUNT_ID}):
+            assert list(message["payload"]) == ["encrypted"]
+            assert "1234" not in message["payload"]["encrypted"]
+            assert "first_name" not in message["payload"]["encrypted"]
+
+        result = asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages())
+
+        assert (result.sent, result.retried, result.failed) == (2, 0, 0)
+        mock_send_email.assert_called_once_with(EMAIL_PARAMS)
+        mock_send_sms.assert_called_once_with(params=sms_params)
+
+    @mock.patch.object(SendGridService, "send_email")
+    def test_notifications_containing_secrets_are_dead_lettered_once_expired(self, mock_send_email) -> None:
+        EmailService.send_email_for_account(
+            account_id=ACCOUNT_ID, bypass_preferences=True, contains_secret=True, params=EMAIL_PARAMS
+        )
+
+        with mock.patch.object(NotificationOutboxUtil, "SECRET_TTL_IN_SECONDS", return_value=-1):
+            result = asyncio.run(NotificationOutboxDispatcherWorker.dispatch_pending_messages())
+
+        assert (result.sent, result.retried, result.failed) == (0, 0, 1)
+        assert not mock_send_email.called
+        message = NotificationOutboxRepository.collection().find_one({"account_id": ACCOUNT_ID})
+        assert message["status"] == NotificationOutboxStatus.FAILED
@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+
+from modules.application.common.types import CacheStats
+from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+from modules.notification.internals.account_notification_preferences_cache import AccountNotificationPreferencesCache
+from modules.notification.internals.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+
+class TestPreferencesCache(BaseTestNotification):
+    def _get_cache_stats(self) -> CacheStats:
+        cache = AccountNotificationPreferencesCache._get_cache()
+        assert cache is not None
+        return cache.get_stats()
+
+    def _create_preferences(self, account_id: str, email_enabled: bool = True) -> None:
+        NotificationService.create_or_update_account_notification_preferences(
+            account_id=account_id,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=email_enabled),
+        )
+
+    def test_reads_are_served_from_the_cache_and_see_the_latest_write(self) -> None:
+        self._create_preferences("account")
+        initial_stats = self._get_cache_stats()
+        assert NotificationService.get_account_notification_preferences_by_account_id(
+            account_id="account"
+        ).email_enabled
+        self._create_preferences("account", email_enabled=False)
+
+        collection = mock.Mock(wraps=AccountNotificationPreferencesRepository.collection())
+        with mock.patch.object(AccountNotificationPreferencesRepository, "collection", return_value=collection):
+            preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id="account")
+
+        assert not preferences.email_enabled
+        collection.find_one.assert_not_called()
+        stats = self._get_cache_stats()
+        assert (stats.hits - initial_stats.hits, stats.misses - initial_stats.misses) == (2, 0)
+
+    def test_bulk_lookup_only_queries_the_uncached_accounts(self) -> None:
+        for account_id in ["cached", "uncached"]:
+            self._create_preferences(account_id)
+        AccountNotificationPreferencesCache.delete("uncached")
+
+        collection = mock.Mock(wraps=AccountNotificationPreferencesRepository.collection())
+        with mock.patch.object(AccountNotificationPreferencesRepository, "collection", return_value=collection):
+            preferences = NotificationService.get_preferences_for_accounts(
+                account_ids=["cached", "uncached", "missing"]
+            )
+            assert sorted(NotificationService.get_preferences_for_accounts(account_ids=["cached", "uncached"])) == [
+                "cached",
+                "uncached",
+            ]
+
+        assert sorted(preferences) == ["cached", "uncached"]
+        collection.find.assert_called_once_with({"account_id": {"$in": ["uncached", "missing"]}, "active": True})
+
+    def test_accounts_without_preferences_are_cached_until_preferences_are_created(self) -> None:
+        collection = mock.Mock(wraps=AccountNotificationPreferencesRepository.collection())
+        with mock.patch.object(AccountNotificationPreferencesRepository, "collection", return_value=collection):
+            for _ in range(2):
+                with pytest.raises(AccountNotificationPreferencesNotFoundError):
+                    NotificationService.get_account_notification_preferences_by_account_id(account_id="missing")
+            assert NotificationService.get_preferences_for_accounts(account_ids=["missing"]) == {}
+
+        collection.find_one.assert_called_once()
+        collection.find.assert_not_called()
+
+        self._create_preferences("missing", email_enabled=False)
+        preferences = NotificationService.get_account_notification_preferences_by_account_id(account_id="missing")
+        assert not preferences.email_enabled
+
+    def test_bulk_lookup_caches_the_accounts_without_preferences(self) -> None:
+        self._create_preferences("account")
+        AccountNotificationPreferencesCache.delete("account")
+
+        collection = mock.Mock(wraps=AccountNotificationPreferencesRepository.collection())
+        with mock.patch.object(AccountNotificationPreferencesRepository, "collection", return_value=collection):
+            for _ in range(2):
+                preferences = NotificationService.get_preferences_for_accounts(account_ids=["account", "missing"])
+                assert sorted(preferences) == ["account"]
+            with pytest.raises(AccountNotificationPreferencesNotFoundError):
+                NotificationService.get_account_notification_preferences_by_account_id(account_id="missing")
+
+        collection.find.assert_called_once_with({"account_id": {"$in": ["account", "missing"]}, "active": True})
+        collection.find_one.assert_not_called()
@@ -0,0 +1,117 @@
+import time
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import pytest
+import requests
+from scripts.provider_stub_server import SENDGRID_MAIL_SEND_PATH, ProviderStubServer
+from temporalio.runtime import MetricBuffer, Runtime, TelemetryConfig
+
+from modules.application.common.http_client import HTTPClient
+from modules.application.common.types import CircuitBreakerState
+from modules.application.errors import CircuitOpenError
+from modules.application.internal.worker_metrics import WorkerMetrics
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.notification.internals.twilio_service import TwilioService
+from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
+from tests.modules.notification.base_test_notification import BaseTestNotification
+
+
+class TestProviderHTTPClients(BaseTestNotification):
+    def setUp(self) -> None:
+        self.stub = ProviderStubServer().start()
+        self.metric_buffer = MetricBuffer(buffer_size=1000)
+        runtime = Runtime(telemetry=TelemetryConfig(metrics=self.metric_buffer))
+        self.meter_patch = mock.patch.object(WorkerMetrics, "get_process_meter", return_value=runtime.metric_meter)
+        self.meter_patch.start()
+
+    def tearDown(self) -> None:
+        self.meter_patch.stop()
+        self.stub.stop()
+
+    def _get_metric_updates_by_name(self) -> Dict[str, List[Tuple[Any, Dict[str, Any]]]]:
+        updates_by_name: Dict[str, List[Tuple[Any, Dict[str, Any]]]] = {}
+        for update in self.metric_buffer.retrieve_updates():
+            # Drop the attributes the runtime adds by default, e.g. service_name
+            attributes = {k: v for k, v in update.attributes.items() if k in ("client", "outcome")}
+            updates_by_name.setdefault(update.metric.name, []).append((update.value, attributes))
+        return updates_by_name
+
+    def _get_client(self, **kwargs: float) -> HTTPClient:
+        return HTTPClient(
+            name="Stub",
+            pool_size=2,
+            connect_timeout_in_seconds=1,
+            read_timeout_in_seconds=kwargs.get("read_timeout_in_seconds", 1),
+            failure_threshold=2,
+            reset_timeout_in_seconds=kwargs.get("reset_timeout_in_seconds", 30),
+        )
+
+    def test_sends_email_and_sms_through_the_provider_clients(self) -> None:
+        SendGridService.send_email(
+            SendEmailParams(
+                recipient=EmailRecipient(email="recipient@example.com"),
+                sender=EmailSender(email="sender@example.com", name="Sender"),
+                template_id="template",
+                template_data={"first_name": "Recipient"},
+            )
+        )
+        TwilioService.send_sms(SendSMSParams(recipient_phone="+14155552671", message_body="Your code is 1234"))
+
+        assert self.stub.requests == [
+            ("POST", SENDGRID_MAIL_SEND_PATH),
+            ("POST", "/2010-04-01/Accounts/ACTESTACCOUNTSID/Messages.json"),
+        ]
+        assert self._get_metric_updates_by_name()["app_http_client_requests"] == [
+            (1, {"client": "SendGrid", "outcome": "success"}),
+            (1, {"client": "Twilio", "outcome": "success"}),
+        ]
+
+    def test_circuit_opens_after_consecutive_failures_and_closes_after_a_trial_request(self) -> None:
+        client = self._get_client(reset_timeout_in_seconds=0.1)
+        url = f"{self.stub.base_url}{SENDGRID_MAIL_SEND_PATH}"
+        self.stub.status_code = 503
+
+        for _ in range(2):
+            assert client.request("POST", url).status_code == 503
+        with pytest.raises(CircuitOpenError):
+            client.request("POST", url)
+        assert len(self.stub.requests) == 2
+
+        time.sleep(0.1)
+        self.stub.status_code = None
+        assert client.request("POST", url).status_code == 202
+
+        updates = self._get_metric_updates_by_name()
+        assert [attributes["outcome"] for _, attributes in updates["app_http_client_requests"]] == [
+            "failure",
+            "failure",
+            "short_circuited",
+            "success",
+        ]
+        assert [attributes["outcome"] for _, attributes in updates["app_http_client_request_duration"]] == [
+            "failure",
+            "failure",
+            "success",
+        ]
+        # Closed, open after the second failure, still open when short-circuiting, closed after the trial request
+        assert [value for value, _ in updates["app_http_client_circuit_state"]] == [0, 2, 2, 0]
+
+    def test_client_errors_do_not_open_the_circuit(self) -> None:
+        client = self._get_client()
+        self.stub.status_code = 400
+
+        for _ in range(3):
+            assert client.request("POST", f"{self.stub.base_url}{SENDGRID_MAIL_SEND_PATH}").status_code == 400
+
+        assert client.circuit_breaker.state == CircuitBreakerState.CLOSED
+
+    def test_slow_responses_fail_on_the_read_timeout(self) -> None:
+        client = self._get_client(read_timeout_in_seconds=0.05)
+        self.stub.latency_in_seconds = 0.5
+
+        with pytest.raises(requests.Timeout):
+            client.request("POST", f"{self.stub.base_url}{SENDGRID_MAIL_SEND_PATH}")
+
+        updates = self._get_metric_updates_by_name()
+        assert updates["app_http_client_requests"] == [(1, {"client": "Stub", "outcome": "failure"})]
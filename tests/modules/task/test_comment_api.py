@@ -22,9 +22,7 @@ class TestCommentApi(BaseTestTask):
         account, token = self.create_account_and_get_token()
         task = self.create_test_task(account_id=account.id)
 
-        response = self.make_authenticated_comment_request(
-            "POST", account.id, task.id, token, data={"content": ""}
-        )
+        response = self.make_authenticated_comment_request("POST", account.id, task.id, token, data={"content": ""})
 
         self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
 
@@ -32,9 +30,7 @@ class TestCommentApi(BaseTestTask):
         account, token = self.create_account_and_get_token()
         task = self.create_test_task(account_id=account.id)
 
-        response = self.make_authenticated_comment_request(
-            "POST", account.id, task.id, token, data={}
-        )
+        response = self.make_authenticated_comment_request("POST", account.id, task.id, token, data={})
 
         self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
 
@@ -42,9 +38,7 @@ class TestCommentApi(BaseTestTask):
         account, _ = self.create_account_and_get_token()
         task = self.create_test_task(account_id=account.id)
 
-        response = self.make_unauthenticated_comment_request(
-            "POST", account.id, task.id, data={"content": "Hi"}
-        )
+        response = self.make_unauthenticated_comment_request("POST", account.id, task.id, data={"content": "Hi"})
 
         self.assert_error_response(response, 401, AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND)
 
@@ -116,7 +110,7 @@ class TestCommentApi(BaseTestTask):
             "PATCH", account.id, task.id, token, comment_id=non_existent_comment_id, data={"content": "Updated content"}
         )
 
-        self.assert_error_response(response, 404, TaskErrorCode.NOT_FOUND)
+        self.assert_error_response(response, 404, TaskErrorCode.COMMENT_NOT_FOUND)
 
     def test_update_comment_no_auth(self) -> None:
         account, token = self.create_account_and_get_token()
@@ -164,16 +158,14 @@ class TestCommentApi(BaseTestTask):
             "DELETE", account.id, task.id, token, comment_id=non_existent_comment_id
         )
 
-        self.assert_error_response(response, 404, TaskErrorCode.NOT_FOUND)
+        self.assert_error_response(response, 404, TaskErrorCode.COMMENT_NOT_FOUND)
 
     def test_delete_comment_no_auth(self) -> None:
         account, token = self.create_account_and_get_token()
         task = self.create_test_task(account_id=account.id)
         comment = self.create_test_comment(account.id, task.id, "Comment to delete", token)
 
-        response = self.make_unauthenticated_comment_request(
-            "DELETE", account.id, task.id, comment_id=comment["id"]
-        )
+        response = self.make_unauthenticated_comment_request("DELETE", account.id, task.id, comment_id=comment["id"])
 
         self.assert_error_response(response, 401, AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND)
 
@@ -1,18 +1,18 @@
 from datetime import datetime
 
 from modules.application.common.types import PaginationParams
-from modules.task.errors import TaskNotFoundError
+from modules.task.errors import TaskCommentNotFoundError, TaskNotFoundError
 from modules.task.task_service import TaskService
 from modules.task.types import (
+    AddCommentParams,
     CreateTaskParams,
+    DeleteCommentParams,
     DeleteTaskParams,
     GetPaginatedTasksParams,
     GetTaskParams,
     TaskErrorCode,
-    UpdateTaskParams,
-    AddCommentParams,
     UpdateCommentParams,
-    DeleteCommentParams,
+    UpdateTaskParams,
 )
 from tests.modules.task.base_test_task import BaseTestTask
 
@@ -222,14 +222,15 @@ class TestTaskService(BaseTestTask):
         task = self.create_test_task(account_id=self.account.id)
         fake_comment_id = "507f1f77bcf86cd799439011"
 
-        with self.assertRaises(TaskNotFoundError) as context:
+        with self.assertRaises(TaskCommentNotFoundError) as context:
             TaskService.update_comment(
                 params=UpdateCommentParams(
                     account_id=self.account.id, task_id=task.id, comment_id=fake_comment_id, content="updated"
                 )
             )
 
-        assert context.exception.code == TaskErrorCode.NOT_FOUND
+        assert context.exception.code == TaskErrorCode.COMMENT_NOT_FOUND
+        assert context.exception.message == (f"Comment with id {fake_comment_id} not found on task with id {task.id}.")
 
     def test_delete_comment_success(self) -> None:
         task = self.create_test_task(account_id=self.account.id)
@@ -238,12 +239,10 @@ class TestTaskService(BaseTestTask):
         )
 
         TaskService.delete_comment(
-            params=DeleteCommentParams(
-                account_id=self.account.id, task_id=task.id, comment_id=created_comment.id
-            )
+            params=DeleteCommentParams(account_id=self.account.id, task_id=task.id, comment_id=created_comment.id)
         )
 
-        with self.assertRaises(TaskNotFoundError):
+        with self.assertRaises(TaskCommentNotFoundError):
             TaskService.update_comment(
                 params=UpdateCommentParams(
                     account_id=self.account.id, task_id=task.id, comment_id=created_comment.id, content="x"
@@ -254,14 +253,13 @@ class TestTaskService(BaseTestTask):
         task = self.create_test_task(account_id=self.account.id)
         fake_comment_id = "507f1f77bcf86cd799439011"
 
-        with self.assertRaises(TaskNotFoundError) as context:
+        with self.assertRaises(TaskCommentNotFoundError) as context:
             TaskService.delete_comment(
-                params=DeleteCommentParams(
-                    account_id=self.account.id, task_id=task.id, comment_id=fake_comment_id
-                )
+                params=DeleteCommentParams(account_id=self.account.id, task_id=task.id, comment_id=fake_comment_id)
             )
 
-        assert context.exception.code == TaskErrorCode.NOT_FOUND
+        assert context.exception.code == TaskErrorCode.COMMENT_NOT_FOUND
+        assert context.exception.message == (f"Comment with id {fake_comment_id} not found on task with id {task.id}.")
 
     def test_add_update_delete_comment_persists(self) -> None:
         task = self.create_test_task(account_id=self.account.id)